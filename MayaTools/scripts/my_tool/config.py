@@ -1,32 +1,83 @@
 # my_tool/config.py
-from .core.checks import scene_checks, naming_checks, geometry_checks
+# 这个文件不 import 任何依赖 Maya 的模块：批量导出的父进程 (普通 Python) 也要读它
 
 # --- 全局常量配置 ---
 TARGET_FPS = "film"  # 可以在这里统一修改 FPS 标准
 
+# --- 批量导出 (Headless mayapy Workers) ---
+MAYAPY_PATH = ""  # 为空时自动在 Maya 安装目录 / PATH 里找 mayapy
+EXPORT_WORKERS = 4  # 同时运行的 mayapy 进程数
+EXPORT_TIMEOUT = 600  # 单个文件的超时时间 (秒)
+EXPORT_RETRIES = 1  # 失败或超时后的重试次数
+
+# --- 项目版本目录 (core/version_catalog.py) ---
+PROJECT_ROOT = ""  # Pipeline 页 "整个项目" 模式默认爬的根目录 (比如 Z:/Project/Shots)
+VERSION_CATALOG = ""  # SQLite 目录文件，为空时存到 ~/.my_tool/version_catalog.db (放本机，别放网络盘)
+
+# --- 导出文件命名 (core/name_template.py) ---
+# 为空 = 和源文件同名。token：{name} 源文件名、{mode} 导出模式 (Model / Animation)，以及下面正则的命名分组
+# 例：EXPORT_NAME_PATTERN = r"(?P<asset>\w+?)_v\d+$"，EXPORT_NAME_TEMPLATE = "{asset}_{mode}"
+#     hero_run_v003.ma -> hero_run_Animation.fbx (匹配不上正则的文件仍用原名)
+EXPORT_NAME_TEMPLATE = ""
+EXPORT_NAME_PATTERN = ""
+
+# --- 控制器 ---
+# 镜像批量建控制器时每一侧的颜色 (Maya 颜色索引，和 Rig 页的预设按钮一样：红 13 / 蓝 6 / 黄 17)
+# 没有左右标记的 (中间的骨骼) 用界面上选的颜色
+SIDE_COLORS = {
+    "L": 6,   # 蓝
+    "R": 13,  # 红
+}
+# 用户形状库 (Rig 页 Capture 的形状存这里)，为空时存到 ~/.my_tool/controller_shapes.json
+# 内置形状在 my_tool/data/controller_shapes.json，同名的以用户库为准
+CONTROLLER_SHAPE_LIBRARY = ""
+
+# --- 检查项后端 ---
+# 检查项类名 -> "cmds" / "api"。api 用 OpenMaya 2.0 批量取数据，大场景快很多
+# 没写的检查项用类里默认的 cmds
+CHECK_BACKENDS = {
+    "HistoryCheck": "api",
+    "UnFrozenTransformCheck": "api",
+    "NgonsCheck": "api",
+}
+
+# --- 检查执行 ---
+CHECK_WORKERS = 4  # 并行跑 data-only 检查项 (scene_bound = False) 的线程数，0 = 全部在主线程跑
+CHECK_PROFILE_HISTORY = ""  # 检查耗时历史 (JSON Lines)，为空时存到 ~/.my_tool/check_profile_history.jsonl
+
+# --- Freeze Transform 容差 ---
+# 可以按组 (translate / rotate / scale) 写，也可以单独写某个通道 (比如 "sy": 0.01)
+# 旋转的单位跟 Maya 的角度单位设置走 (默认是度)
+FREEZE_TOLERANCE = {
+    "translate": 0.001,
+    "rotate": 0.001,
+    "scale": 0.001,
+}
+
 # --- 检查项清单 (Menu) ---
 # 这里定义了不同模式下，具体要运行哪些检查
-# 直接存 Class 对象，而不是字符串，这样跳转方便，不易出错
+# 写 "模块.类名" (相对 my_tool/core/checks)，用的时候由 core/checks/registry.py 再 import。
+# 检查项模块都依赖 maya.cmds，存 Class 对象的话读个配置就得有 Maya，批量导出的父进程就跑不了
 
 CHECK_LIST = {
     "Model": [
-        scene_checks.FPSCheck,
-        scene_checks.UnknownNodeCheck,
-        naming_checks.DuplicateNameCheck,
-        geometry_checks.HistoryCheck,
-        geometry_checks.UnFrozenTransformCheck,
-        geometry_checks.NgonsCheck,
+        "scene_checks.FPSCheck",
+        "scene_checks.UnknownNodeCheck",
+        "naming_checks.DuplicateNameCheck",
+        "geometry_checks.HistoryCheck",
+        "geometry_checks.UnFrozenTransformCheck",
+        "geometry_checks.NgonsCheck",
     ],
 
     "Rig": [
-        scene_checks.FPSCheck,
-        scene_checks.UnknownNodeCheck,
-        naming_checks.DuplicateNameCheck,
-        # rig_checks.UnfrozenCtrlCheck,
+        "scene_checks.FPSCheck",
+        "scene_checks.UnknownNodeCheck",
+        "naming_checks.DuplicateNameCheck",
+        # "rig_checks.UnfrozenCtrlCheck",
     ],
 
     "Animation": [
-        scene_checks.FPSCheck,
-        scene_checks.AnimationRangeCheck
+        "scene_checks.FPSCheck",
+        "scene_checks.AnimationRangeCheck",
     ]
 }
\ No newline at end of file
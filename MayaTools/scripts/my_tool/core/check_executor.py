@@ -0,0 +1,72 @@
+# my_tool/core/check_executor.py
+"""
+检查项执行器。
+scene_bound 的检查项 (要直接查场景的) 还是在主线程按顺序跑；
+data-only 的检查项只读快照，在主线程把它们要的字段预取好之后丢进线程池，
+和主线程上的检查同时进行。每个检查项的统计记在 item.profile 上 (见 check_profiler)。
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from .checks.scene_snapshot import SceneSnapshot
+from . import check_profiler
+
+DEFAULT_WORKERS = 4
+
+
+def timed_check(item, snapshot):
+    """跑一个检查项并记录耗时 / 命令调用数 (item.profile["check"])"""
+    check_profiler.run_check(item, snapshot)
+
+
+class CheckExecutor:
+    """
+    用法：
+        executor = CheckExecutor()
+        snapshot = executor.run(checks)
+    run() 返回时所有检查项都已经跑完。
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.workers = workers
+
+    def run(self, checks, snapshot=None):
+        if snapshot is None:
+            snapshot = SceneSnapshot()
+
+        data_checks = [item for item in checks if not item.scene_bound]
+        scene_checks = [item for item in checks if item.scene_bound]
+
+        # 1. 线程池里不能调用 cmds：先在主线程把 data-only 检查要的字段查好
+        futures = []
+        pool = None
+        if data_checks and self.workers > 0:
+            for item in data_checks:
+                snapshot.prefetch(item.snapshot_fields)
+            frozen = snapshot.frozen_copy()
+
+            pool = ThreadPoolExecutor(max_workers=min(self.workers, len(data_checks)))
+            futures = [(item, pool.submit(timed_check, item, frozen)) for item in data_checks]
+        else:
+            # 不开线程池：和 scene_bound 一样在主线程跑
+            scene_checks = list(checks)
+
+        try:
+            # 2. 主线程同时跑 scene_bound 的检查
+            for item in scene_checks:
+                timed_check(item, snapshot)
+
+            # 3. 等后台的检查结束
+            for item, future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    item.status = "Failed"
+                    item.info_message = f"Check crashed: {e}"
+                    print(f"Error running {item.label}: {e}")
+                # 之后的 fix / 复查都用真正的快照
+                item.snapshot = snapshot
+        finally:
+            if pool:
+                pool.shutdown(wait=True)
+
+        return snapshot
@@ -0,0 +1,191 @@
+# my_tool/core/check_profiler.py
+"""
+检查项性能统计：每次 check() / fix() 记录
+    - 耗时 (秒)
+    - Maya 命令调用次数 (cmds.xxx)
+    - 扫描的物体数 (检查项自己填 objects_scanned)
+结果挂在 item.profile 上，UI 和报告直接读；每次运行还会追加一条到历史文件，
+方便看出哪个检查项随着场景变大越来越慢。
+
+命令计数的做法：把检查项所在模块的全局变量 cmds 换成一个计数代理。
+代理是常驻的，只在当前线程 "正在被统计" 时才计数，所以并行的检查项互不干扰。
+"""
+import io
+import os
+import sys
+import json
+import time
+import threading
+
+import maya.cmds as _real_cmds
+
+_state = threading.local()
+
+# 历史文件最多保留多少次运行，超过就从最旧的开始丢
+DEFAULT_HISTORY_LIMIT = 500
+
+
+class CountingCmds:
+    """maya.cmds 的计数代理"""
+
+    def __init__(self, real):
+        self._real = real
+        self._wrappers = {}
+
+    def __getattr__(self, name):
+        wrapper = self._wrappers.get(name)
+        if wrapper is None:
+            func = getattr(self._real, name)
+            if not callable(func):
+                return func
+
+            def wrapper(*args, **kwargs):
+                counter = getattr(_state, "counter", None)
+                if counter is not None:
+                    counter[0] += 1
+                return func(*args, **kwargs)
+
+            self._wrappers[name] = wrapper
+        return wrapper
+
+
+def install(module):
+    """把模块里的 cmds 换成计数代理 (重复调用没关系)"""
+    current = getattr(module, "cmds", None)
+    if current is None or isinstance(current, CountingCmds):
+        return
+    module.cmds = CountingCmds(current)
+
+
+def _install_for(item):
+    install(sys.modules[type(item).__module__])
+    # 快照的懒加载查询算在第一个用到它的检查项头上
+    from .checks import scene_snapshot
+    install(scene_snapshot)
+
+
+def profiled(item, phase, func, *args):
+    """
+    跑 func(*args) 并把统计写进 item.profile[phase] ("check" / "fix")。
+    """
+    _install_for(item)
+
+    counter = [0]
+    previous = getattr(_state, "counter", None)
+    _state.counter = counter
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        _state.counter = previous
+        if previous is not None:
+            # 嵌套调用 (fix 里面的 _recheck)：外层也要算上
+            previous[0] += counter[0]
+
+        item.profile[phase] = {
+            "time": elapsed,
+            "cmds_calls": counter[0],
+            "objects": item.objects_scanned,
+        }
+        if phase == "check":
+            item.elapsed = elapsed
+
+
+def run_check(item, snapshot=None):
+    profiled(item, "check", item.check, snapshot)
+
+
+def run_fix(item):
+    profiled(item, "fix", item.fix)
+
+
+def format_profile(profile):
+    """UI 列里显示的短文本：12.3 ms | 45 calls | 1200 objs"""
+    if not profile:
+        return ""
+    return f"{profile['time'] * 1000:.1f} ms | {profile['cmds_calls']} calls | {profile['objects']} objs"
+
+
+# ----------------------------------------------------------------
+# 历史记录 (JSON Lines，一行一次运行)
+# ----------------------------------------------------------------
+def get_history_path():
+    from .. import config
+    if config.CHECK_PROFILE_HISTORY:
+        return config.CHECK_PROFILE_HISTORY
+    return os.path.join(os.path.expanduser("~"), ".my_tool", "check_profile_history.jsonl")
+
+
+def record_run(mode, checks, path=None, limit=DEFAULT_HISTORY_LIMIT):
+    """把这次运行的统计追加到历史文件，超过 limit 条就裁掉最旧的"""
+    path = path or get_history_path()
+    entry = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "scene": _real_cmds.file(query=True, sceneName=True) or "untitled",
+        "mode": mode,
+        "checks": {item.label: item.profile for item in checks if item.profile},
+    }
+
+    try:
+        folder = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+
+        with io.open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        # 超过上限的时候才重写文件，平时只追加
+        lines = _read_lines(path)
+        if len(lines) > limit:
+            tmp_path = f"{path}.tmp"
+            with io.open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(lines[-limit:])
+            os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error saving check profile history: {e}")
+    return entry
+
+
+def _read_lines(path):
+    with io.open(path, "r", encoding="utf-8") as f:
+        return [line for line in f if line.strip()]
+
+
+def load_history(path=None):
+    path = path or get_history_path()
+    if not os.path.exists(path):
+        return []
+    history = []
+    for line in _read_lines(path):
+        try:
+            history.append(json.loads(line))
+        except ValueError:
+            continue  # 写到一半的行直接跳过
+    return history
+
+
+def find_regressions(history, mode, factor=1.5, window=20, min_time=0.05):
+    """
+    对比该模式最近一次运行和之前 window 次的中位数，
+    返回 [(检查项, 本次耗时, 以往中位数)]，只包含慢了 factor 倍以上的。
+    本次耗时不到 min_time 秒的忽略 (毫秒级的抖动没意义)。
+    """
+    runs = [run for run in history if run.get("mode") == mode]
+    if len(runs) < 2:
+        return []
+    latest, previous = runs[-1], runs[-1 - window:-1]
+
+    regressions = []
+    for label, profile in latest["checks"].items():
+        check_profile = profile.get("check")
+        if not check_profile or check_profile["time"] < min_time:
+            continue
+        times = sorted(run["checks"][label]["check"]["time"] for run in previous
+                       if "check" in run["checks"].get(label, {}))
+        if not times:
+            continue
+        median = times[len(times) // 2]
+        if median > 0 and check_profile["time"] > median * factor:
+            regressions.append((label, check_profile["time"], median))
+    return regressions
@@ -1,4 +1,6 @@
-from .checks import scene_checks
+from .checks import scene_checks, registry
+from .checks.scene_snapshot import SceneSnapshot
+from .check_executor import CheckExecutor
 from .. import config
 
 def get_checks(mode = "Model"):
@@ -7,7 +9,8 @@ def get_checks(mode = "Model"):
         """
     # 1. 从配置中获取对应的类列表
     # 如果模式不存在，默认返回空列表，或者 fallback 到 Model
-    check_classes = config.CHECK_LIST.get(mode, [])
+    # config 里存的是 "模块.类名"，这里才 import 成类
+    check_classes = [registry.resolve_check(name) for name in config.CHECK_LIST.get(mode, [])]
 
     instances = []
 
@@ -15,6 +18,23 @@ def get_checks(mode = "Model"):
     for cls in check_classes:
         # 这里发生了魔法：cls 是一个类 (FPSCheck)，cls() 创建了对象
         instance = cls()
+        backend = config.CHECK_BACKENDS.get(cls.__name__)
+        if backend:
+            instance.set_backend(backend)
         instances.append(instance)
 
-    return instances
\ No newline at end of file
+    return instances
+
+
+def create_snapshot():
+    """一次检查批次共用的场景快照"""
+    return SceneSnapshot()
+
+
+def run_checks(checks, snapshot=None):
+    """
+    用同一个快照跑完所有检查项 (场景只查一遍)。
+    不碰场景的检查项 (scene_bound = False) 会放到线程池里并行跑。
+    返回用到的快照，调用方 fix 之后可以继续复用。
+    """
+    return CheckExecutor(config.CHECK_WORKERS).run(checks, snapshot)
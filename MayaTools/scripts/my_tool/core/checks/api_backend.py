@@ -0,0 +1,228 @@
+# my_tool/core/checks/api_backend.py
+"""
+检查项的 OpenMaya (API 2.0) 后端。
+cmds 每次调用都要走一遍 MEL 命令层 (解析参数、查名字、拼返回值)，
+几千个物体 x 每个物体几次查询就很慢了。这里直接用 API 的迭代器和函数集，
+一次把需要的数据全部拿出来，返回值格式和 cmds 版本保持一致。
+
+只在检查项选择 backend = "api" 时才会被 import。
+"""
+from array import array
+
+import maya.api.OpenMaya as om
+
+# numpy 可选 (和 transform_analysis 一样)：有就向量化统计，没有退回逐个数
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def get_dag_paths(paths):
+    """长路径列表 -> [(path, MDagPath)]，已经不存在的路径直接跳过"""
+    result = []
+    for path in paths:
+        sel = om.MSelectionList()
+        try:
+            sel.add(path)
+        except RuntimeError:
+            continue
+        result.append((path, sel.getDagPath(0)))
+    return result
+
+
+def _mesh_shapes(dag_path):
+    """transform 下面的 mesh shape (不含 intermediate object)"""
+    shapes = []
+    for i in range(dag_path.numberOfShapesDirectlyBelow()):
+        shape = om.MDagPath(dag_path)
+        shape.extendToShape(i)
+        if not shape.hasFn(om.MFn.kMesh):
+            continue
+        if om.MFnDagNode(shape).isIntermediateObject:
+            continue
+        shapes.append(shape)
+    return shapes
+
+
+# ----------------------------------------------------------------
+# 1. HistoryCheck
+# ----------------------------------------------------------------
+def find_bad_history(paths, whitelist):
+    """
+    对应 cmds.listHistory(obj, pruneDagObjects=True) + objectType。
+    从 mesh 的 inMesh 往上游走 (MItDependencyGraph)，遇到 DAG 节点就剪枝。
+    返回 {path: (node_name, node_type)}，只包含有 "垃圾历史" 的物体 (记录第一个找到的节点)。
+    """
+    whitelist = set(whitelist)
+    bad = {}
+
+    for path, dag_path in get_dag_paths(paths):
+        for shape in _mesh_shapes(dag_path):
+            in_mesh = om.MFnDependencyNode(shape.node()).findPlug("inMesh", False)
+            if not in_mesh.isDestination:
+                continue
+
+            # 从 inMesh 的上游节点开始 (shape 自己是 DAG 节点，不能当起点，否则第一步就被剪掉了)
+            it = om.MItDependencyGraph(in_mesh.source().node(), om.MFn.kInvalid,
+                                       om.MItDependencyGraph.kUpstream, om.MItDependencyGraph.kDepthFirst,
+                                       om.MItDependencyGraph.kNodeLevel)
+            while not it.isDone():
+                node = it.currentNode()
+                if node.hasFn(om.MFn.kDagNode):
+                    # pruneDagObjects：不往 DAG 节点后面走
+                    it.prune()
+                    it.next()
+                    continue
+
+                fn = om.MFnDependencyNode(node)
+                if fn.typeName not in whitelist:
+                    bad[path] = (fn.name(), fn.typeName)
+                    break
+                it.next()
+
+            if path in bad:
+                break
+    return bad
+
+
+# ----------------------------------------------------------------
+# 2. UnFrozenTransformCheck
+# ----------------------------------------------------------------
+def get_transform_values(paths):
+    """
+    对应 cmds.xform(q=True, t/ro/s=True, objectSpace=True)。
+    返回 [(path, translate, rotate, scale)]，位移和旋转换算成 UI 单位 (和 cmds 返回值一致)。
+    """
+    angle_unit = om.MAngle.uiUnit()
+    linear_unit = om.MDistance.uiUnit()
+
+    def to_ui_angle(radians):
+        return om.MAngle(radians).asUnits(angle_unit)
+
+    def to_ui_linear(value):
+        return om.MDistance(value).asUnits(linear_unit)
+
+    result = []
+    for path, dag_path in get_dag_paths(paths):
+        if not dag_path.hasFn(om.MFn.kTransform):
+            continue
+        fn = om.MFnTransform(dag_path)
+        t = fn.translation(om.MSpace.kTransform)
+        r = fn.rotation(om.MSpace.kTransform, asQuaternion=False)
+        s = fn.scale()
+        result.append((path,
+                       (to_ui_linear(t.x), to_ui_linear(t.y), to_ui_linear(t.z)),
+                       (to_ui_angle(r.x), to_ui_angle(r.y), to_ui_angle(r.z)),
+                       tuple(s)))
+    return result
+
+
+# ----------------------------------------------------------------
+# 3. NgonsCheck (面拓扑统计)
+# ----------------------------------------------------------------
+def analyze_face_topology(paths):
+    """
+    直接读 MFnMesh.getVertices() 的每面顶点数 (一个扁平数组)，不碰选择、不切组件模式。
+    返回每个 mesh 一条结果：
+        {"mesh": 组件前缀 (transform 或 shape 长路径), "faces": 总面数,
+         "tris": n, "quads": n, "ngons": n, "ngon_faces": [面索引]}
+    """
+    results = []
+    for path, dag_path in get_dag_paths(paths):
+        shapes = _mesh_shapes(dag_path)
+        for shape in shapes:
+            counts, _ = om.MFnMesh(shape).getVertices()
+            tris, quads, ngon_faces = _count_face_sides(counts)
+
+            results.append({
+                # 只有一个 shape 时用 transform 路径，和 cmds.ls(selection=True) 的结果一致
+                "mesh": path if len(shapes) == 1 else shape.fullPathName(),
+                "faces": len(counts),
+                "tris": tris,
+                "quads": quads,
+                "ngons": len(ngon_faces),
+                "ngon_faces": ngon_faces,
+            })
+    return results
+
+
+def _count_face_sides(counts):
+    """每面顶点数 -> (三角面数, 四边面数, N-gon 面索引 array("i"))"""
+    if np is not None:
+        sides = np.fromiter(counts, dtype=np.int32, count=len(counts))
+        is_tri = sides == 3
+        is_quad = sides == 4
+        ngon_indices = np.flatnonzero(~(is_tri | is_quad)).astype(np.int32)
+        ngon_faces = array("i")
+        ngon_faces.frombytes(ngon_indices.tobytes())
+        return int(is_tri.sum()), int(is_quad.sum()), ngon_faces
+
+    tris = quads = 0
+    ngon_faces = array("i")
+    for index, sides in enumerate(counts):
+        if sides == 3:
+            tris += 1
+        elif sides == 4:
+            quads += 1
+        else:
+            ngon_faces.append(index)
+    return tris, quads, ngon_faces
+
+
+# ----------------------------------------------------------------
+# 4. 选择失败结果
+# ----------------------------------------------------------------
+_COMPONENT_TYPES = {
+    "f": om.MFn.kMeshPolygonComponent,
+    "e": om.MFn.kMeshEdgeComponent,
+    "vtx": om.MFn.kMeshVertComponent,
+    "map": om.MFn.kMeshMapComponent,
+}
+
+
+def _add_to_selection(sel, item):
+    """把一条 failed_objects 加进 MSelectionList，节点不存在时抛 RuntimeError"""
+    from .failures import ComponentFailure
+
+    if not isinstance(item, ComponentFailure):
+        # 节点路径或 cmds 风格的组件字符串 ("pCube1.f[3:5]")
+        sel.add(item)
+        return
+
+    # ComponentFailure 整个 mesh 只加一次 (下标数组一次性 addElements)，不按面拼字符串
+    node_sel = om.MSelectionList()
+    node_sel.add(item.node)
+    fn_comp = om.MFnSingleIndexedComponent()
+    components = fn_comp.create(_COMPONENT_TYPES[item.component])
+    fn_comp.addElements(list(item.indices))
+    sel.add((node_sel.getDagPath(0), components))
+
+
+def resolve_items(items):
+    """
+    批量校验 failed_objects (节点路径 / 组件字符串 / ComponentFailure)：
+    一次 MSelectionList 遍历，不走 cmds.objExists 逐个查询。
+    返回 (valid, stale, MSelectionList)：
+        valid: 还存在的条目 (原样返回，保持顺序)
+        stale: 已经被删除或改名、找不到的条目
+        MSelectionList: valid 对应的选择列表，可以直接拿去选中
+    """
+    sel = om.MSelectionList()
+    valid = []
+    stale = []
+    for item in items:
+        try:
+            _add_to_selection(sel, item)
+        except RuntimeError:
+            stale.append(item)
+            continue
+        valid.append(item)
+    return valid, stale, sel
+
+
+def select_items(items):
+    """选中 failed_objects 里还存在的东西，返回 (valid, stale)"""
+    valid, stale, sel = resolve_items(items)
+    om.MGlobal.setActiveSelectionList(sel)
+    return valid, stale
@@ -1,18 +1,47 @@
+from .scene_snapshot import SceneSnapshot
+from .failures import ComponentFailure, count_failures, failure_node
+
+
 class CheckItem:
     label = "Unknown Check"
     category = "General"
     is_fixable = False
     is_critical = True
 
+    # True: 检查时要直接查询/修改场景，只能在主线程跑
+    # False: 只读 SceneSnapshot 里预取好的数据 (字段列在 snapshot_fields)，可以丢到线程池
+    scene_bound = True
+    snapshot_fields = ()
+
+    # Live 模式 (见 core/live_checker.py)：哪些场景事件会影响这个检查项，None = 任何事件
+    # incremental = True 的检查项只复查受影响的节点 (需要实现 _targets / _evaluate / _set_result)
+    live_events = None
+    incremental = False
+
+    # 检查的实现方式：cmds (默认) / api (OpenMaya 2.0，见 api_backend.py)
+    # 子类在 backends 里声明自己支持哪些，config.CHECK_BACKENDS 可以按检查项切换
+    backends = ("cmds",)
+    backend = "cmds"
+
+    # failed_objects 里是不是场景里的节点 (长路径 / ComponentFailure)
+    # 场景设置类的检查项 (FPS、时间轴) 放的是 "Time Settings Node" 这种说明文字，
+    # 设成 False：选中、查 stale 的时候跳过，不会被当成 "已经被删掉的物体"
+    failures_are_nodes = True
+
     def __init__(self):
         self.status = "Idle" # Idle, Passed, Failed, Warning
         self.failed_objects = [] # 具体的错误物体列表 (存全路径)
         self.info_message = "" # 检查结果的文字描述 (UI 显示用)
+        self.snapshot = None # 最近一次 check 用的场景快照 (SceneSnapshot)
+        self.elapsed = 0.0 # 最近一次 check 的耗时 (秒)，由 CheckExecutor 记录
+        self.objects_scanned = 0 # 这次检查扫描了多少个物体 (子类在 check 里填)
+        self.profile = {} # {"check": {...}, "fix": {...}}，见 check_profiler
 
-    def check(self):
+    def check(self, snapshot=None):
         """
         核心检查逻辑。
         子类必须重写此方法。
+        snapshot: 共享的 SceneSnapshot，没传就自己建一个。
         逻辑：
         1. 执行检查
         2. 更新 self.status
@@ -25,9 +54,86 @@ class CheckItem:
         """
         一键修复逻辑。
         只有 is_fixable = True 时才会被调用。
+        修复完调用 self._recheck()。
         """
         print(f"No fix implementation for {self.label}")
 
+    def supports_incremental(self):
+        return self.incremental
+
+    def recheck(self, nodes, snapshot=None):
+        """
+        Live 模式的复查：nodes 是场景里变过的节点 (长路径集合，包括改名前的旧路径)。
+        支持增量的检查项只重新检查 nodes 里的目标，其余的结果原样保留；
+        不支持的直接完整 check 一遍。
+        """
+        if not self.supports_incremental():
+            self.check(snapshot)
+            return
+
+        snapshot = self._use_snapshot(snapshot)
+        targets = [obj for obj in self._targets(snapshot) if obj in nodes]
+        # 变过的节点 (包括已经删掉/改名的) 先从旧结果里拿掉，再把重查的结果补回去
+        kept = [item for item in self.failed_objects if failure_node(item) not in nodes]
+        self.objects_scanned = len(targets)
+        self._set_result(kept + self._evaluate(targets))
+
+    def get_report_data(self):
+        """导出报告 (JSON) 里这个检查项的内容，子类可以追加自己的结构化结果"""
+        data = {
+            "status": self.status,
+            "message": self.info_message,
+            "failed_count": count_failures(self.failed_objects),
+            "profile": self.profile
+        }
+        # 组件级的失败 (N-gon 之类) 按区间写进报告，不展开成每个面一条
+        components = [item.to_dict() for item in self.failed_objects if isinstance(item, ComponentFailure)]
+        if components:
+            data["component_failures"] = components
+        return data
+
+    def get_object_detail(self, obj):
+        """失败物体的补充说明 (UI 里显示在物体后面)，默认只有组件级失败才有"""
+        if isinstance(obj, ComponentFailure):
+            return obj.preview()
+        return ""
+
+    def set_backend(self, backend):
+        if backend not in self.backends:
+            raise ValueError(f"{self.__class__.__name__} does not support backend '{backend}' "
+                             f"(available: {', '.join(self.backends)})")
+        self.backend = backend
+
+    def _fix_targets(self):
+        """
+        fix() 开头调用：failed_objects 里还存在的条目。
+        检查之后被删掉/改名的物体 (stale) 只打印出来，不再拿去修。
+        """
+        if not self.failed_objects:
+            return []
+        if not self.failures_are_nodes:
+            return list(self.failed_objects)
+        from .api_backend import resolve_items
+        valid, stale, _ = resolve_items(self.failed_objects)
+        if stale:
+            print(f"{self.label}: skipping {len(stale)} objects that no longer exist "
+                  f"(e.g. {stale[0]})")
+        return valid
+
+    def _use_snapshot(self, snapshot):
+        """check() 开头调用：记住这次用的快照"""
+        if snapshot is None:
+            snapshot = SceneSnapshot()
+        self.snapshot = snapshot
+        self.objects_scanned = 0
+        return snapshot
+
+    def _recheck(self):
+        """fix() 结尾调用：场景已经被改了，快照作废 (其它共用它的检查项也会看到) 后重新检查"""
+        if self.snapshot is not None:
+            self.snapshot.invalidate()
+        self.check(self.snapshot)
+
     def reset(self):
         """重置状态"""
         self.status = "Idle"
@@ -0,0 +1,123 @@
+# my_tool/core/checks/check_benchmark.py
+"""
+检查项后端跑分：同一个生成场景上分别用 cmds / api 后端跑支持多后端的检查项，
+对比耗时，并确认两边的 failed_objects 完全一致。
+
+命令行 (会新建场景，别在有未保存内容的 Maya 里跑)：
+    mayapy -m my_tool.core.checks.check_benchmark --counts 100 1000 5000
+
+Maya Script Editor 里：
+    from my_tool.core.checks import check_benchmark
+    check_benchmark.run_benchmark([100, 1000])
+"""
+import sys
+import time
+import random
+import argparse
+
+import maya.cmds as cmds
+
+from .scene_snapshot import SceneSnapshot
+from .geometry_checks import HistoryCheck, UnFrozenTransformCheck
+
+BENCHMARK_CHECKS = [HistoryCheck, UnFrozenTransformCheck]
+
+
+def build_scene(count, seed=0):
+    """
+    新建场景，生成 count 个立方体：
+    大约 1/3 有位移/旋转/缩放，1/3 有建模历史 (polyBevel)，其余是干净的。
+    每 50 个放进一个组，模拟真实场景的层级。
+    """
+    rng = random.Random(seed)
+    cmds.file(new=True, force=True)
+
+    group = None
+    for i in range(count):
+        if i % 50 == 0:
+            group = cmds.group(empty=True, name=f"bench_grp_{i // 50}")
+
+        cube = cmds.polyCube(name=f"bench_cube_{i}", constructionHistory=True)[0]
+        roll = rng.random()
+        if roll < 0.33:
+            cmds.xform(cube, translation=(rng.uniform(-10, 10), 0, 0), rotation=(0, rng.uniform(1, 90), 0),
+                       scale=(1, rng.uniform(1.1, 2.0), 1))
+            cmds.delete(cube, constructionHistory=True)
+        elif roll < 0.66:
+            cmds.polyBevel(f"{cube}.e[0]")
+        else:
+            cmds.delete(cube, constructionHistory=True)
+        cmds.parent(cube, group)
+
+    cmds.select(clear=True)
+
+
+def time_check(check_cls, backend, repeat=3):
+    """跑 repeat 次取最快的一次 (秒)，返回 (耗时, 最后一次的 failed_objects)"""
+    best = None
+    failed = []
+    for _ in range(repeat):
+        item = check_cls()
+        item.set_backend(backend)
+
+        # 场景快照两边是一样的开销，先建好，只量检查项自己的逐物体查询
+        snapshot = SceneSnapshot()
+        snapshot.mesh_transforms
+
+        start = time.perf_counter()
+        item.check(snapshot)
+        elapsed = time.perf_counter() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+        failed = list(item.failed_objects)
+    return best, failed
+
+
+def run_benchmark(counts, repeat=3, seed=0):
+    """返回 [{"check", "count", "cmds", "api", "speedup", "match"}]，同时打印表格"""
+    results = []
+    for count in counts:
+        build_scene(count, seed)
+
+        for check_cls in BENCHMARK_CHECKS:
+            cmds_time, cmds_failed = time_check(check_cls, "cmds", repeat)
+            api_time, api_failed = time_check(check_cls, "api", repeat)
+            results.append({
+                "check": check_cls.__name__,
+                "count": count,
+                "cmds": cmds_time,
+                "api": api_time,
+                "speedup": cmds_time / api_time if api_time else 0.0,
+                "match": sorted(cmds_failed) == sorted(api_failed),
+                "failed": len(cmds_failed),
+            })
+
+    print(f"{'Check':<26}{'Objects':>9}{'Failed':>8}{'cmds (s)':>11}{'api (s)':>11}{'Speedup':>9}  Match")
+    for row in results:
+        print(f"{row['check']:<26}{row['count']:>9}{row['failed']:>8}{row['cmds']:>11.3f}{row['api']:>11.3f}"
+              f"{row['speedup']:>8.1f}x  {'OK' if row['match'] else 'MISMATCH'}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark cmds vs OpenMaya check backends")
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    try:
+        results = run_benchmark(args.counts, args.repeat, args.seed)
+    finally:
+        try:
+            maya.standalone.uninitialize()
+        except Exception:
+            pass
+
+    return 0 if all(row["match"] for row in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
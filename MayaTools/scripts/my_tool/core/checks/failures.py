@@ -0,0 +1,104 @@
+# my_tool/core/checks/failures.py
+"""
+组件级的失败记录。
+以前 N-gon 之类的检查每个面存一个字符串 ("pCube1.f[12]")，面一多内存和选择都很慢。
+ComponentFailure 一个 mesh 只存一条：节点路径 + 一个紧凑的整数数组 (array)，
+需要字符串的时候再按连续区间拼 ("pCube1.f[10:25]")。
+
+failed_objects 里可以混着放普通的节点路径 (str) 和 ComponentFailure。
+"""
+from array import array
+from itertools import islice
+
+# 组件类型 -> UI 里显示的名字
+COMPONENT_NAMES = {
+    "f": "faces",
+    "e": "edges",
+    "vtx": "vertices",
+    "map": "UVs",
+}
+
+
+def iter_ranges(indices):
+    """已排序的下标 -> 连续区间 (start, end)，[1, 2, 3, 7] -> (1, 3), (7, 7)"""
+    start = prev = None
+    for i in indices:
+        if prev is not None and i == prev + 1:
+            prev = i
+            continue
+        if start is not None:
+            yield start, prev
+        start = prev = i
+    if start is not None:
+        yield start, prev
+
+
+class ComponentFailure:
+    """一个节点上失败的一组组件"""
+
+    __slots__ = ("node", "component", "indices")
+
+    def __init__(self, node, component, indices):
+        self.node = node  # 长路径 (transform 或 shape)
+        self.component = component  # "f" / "e" / "vtx" / "map"
+        self.indices = array("i", sorted(indices))
+
+    @property
+    def count(self):
+        return len(self.indices)
+
+    def ranges(self):
+        return list(iter_ranges(self.indices))
+
+    def to_strings(self):
+        """Maya 组件字符串，一个连续区间一条"""
+        return [f"{self.node}.{self.component}[{start}:{end}]" if end != start
+                else f"{self.node}.{self.component}[{start}]"
+                for start, end in iter_ranges(self.indices)]
+
+    def preview(self, limit=5):
+        """UI 用的简短说明：f[1:3], f[7], ... (只列前 limit 个区间)"""
+        ranges = list(islice(iter_ranges(self.indices), limit + 1))
+        parts = [f"{self.component}[{start}:{end}]" if end != start else f"{self.component}[{start}]"
+                 for start, end in ranges[:limit]]
+        if len(ranges) > limit:
+            parts.append("...")
+        return ", ".join(parts)
+
+    def to_dict(self):
+        """报告用：区间写成 [start, end]，不展开每个下标"""
+        return {
+            "node": self.node,
+            "component": self.component,
+            "count": self.count,
+            "ranges": [[start, end] for start, end in iter_ranges(self.indices)],
+        }
+
+    def __str__(self):
+        return f"{self.node} ({self.count} {COMPONENT_NAMES.get(self.component, self.component)})"
+
+    def __repr__(self):
+        return f"ComponentFailure({self.node!r}, {self.component!r}, count={self.count})"
+
+
+def count_failures(items):
+    """failed_objects 的总数：节点算 1 个，ComponentFailure 算它的组件个数"""
+    return sum(item.count if isinstance(item, ComponentFailure) else 1 for item in items)
+
+
+def to_strings(items):
+    """展开成 cmds 能用的字符串列表 (节点路径原样保留)"""
+    result = []
+    for item in items:
+        if isinstance(item, ComponentFailure):
+            result.extend(item.to_strings())
+        else:
+            result.append(item)
+    return result
+
+
+def failure_node(item):
+    """失败条目属于哪个节点："|a|b.f[3]" -> "|a|b"，ComponentFailure 取 node"""
+    if isinstance(item, ComponentFailure):
+        return item.node
+    return item.split(".", 1)[0]
@@ -1,11 +1,16 @@
 import maya.cmds as cmds
 
 from .base_check import CheckItem
+from . import transform_analysis
+from .failures import ComponentFailure, count_failures
 
 class HistoryCheck(CheckItem):
     label = "Construction History"
     category = "Geometry"
     is_fixable = True
+    backends = ("cmds", "api")
+    live_events = ("node_added", "node_removed", "renamed", "connection")
+    incremental = True
 
     def __init__(self):
         super().__init__()
@@ -20,30 +25,48 @@ class HistoryCheck(CheckItem):
             'shadingEngine',  # 材质组
             'materialInfo'  # 材质信息
         ]
+        # 失败物体 -> (第一个找到的垃圾历史节点, 节点类型)
+        self.bad_history = {}
 
-    def check(self):
+    def check(self, snapshot=None):
+        snapshot = self._use_snapshot(snapshot)
+        self.bad_history = {}
+        selected = self._targets(snapshot)
+        self.objects_scanned = len(selected)
+        self._set_result(self._evaluate(selected))
+
+    def _targets(self, snapshot):
         # 1. 优先检查选中的物体
-        selected = cmds.ls(selection=True, long=True) or []
+        selected = snapshot.selection
 
         # 如果没选中东西，为了保险起见，还是检查场景所有 Mesh 的父级
         if not selected:
-            meshes = cmds.ls(type="mesh", long=True)
-            transforms = cmds.listRelatives(meshes, parent=True, fullPath=True) or []
-            selected = list(set(transforms))
+            return list(snapshot.mesh_transforms)
+        # 过滤：只保留 Transform 类型的节点，且要有 Shape (排除空组)
+        # 同时排除 骨骼 (Joints)，因为骨骼通常没有历史问题
+        # 选中的是组的话，组下面的模型都算
+        return snapshot.selected_mesh_transforms()
+
+    def _evaluate(self, objects):
+        if self.backend == "api":
+            return self._find_failed_api(objects)
+        return self._find_failed_cmds(objects)
+
+    def _set_result(self, failed):
+        # 增量复查后只留还在失败列表里的
+        self.bad_history = {obj: self.bad_history[obj] for obj in failed if obj in self.bad_history}
+        if not failed:
+            self.status = "Passed"
+            self.info_message = "No modeling history found (Skinning ignored)."
+            self.failed_objects = []
         else:
-            # 过滤：只保留 Transform 类型的节点，且要有 Shape (排除空组)
-            # 同时排除 骨骼 (Joints)，因为骨骼通常没有历史问题
-            filtered_selection = []
-            for obj in selected:
-                if cmds.objectType(obj) == 'transform':
-                    shapes = cmds.listRelatives(obj, shapes=True)
-                    if shapes and cmds.objectType(shapes[0]) == 'mesh':
-                        filtered_selection.append(obj)
-            selected = filtered_selection
+            self.status = "Failed"
+            self.info_message = f"Found {len(failed)} objects with unbaked modeling history."
+            self.failed_objects = failed
 
+    def _find_failed_cmds(self, objects):
         failed = []
-
-        for obj in selected:
+        for obj in objects:
             # 获取历史，pruneDagObjects=True 排除自身 Transform 和 Shape
             history = cmds.listHistory(obj, pruneDagObjects=True) or []
 
@@ -54,24 +77,41 @@ class HistoryCheck(CheckItem):
                 if node_type not in self.whitelist:
                     # 可以在这里 print 调试，看看到底是什么节点导致的
                     print(f"DEBUG: Found bad history '{node}' ({node_type}) on {obj}")
+                    self.bad_history[obj] = (node, node_type)
                     has_bad_history = True
                     break
 
             if has_bad_history:
                 failed.append(obj)
-
-        if not failed:
-            self.status = "Passed"
-            self.info_message = "No modeling history found (Skinning ignored)."
-            self.failed_objects = []
-        else:
-            self.status = "Failed"
-            self.info_message = f"Found {len(failed)} objects with unbaked modeling history."
-            self.failed_objects = failed
+        return failed
+
+    def _find_failed_api(self, objects):
+        if not objects:
+            return []
+        from . import api_backend
+        bad = api_backend.find_bad_history(objects, self.whitelist)
+        # 具体是哪个节点记下来给 UI / 报告用，不逐个 print (几千个物体时打印比检查本身还慢)
+        self.bad_history.update(bad)
+        # 保持和输入相同的顺序
+        return [obj for obj in objects if obj in bad]
+
+    def get_report_data(self):
+        data = super().get_report_data()
+        if self.bad_history:
+            data["bad_history"] = {obj: {"node": node, "type": node_type}
+                                   for obj, (node, node_type) in self.bad_history.items()}
+        return data
+
+    def get_object_detail(self, obj):
+        if obj not in self.bad_history:
+            return ""
+        node, node_type = self.bad_history[obj]
+        return f"{node} ({node_type})"
 
     def fix(self):
-        if self.failed_objects:
-            for obj in self.failed_objects:
+        targets = self._fix_targets()
+        if targets:
+            for obj in targets:
                 try:
                     # 【关键修改】使用 bakePartialHistory
                     # prePostDeformers=True 意思是在变形器(蒙皮)之前清理历史
@@ -82,45 +122,64 @@ class HistoryCheck(CheckItem):
                     print(f"Failed to fix {obj}: {e}")
 
         # 修复完重新检查一遍状态
-        self.check()
+        self._recheck()
 
 
 class UnFrozenTransformCheck(CheckItem):
     label = "Unfrozen Transforms"
     category = "Geometry"
     is_fixable = True
+    backends = ("cmds", "api")
+    live_events = ("node_added", "node_removed", "renamed", "attribute")
+    incremental = True
 
-    def check(self):
+    def __init__(self):
+        super().__init__()
+        from ... import config
+        self.tolerance = transform_analysis.expand_tolerance(config.FREEZE_TOLERANCE)
+        # 失败物体 -> (超标最严重的通道, 偏离值, 偏离 / 容差)，UI 按最后一项排序
+        self.deviations = {}
+
+    def check(self, snapshot=None):
+        snapshot = self._use_snapshot(snapshot)
+        self.deviations = {}
+        selected = self._targets(snapshot)
+        self.objects_scanned = len(selected)
+        self._set_result(self._evaluate(selected))
+
+    def _targets(self, snapshot):
         # 1. 优先获取选中物体
-        selected = cmds.ls(selection=True, long=True) or []
+        selected = snapshot.selection
 
         # 2. 如果没选中，回退到检查所有 Mesh
         if not selected:
-            meshes = cmds.ls(type="mesh", long=True)
-            transforms = cmds.listRelatives(meshes, parent=True, fullPath=True) or []
-            selected = list(set(transforms))
+            selected = list(snapshot.mesh_transforms)
 
-        failed = []
-        for obj in selected:
-            # 【关键保护】绝对跳过骨骼 (Joints)
-            # 骨骼必须有位移数据，不能 Freeze
-            if cmds.objectType(obj) == 'joint':
-                continue
+        # 【关键保护】绝对跳过骨骼 (Joints)
+        # 骨骼必须有位移数据，不能 Freeze
+        # 确保是 Transform 节点
+        return [obj for obj in selected if snapshot.node_type(obj) == 'transform']
 
-            # 确保是 Transform 节点
-            if cmds.objectType(obj) != 'transform':
-                continue
+    def _evaluate(self, objects):
+        if self.backend == "api" and objects:
+            from . import api_backend
+            values = api_backend.get_transform_values(objects)
+        else:
+            values = self._get_values_cmds(objects)
 
-            # Check translate(x,y,z) < 0.001 (允许极小浮点误差)
-            t = cmds.xform(obj, query=True, translation=True, objectSpace=True)
-            r = cmds.xform(obj, query=True, rotation=True, objectSpace=True)
-            s = cmds.xform(obj, query=True, scale=True, objectSpace=True)
+        # 拼成 N x 9 一次性比较 (每个通道有自己的容差，见 config.FREEZE_TOLERANCE)
+        # 只要有一个数值超标，就加入错误列表
+        paths = [obj for obj, _, _, _ in values]
+        rows = [tuple(t) + tuple(r) + tuple(s) for _, t, r, s in values]
+        unfrozen = transform_analysis.find_unfrozen(paths, rows, self.tolerance)
 
-            # 只要有一个数值超标，就加入错误列表
-            if any(abs(v) > 0.001 for v in t) or \
-                    any(abs(v) > 0.001 for v in r) or \
-                    any(abs(v - 1.0) > 0.001 for v in s):
-                failed.append(obj)
+        self.deviations.update((obj, (channel, deviation, ratio)) for obj, channel, deviation, ratio in unfrozen)
+        return [obj for obj, _, _, _ in unfrozen]
+
+    def _set_result(self, failed):
+        # 超标最严重的排最前面 (增量复查时新旧结果合并后也要重新排)
+        failed = sorted(failed, key=lambda obj: -self.deviations[obj][2] if obj in self.deviations else 0.0)
+        self.deviations = {obj: self.deviations[obj] for obj in failed if obj in self.deviations}
 
         if not failed:
             self.status = "Passed"
@@ -131,47 +190,126 @@ class UnFrozenTransformCheck(CheckItem):
             self.info_message = f"Found {len(failed)} meshes with non-zero transforms."
             self.failed_objects = failed
 
+    def get_report_data(self):
+        data = super().get_report_data()
+        if self.deviations:
+            data["max_deviation"] = {
+                obj: {"channel": channel, "deviation": deviation, "tolerance_ratio": ratio}
+                for obj, (channel, deviation, ratio) in self.deviations.items()
+            }
+        return data
+
+    def get_object_detail(self, obj):
+        if obj not in self.deviations:
+            return ""
+        channel, deviation, ratio = self.deviations[obj]
+        return f"{channel} off by {deviation:.4f} ({ratio:.1f}x tolerance)"
+
+    @staticmethod
+    def _get_values_cmds(objects):
+        values = []
+        for obj in objects:
+            t = cmds.xform(obj, query=True, translation=True, objectSpace=True)
+            r = cmds.xform(obj, query=True, rotation=True, objectSpace=True)
+            s = cmds.xform(obj, query=True, scale=True, objectSpace=True)
+            values.append((obj, t, r, s))
+        return values
+
     def fix(self):
-        if self.failed_objects:
+        targets = self._fix_targets()
+        if targets:
             # 注意：如果模型已经蒙皮，Freeze Transform 可能会报错或被锁定
             # 这是 Maya 的保护机制，这种情况下需要用户手动解绑修复
             try:
-                cmds.makeIdentity(self.failed_objects, apply=True, translate=True, rotate=True, scale=True)
-                print(f"Frozen transforms for {len(self.failed_objects)} objects.")
+                cmds.makeIdentity(targets, apply=True, translate=True, rotate=True, scale=True)
+                print(f"Frozen transforms for {len(targets)} objects.")
             except Exception as e:
                 print(f"Error fixing transforms (Mesh might be skinned?): {e}")
 
-        self.check()
+        self._recheck()
 
 
 class NgonsCheck(CheckItem):
     label = "N-gons (Faces > 4 edges)"
     category = "Geometry"
     is_fixable = False
+    backends = ("cmds", "api")
+    live_events = ("node_added", "node_removed", "renamed", "connection", "attribute")
+    incremental = True
 
-    def check(self):
-        # 优先检查选中的，没选中则检查所有
-        meshes = cmds.ls(selection=True, type="transform", long=True)
+    def __init__(self):
+        super().__init__()
+        # api 后端额外给出每个 mesh 的三角面/四边面/N-gon 统计 (analyze_face_topology 的结果)
+        self.face_stats = []
+
+    def check(self, snapshot=None):
+        snapshot = self._use_snapshot(snapshot)
+        self.face_stats = []
+        target_meshes = self._targets(snapshot)
+        self.objects_scanned = len(target_meshes)
+        self._set_result(self._evaluate(target_meshes))
+
+    def _targets(self, snapshot):
+        # 优先检查选中的 (含选中组下面的模型)，过滤掉非 Mesh 物体 (比如误选了骨骼)
+        meshes = snapshot.selected_mesh_transforms()
         if not meshes:
-            # 如果选中的不是transform或者没选中，尝试找所有mesh
-            all_meshes = cmds.ls(type="mesh", long=True)
-            if not all_meshes:
-                self.status = "Passed"
-                return
-            meshes = cmds.listRelatives(all_meshes, parent=True, fullPath=True)
-            meshes = list(set(meshes))
-
-        # 过滤掉非 Mesh 物体 (比如误选了骨骼)
-        target_meshes = []
-        for obj in meshes:
-            shapes = cmds.listRelatives(obj, shapes=True)
-            if shapes and cmds.objectType(shapes[0]) == 'mesh':
-                target_meshes.append(obj)
+            # 如果选中的不是模型或者没选中，检查所有 mesh
+            meshes = [obj for obj in snapshot.mesh_transforms if snapshot.has_mesh_shape(obj)]
+        return meshes
 
+    def _evaluate(self, target_meshes):
         if not target_meshes:
-            self.status = "Passed"
-            return
+            return []
+        if self.backend == "api":
+            return self._find_ngons_api(target_meshes)
+        return self._find_ngons_cmds(target_meshes)
 
+    def _set_result(self, ngons):
+        if not ngons:
+            self.status = "Passed"
+            self.info_message = "No N-gons found."
+            self.failed_objects = []
+        else:
+            self.status = "Failed"
+            # 每个 mesh 的三角面/四边面统计在报告里 (face_stats)
+            self.info_message = f"Found {count_failures(ngons)} faces > 4 edges on {len(ngons)} meshes."
+            self.failed_objects = ngons
+
+    def supports_incremental(self):
+        # cmds 后端返回的是短名组件字符串，没法按节点对回去
+        return self.incremental and self.backend == "api"
+
+    def get_report_data(self):
+        data = super().get_report_data()
+        if self.face_stats:
+            # 每个 mesh 的面数直方图 (不带面索引，报告里看个数就够了)
+            data["face_stats"] = [
+                {key: stats[key] for key in ("mesh", "faces", "tris", "quads", "ngons")}
+                for stats in self.face_stats
+            ]
+        return data
+
+    def _find_ngons_api(self, target_meshes):
+        """直接数每个面的顶点数，不改选择，headless 和批量导出里也能用"""
+        from . import api_backend
+        new_stats = api_backend.analyze_face_topology(target_meshes)
+
+        # 增量复查时只替换这次重新统计过的 mesh
+        evaluated = set(target_meshes)
+        self.face_stats = [stats for stats in self.face_stats
+                           if stats["mesh"] not in evaluated and stats["mesh"].rsplit("|", 1)[0] not in evaluated]
+        self.face_stats.extend(new_stats)
+
+        # 一个 mesh 一条 ComponentFailure (面下标存成整数数组)，而不是每个面一个字符串
+        ngons = []
+        for stats in new_stats:
+            if stats["ngons"]:
+                ngons.append(ComponentFailure(stats["mesh"], "f", stats["ngon_faces"]))
+        return ngons
+
+    @staticmethod
+    def _find_ngons_cmds(target_meshes):
+        """旧实现：靠 polySelectConstraint 选出 N-gon (会改动选择和选择模式)"""
         cmds.select(target_meshes)
         cmds.selectMode(component=True)
         cmds.selectType(facet=True)
@@ -186,12 +324,4 @@ class NgonsCheck(CheckItem):
         cmds.selectMode(object=True)
         # 还原选中状态 (可选)
         cmds.select(target_meshes)
-
-        if not ngons:
-            self.status = "Passed"
-            self.info_message = "No N-gons found."
-            self.failed_objects = []
-        else:
-            self.status = "Failed"
-            self.info_message = f"Found {len(ngons)} faces > 4 edges."
-            self.failed_objects = ngons
\ No newline at end of file
+        return ngons
\ No newline at end of file
@@ -1,36 +1,29 @@
-import maya.cmds as cmds
-
-from collections import Counter
 from .base_check import CheckItem
 
 class DuplicateNameCheck(CheckItem):
     label = "Duplicate Names Check"
     category = "Naming"
     is_fixable = False
+    scene_bound = False
+    snapshot_fields = ("duplicate_names", "name_count")
+    live_events = ("node_added", "node_removed", "renamed")
 
-    def check(self):
-        # 比如 ['|Group1|pCube1', '|Group2|pCube1', '|pSphere1']
-        all_dag_nodes = cmds.ls(type="transform", long=True)
-
-        short_names = [path.split("|")[-1] for path in all_dag_nodes]
-
-        #{'pCube1': 2, 'pSphere1': 1}
-        counts = Counter(short_names)
+    def check(self, snapshot=None):
+        snapshot = self._use_snapshot(snapshot)
 
-        duplicates_short = [name for name, count in counts.items() if count > 1]
+        # 短名索引 (core/name_index.py) 里已经维护好了重名表，这里只是读出来
+        # 比如 {'pCube1': ['|Group1|pCube1', '|Group2|pCube1']}
+        duplicates = snapshot.duplicate_names
+        self.objects_scanned = snapshot.name_count
 
-        if not duplicates_short:
+        if not duplicates:
             self.status = "Passed"
             self.info_message = "No duplicate names found."
             self.failed_objects = []
         else:
             self.status = "Failed"
-            self.info_message = f"Found {len(duplicates_short)} duplicated names."
-            failed_list = []
-            for path in all_dag_nodes:
-                short = path.split("|")[-1]
-                if short in duplicates_short:
-                    failed_list.append(path)
-            self.failed_objects = failed_list
+            self.info_message = f"Found {len(duplicates)} duplicated names."
+            # 同名的排在一起
+            self.failed_objects = [path for name in sorted(duplicates) for path in duplicates[name]]
 
-        print("All failed objects:", self.failed_objects)
\ No newline at end of file
+        print("All failed objects:", self.failed_objects)
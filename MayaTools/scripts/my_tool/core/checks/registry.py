@@ -0,0 +1,23 @@
+# my_tool/core/checks/registry.py
+"""
+config.CHECK_LIST 里的检查项是 "模块.类名" 字符串 (相对这个包)，这里负责转成类。
+本身不依赖 Maya：只看名字的地方 (导出缓存的设置签名、.ma 预扫描) 不用 import 检查项模块。
+"""
+import importlib
+
+
+def check_id(name):
+    """"scene_checks.FPSCheck" -> "my_tool.core.checks.scene_checks.FPSCheck" (和类的 __module__.__name__ 一致)"""
+    return f"{__package__}.{name}"
+
+
+def class_name(name):
+    """"scene_checks.FPSCheck" -> "FPSCheck" """
+    return name.rpartition(".")[2]
+
+
+def resolve_check(name):
+    """字符串 -> 检查项类 (这时才 import 检查项模块，需要 Maya)"""
+    module_name, _, cls_name = name.rpartition(".")
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, cls_name)
@@ -6,8 +6,11 @@ class FPSCheck(CheckItem):
     label = "FPS Setting Check"
     category = "Scene"
     is_fixable = True
+    failures_are_nodes = False
+    live_events = ("time_unit",)
 
-    def check(self):
+    def check(self, snapshot=None):
+        self._use_snapshot(snapshot)
         from ... import config
         current_time_unit = cmds.currentUnit(query=True, time=True)
         target_time_unit = config.TARGET_FPS
@@ -25,15 +28,18 @@ class FPSCheck(CheckItem):
         from ... import config
         cmds.currentUnit(time=config.TARGET_FPS)
         print("Fixed: FPS set to 24fps (film)")
-        self.check()
+        self._recheck()
 
 class UnknownNodeCheck(CheckItem):
     label = "Unknown Nodes Check"
     category = "Scene"
     is_fixable = True
+    live_events = ("node_added", "node_removed")
     
-    def check(self):
+    def check(self, snapshot=None):
+        self._use_snapshot(snapshot)
         unknows = cmds.ls(type="unknown")
+        self.objects_scanned = len(unknows)
         if not unknows:
             self.status = "Passed"
             self.info_message = "Clean scene."
@@ -45,19 +51,20 @@ class UnknownNodeCheck(CheckItem):
             self.failed_objects = unknows
 
     def fix(self):
-        for unknown in self.failed_objects:
-            if cmds.objExists(unknown):
-                try:
-                    cmds.lockNode(unknown, lock=False)
-                    cmds.delete(unknown)
-                except Exception as e:
-                    print(f"Could not delete {unknown}: {e}")
-        self.check()
+        for unknown in self._fix_targets():
+            try:
+                cmds.lockNode(unknown, lock=False)
+                cmds.delete(unknown)
+            except Exception as e:
+                print(f"Could not delete {unknown}: {e}")
+        self._recheck()
 
 class AnimationRangeCheck(CheckItem):
     label = "Animation Range Check"
     category = "Animation"
     is_fixable = True
+    failures_are_nodes = False
+    live_events = ("node_added", "node_removed", "connection", "attribute", "playback")
 
     def __init__(self):
         super().__init__()
@@ -65,7 +72,8 @@ class AnimationRangeCheck(CheckItem):
         self._calculated_start = 0
         self._calculated_end = 0
 
-    def check(self):
+    def check(self, snapshot=None):
+        self._use_snapshot(snapshot)
         # 1. 获取当前 Timeline 设置
         current_min = cmds.playbackOptions(q=True, min=True)
         current_max = cmds.playbackOptions(q=True, max=True)
@@ -74,6 +82,7 @@ class AnimationRangeCheck(CheckItem):
         # TL=Translate, TA=Angle(Rotate), TU=Unknown(Scale/Visibility)
         # 排除 UL, UA, UU (这些是 Driven Keys)
         anim_curves = cmds.ls(type=['animCurveTL', 'animCurveTA', 'animCurveTU'])
+        self.objects_scanned = len(anim_curves)
 
         if not anim_curves:
             self.status = "Passed"
@@ -114,7 +123,7 @@ class AnimationRangeCheck(CheckItem):
     def fix(self):
         # 自动将时间轴对齐到真实动画长度
         if self._calculated_start == 0 and self._calculated_end == 0:
-            self.check()  # 如果还没运行过 check，先跑一遍计算
+            self.check(self.snapshot)  # 如果还没运行过 check，先跑一遍计算
 
         print(f"Fixing Timeline to: {self._calculated_start} - {self._calculated_end}")
 
@@ -124,4 +133,4 @@ class AnimationRangeCheck(CheckItem):
         # 设置动画总范围 (Animation Start/End)
         cmds.playbackOptions(animationStartTime=self._calculated_start, animationEndTime=self._calculated_end)
 
-        self.check()
\ No newline at end of file
+        self._recheck()
\ No newline at end of file
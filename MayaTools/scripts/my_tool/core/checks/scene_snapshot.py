@@ -0,0 +1,149 @@
+import maya.cmds as cmds
+
+
+class SceneSnapshot:
+    """
+    场景快照：一次 run_checks / run_preflight_checks 只查一遍场景，所有 CheckItem 共用。
+    每个字段第一次被用到时才去查 (懒加载)，之后直接读缓存。
+    场景被修改 (比如 fix) 之后必须调用 invalidate()，下次读取会重新查询。
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._frozen = False  # 冻结的快照只读缓存，不再查场景 (给后台线程用)
+
+    def invalidate(self):
+        """场景变了：丢掉所有缓存"""
+        self._cache.clear()
+
+    def prefetch(self, fields):
+        """在主线程把这些字段 (属性名) 先查好"""
+        for field in fields:
+            getattr(self, field)
+
+    def frozen_copy(self):
+        """
+        当前缓存的只读副本。后台线程里的检查项只能用它：
+        访问没预取过的字段会直接报错，而不是在非主线程里调用 cmds。
+        """
+        copy = SceneSnapshot()
+        copy._cache = dict(self._cache)
+        copy._frozen = True
+        return copy
+
+    def _get(self, key, builder):
+        if key not in self._cache:
+            if self._frozen:
+                raise RuntimeError(f"SceneSnapshot field '{key}' was not prefetched")
+            self._cache[key] = builder()
+        return self._cache[key]
+
+    # ----------------------------------------------------------------
+    # 原始数据 (每项只对应一次 cmds 调用)
+    # ----------------------------------------------------------------
+    @property
+    def selection(self):
+        """当前选中 (长路径)"""
+        return self._get("selection", lambda: cmds.ls(selection=True, long=True) or [])
+
+    @property
+    def node_types(self):
+        """所有 DAG 节点：长路径 -> 节点类型"""
+        def build():
+            flat = cmds.ls(dag=True, long=True, showType=True) or []
+            # showType 返回 [path, type, path, type, ...]
+            return dict(zip(flat[0::2], flat[1::2]))
+        return self._get("node_types", build)
+
+    @property
+    def shapes(self):
+        """所有 shape 节点 (长路径集合)"""
+        return self._get("shapes", lambda: set(cmds.ls(dag=True, shapes=True, long=True) or []))
+
+    @property
+    def transforms(self):
+        """所有 transform 及其子类 (joint 等) 的长路径，顺序和 cmds.ls(type="transform") 一致"""
+        return self._get("transforms", lambda: cmds.ls(type="transform", long=True) or [])
+
+    @property
+    def duplicate_names(self):
+        """重名的短名 -> 长路径列表 (直接读 name_index 里增量维护的结果)"""
+        def build():
+            from ..name_index import get_name_index
+            return get_name_index().duplicates()
+        return self._get("duplicate_names", build)
+
+    @property
+    def name_count(self):
+        """name_index 里的 transform 个数"""
+        def build():
+            from ..name_index import get_name_index
+            return len(get_name_index())
+        return self._get("name_count", build)
+
+    # ----------------------------------------------------------------
+    # 派生数据 (纯 Python，从上面的结果推出来)
+    # ----------------------------------------------------------------
+    @property
+    def transform_set(self):
+        return self._get("transform_set", lambda: set(self.transforms))
+
+    @property
+    def parents(self):
+        """长路径 -> 父节点长路径 (顶层节点没有条目)"""
+        def build():
+            result = {}
+            for path in self.node_types:
+                parent = path.rsplit("|", 1)[0]
+                if parent:
+                    result[path] = parent
+            return result
+        return self._get("parents", build)
+
+    @property
+    def children(self):
+        """长路径 -> 子节点长路径列表"""
+        def build():
+            result = {}
+            for path, parent in self.parents.items():
+                result.setdefault(parent, []).append(path)
+            return result
+        return self._get("children", build)
+
+    @property
+    def mesh_transforms(self):
+        """所有带 mesh shape 的 transform (去重，等价于 listRelatives(ls(type="mesh"), parent=True))"""
+        def build():
+            result = []
+            seen = set()
+            for path, node_type in self.node_types.items():
+                if node_type != "mesh":
+                    continue
+                parent = self.parents.get(path)
+                if parent and parent not in seen:
+                    seen.add(parent)
+                    result.append(parent)
+            return result
+        return self._get("mesh_transforms", build)
+
+    def node_type(self, path):
+        node_type = self.node_types.get(path)
+        if node_type is None:
+            # 不是 DAG 节点 (或者不是长路径)，回退到逐个查询
+            node_type = cmds.objectType(path)
+        return node_type
+
+    def shapes_of(self, path):
+        """transform 下面的 shape 列表 (和 listRelatives(shapes=True) 顺序一致)"""
+        shapes = self.shapes
+        return [child for child in self.children.get(path, []) if child in shapes]
+
+    def has_mesh_shape(self, path):
+        """第一个 shape 是不是 mesh (检查项里 "排除空组/骨骼" 的通用写法)"""
+        shapes = self.shapes_of(path)
+        return bool(shapes) and self.node_types.get(shapes[0]) == "mesh"
+
+    def selected_mesh_transforms(self):
+        """选中的物体及其子层级里，类型是 transform 且带 mesh 的 (选中一个组 = 检查组里所有模型)"""
+        from .. import dag_traversal
+        return dag_traversal.post_order(self.selection, self, dag_traversal.MESH_TRANSFORMS)
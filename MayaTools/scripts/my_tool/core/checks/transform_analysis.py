@@ -0,0 +1,93 @@
+# my_tool/core/checks/transform_analysis.py
+"""
+Freeze Transform 批量分析：把所有物体的 t/r/s 拼成一个 N x 9 的数组，
+一次向量化比较就能得到哪些物体超标、以及每个物体偏离了多少。
+
+numpy 是可选的：Maya 2022+ 的 mayapy 一般都自带，没有的话自动退回纯 Python (结果一样，只是慢一些)。
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CHANNELS = ("tx", "ty", "tz", "rx", "ry", "rz", "sx", "sy", "sz")
+
+# Freeze 之后的值：位移/旋转是 0，缩放是 1
+REST_VALUES = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+
+_GROUPS = {"translate": ("tx", "ty", "tz"), "rotate": ("rx", "ry", "rz"), "scale": ("sx", "sy", "sz")}
+
+
+def expand_tolerance(tolerance):
+    """
+    {"translate": 0.001, "rotate": 0.01, "sy": 0.1} -> 9 个通道各自的容差。
+    可以按组 (translate / rotate / scale) 写，也可以单独写某个通道，单独写的优先。
+    """
+    per_channel = {}
+    for group, channels in _GROUPS.items():
+        if group in tolerance:
+            for channel in channels:
+                per_channel[channel] = tolerance[group]
+    for channel in CHANNELS:
+        if channel in tolerance:
+            per_channel[channel] = tolerance[channel]
+
+    missing = [c for c in CHANNELS if c not in per_channel]
+    if missing:
+        raise ValueError(f"No tolerance configured for channels: {', '.join(missing)}")
+    return tuple(float(per_channel[c]) for c in CHANNELS)
+
+
+def find_unfrozen(paths, rows, tolerance):
+    """
+    paths: N 个物体
+    rows: N 行，每行 9 个值 (tx ty tz rx ry rz sx sy sz)
+    tolerance: expand_tolerance() 的结果
+    返回 [(path, channel, deviation, ratio)]，只包含超标的物体，超标最严重的排最前面。
+    位移 (厘米)、旋转 (度)、缩放 (倍数) 单位不一样，原始偏离值没法直接比大小：
+    每个通道先除以自己的容差 (ratio = 偏离 / 容差)，按 ratio 最大的通道排序并报告这个通道。
+    """
+    if not paths:
+        return []
+    if np is not None:
+        return _find_unfrozen_numpy(paths, rows, tolerance)
+    return _find_unfrozen_python(paths, rows, tolerance)
+
+
+def _ratio(deviation, tol):
+    # 容差写成 0 的通道：有一点偏离就算无穷大
+    if tol > 0:
+        return deviation / tol
+    return float("inf") if deviation > 0 else 0.0
+
+
+def _find_unfrozen_numpy(paths, rows, tolerance):
+    values = np.asarray(rows, dtype=np.float64).reshape(len(paths), len(CHANNELS))
+    deviation = np.abs(values - np.asarray(REST_VALUES))
+    tol = np.asarray(tolerance, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(tol > 0, deviation / np.where(tol > 0, tol, 1.0), np.where(deviation > 0, np.inf, 0.0))
+
+    # 任意一个通道超过它自己的容差就算没 Freeze
+    violated = (deviation > tol).any(axis=1)
+    worst = ratio.argmax(axis=1)
+    worst_ratio = ratio[np.arange(len(paths)), worst]
+
+    indices = np.flatnonzero(violated)
+    # 按 ratio 从大到小排，stable 保证相同时维持原来的顺序
+    order = indices[np.argsort(-worst_ratio[indices], kind="stable")]
+    return [(paths[i], CHANNELS[worst[i]], float(deviation[i, worst[i]]), float(worst_ratio[i])) for i in order]
+
+
+def _find_unfrozen_python(paths, rows, tolerance):
+    result = []
+    for path, row in zip(paths, rows):
+        deviation = [abs(v - rest) for v, rest in zip(row, REST_VALUES)]
+        if not any(d > tol for d, tol in zip(deviation, tolerance)):
+            continue
+        ratios = [_ratio(d, tol) for d, tol in zip(deviation, tolerance)]
+        worst = max(range(len(CHANNELS)), key=lambda i: ratios[i])  # 相同时取第一个，和 argmax 一样
+        result.append((path, CHANNELS[worst], deviation[worst], ratios[worst]))
+    result.sort(key=lambda item: -item[3])
+    return result
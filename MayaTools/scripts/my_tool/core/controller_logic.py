@@ -1,6 +1,41 @@
 # my_tool/core/controller_logic.py
+import re
+
 import maya.cmds as cmds
 from ..utils.decorators import undoable
+from .name_index import get_name_index
+from .checks.scene_snapshot import SceneSnapshot
+from . import dag_traversal, shape_library
+
+# 左右侧标记：前后要么是 "_" / ":" 要么是名字的开头结尾 (arm_L, L_arm, ns:Left_arm)
+# 左边的写法 -> 对应的右边写法
+SIDE_TOKENS = {
+    "L": "R", "l": "r",
+    "Left": "Right", "left": "right",
+    "Lf": "Rt", "lf": "rt",
+}
+_MIRROR_TOKENS = dict(SIDE_TOKENS)
+_MIRROR_TOKENS.update({right: left for left, right in SIDE_TOKENS.items()})
+_SIDE_RE = re.compile(r"(?:^|(?<=[_:]))(%s)(?=_|$)" % "|".join(sorted(_MIRROR_TOKENS, key=len, reverse=True)))
+
+
+def detect_side(name):
+    """
+    短名里的左右标记 -> ("L" / "R", 另一侧的名字)，没有标记返回 (None, name)。
+    "arm_L" -> ("L", "arm_R")，"Right_leg_01" -> ("R", "Left_leg_01")
+    """
+    m = _SIDE_RE.search(name)
+    if m is None:
+        return None, name
+    token = m.group(1)
+    side = "L" if token in SIDE_TOKENS else "R"
+    return side, name[:m.start(1)] + _MIRROR_TOKENS[token] + name[m.end(1):]
+
+
+def mirror_path(path):
+    """长路径里每一级都换成另一侧 ("|hip|clavicle_L|arm_L" -> "|hip|clavicle_R|arm_R")"""
+    return "|".join(detect_side(part)[1] if part else part for part in path.split("|"))
+
 
 def get_current_selection_name():
     """获取当前选中物体名"""
@@ -31,14 +66,7 @@ def create_controller(name, shape, size, color_data, match_pos, match_rot, use_o
         ctrl_name = name if name else "CTRL_new"
 
     # --- 2. 原点创建 (保持 X 轴朝向) ---
-    if shape == "Square":
-        ctrl = cmds.circle(n=ctrl_name, nr=(1, 0, 0), r=size, d=1, s=4)[0]
-        cmds.xform(ctrl, ro=(45, 0, 0), relative=True)
-        cmds.makeIdentity(ctrl, apply=True, t=1, r=1, s=1)
-    elif shape == "Cube":
-        ctrl = cmds.circle(n=ctrl_name, nr=(1, 0, 0), r=size)[0]
-    else:
-        ctrl = cmds.circle(n=ctrl_name, nr=(0, 1, 0), r=size)[0]
+    ctrl = _create_shape(ctrl_name, shape, size)
 
     # --- 3. 上色 ---
     _apply_color(ctrl, color_data)
@@ -63,30 +91,11 @@ def create_controller(name, shape, size, color_data, match_pos, match_rot, use_o
 
     # --- 5. 对齐 ---
     if target_node:
-        try:
-            kwargs = {}
-            if match_pos:
-                kwargs['pos'] = True
-            if match_rot:
-                kwargs['rot'] = True
-
-            if kwargs:  # 至少有一个参数才调用
-                cmds.matchTransform(node_to_move, target_node, **kwargs)
-
-        except Exception as e:
-            print(e)
+        _match(node_to_move, target_node, match_pos, match_rot)
 
     # --- 6. 约束 ---
-    if target_node and constrain_mode != "None":
-        try:
-            if constrain_mode == "Parent":
-                cmds.parentConstraint(ctrl, target_node, mo=True)
-            elif constrain_mode == "Point":
-                cmds.pointConstraint(ctrl, target_node, mo=True)
-            elif constrain_mode == "Orient":
-                cmds.orientConstraint(ctrl, target_node, mo=True)
-        except Exception as e:
-            print(f"Constraint error: {e}")
+    if target_node:
+        _constrain(ctrl, target_node, constrain_mode)
 
     # -------------------------------------------------------------------------
     # 🆕 V6.0 核心功能：自动寻找父级控制器 (Auto Hierarchy)
@@ -103,14 +112,19 @@ def create_controller(name, shape, size, color_data, match_pos, match_rot, use_o
             parent_jnt_short = parent_jnt.split("|")[-1]
             search_ctrl_name = f"CTRL_{parent_jnt_short}"
 
-            # 3. 检查场景里有没有这个控制器
-            if cmds.objExists(search_ctrl_name):
+            # 3. 检查场景里有没有这个控制器 (查短名索引，重名时不乱挂)
+            parent_ctrls = get_name_index().paths_of(search_ctrl_name)
+            if len(parent_ctrls) == 1:
+                parent_ctrl = parent_ctrls.pop()
                 print(f"🤖 Auto-Hierarchy: Found parent controller [{search_ctrl_name}], parenting...")
                 try:
                     # 4. 【关键】把当前的组 (GRP)，P 给爸爸的控制器 (CTRL)
-                    cmds.parent(node_to_move, search_ctrl_name)
+                    cmds.parent(node_to_move, parent_ctrl)
                 except Exception as e:
                     print(f"Auto-parent failed: {e}")
+            elif parent_ctrls:
+                print(f"⚠️ Parent controller [{search_ctrl_name}] is not unique: {sorted(parent_ctrls)}. "
+                      f"Skipping hierarchy.")
             else:
                 print(f"ℹ️ Parent controller [{search_ctrl_name}] not found. Skipping hierarchy.")
 
@@ -119,15 +133,193 @@ def create_controller(name, shape, size, color_data, match_pos, match_rot, use_o
     return ctrl
 
 
+@undoable
+def build_fk_hierarchy(root_joints, shape, size, color_data, match_pos=True, match_rot=True,
+                       use_offset=True, constrain_mode="Parent", mirror=False):
+    """
+    批量 FK：给 root_joints 下面整棵骨骼树一次建好所有控制器。
+    1. 一次遍历拿到所有骨骼 (父在前)，保证建子控制器时父控制器已经在了
+    2. 骨骼 -> (组, 控制器) 记在字典里，找父控制器直接查字典，不再逐个 objExists 猜名字
+    3. 建之前就有 CTRL_<骨骼> 而且约束的就是这根骨骼的 (比如上次建了一半) 直接复用，不重复建
+    mirror=True：选一侧 (arm_L) 就把另一侧 (arm_R) 一起建了，颜色按 config.SIDE_COLORS 分左右。
+    另一侧的组对齐的是它自己的骨骼，骨骼是 behavior 镜像出来的话，组的朝向也就是镜像的。
+    整个过程一个 Undo。返回新建的控制器列表。
+    """
+    snapshot = SceneSnapshot()
+    roots = list(root_joints)
+    if mirror:
+        for root in root_joints:
+            other = mirror_path(root)
+            if other == root:
+                continue  # 中间的骨骼 (比如 hips)：两侧本来就在它下面
+            if other in snapshot.node_types:
+                roots.append(other)
+            else:
+                print(f"ℹ️ Mirror joint not found: {other}")
+    joints = dag_traversal.pre_order(roots, snapshot, dag_traversal.JOINTS)
+    if not joints:
+        print("ℹ️ No joints found under the selection.")
+        return []
+
+    # 建之前场景里已有的节点 (短名 -> 长路径)。snapshot 不会随着新建更新，
+    # 所以这一轮新建的控制器不会被当成 "已有的" 拿去给同名骨骼复用
+    existing_names = {}
+    for path in snapshot.node_types:
+        existing_names.setdefault(path.rsplit("|", 1)[-1], []).append(path)
+
+    # 骨骼长路径 -> 控制器长路径 (新建的或者复用的)
+    # cmds 返回的是 "当时唯一" 的短名/部分路径 (有重名时是 |CTRL_x)，一打组、一 parent 就失效了，
+    # 所以每次建完/挪完都换成长路径再存
+    controllers = {}
+    created = []
+
+    for joint in joints:
+        short_name = joint.split("|")[-1]
+        ctrl_name = f"CTRL_{short_name}"
+
+        existing = _find_existing_controller(joint, ctrl_name, existing_names, snapshot)
+        if existing:
+            controllers[joint] = existing
+            continue
+
+        ctrl = _long_path(_create_shape(ctrl_name, shape, size))
+        _apply_color(ctrl, _side_color(short_name, color_data) if mirror else color_data)
+
+        node_to_move = ctrl
+        if use_offset:
+            node_to_move = _long_path(cmds.group(ctrl, n=f"GRP_{ctrl_name}"))
+            ctrl = f"{node_to_move}|{ctrl.rsplit('|', 1)[-1]}"
+
+        _match(node_to_move, joint, match_pos, match_rot)
+
+        # 往上找最近的、有控制器的骨骼 (中间可能隔着非骨骼节点)
+        parent = snapshot.parents.get(joint)
+        while parent and parent not in controllers:
+            parent = snapshot.parents.get(parent)
+        if parent:
+            node_to_move = _long_path(cmds.parent(node_to_move, controllers[parent])[0])
+            ctrl = f"{node_to_move}|{ctrl.rsplit('|', 1)[-1]}" if use_offset else node_to_move
+
+        _constrain(ctrl, joint, constrain_mode)
+
+        controllers[joint] = ctrl
+        created.append(ctrl)
+
+    if created:
+        cmds.select(created)
+    print(f"🤖 FK Build: created {len(created)} controllers for {len(joints)} joints.")
+    return created
+
+
+def _long_path(node):
+    """cmds 刚返回的名字 (这一刻是唯一的) -> 长路径"""
+    return cmds.ls(node, long=True)[0]
+
+
+def _find_existing_controller(joint, ctrl_name, existing_names, snapshot):
+    """
+    建之前就有的、属于这根骨骼的控制器，没有返回 None。
+    1. 骨骼短名不唯一 (两套骨骼都有 arm_L)：CTRL_arm_L 是谁的说不清，不复用
+    2. 控制器本身也得唯一
+    3. 控制器约束着别的骨骼就不是这根的；没有约束 (Constrain = None 建的) 的认为可以复用
+    """
+    joints = [p for p in existing_names.get(joint.rsplit("|", 1)[-1], []) if snapshot.node_types[p] == "joint"]
+    if len(joints) != 1:
+        return None
+    ctrls = [p for p in existing_names.get(ctrl_name, []) if snapshot.node_types[p] == "transform"]
+    if len(ctrls) != 1:
+        return None
+
+    driven = _driven_nodes(ctrls[0])
+    if driven and joint not in driven:
+        print(f"ℹ️ {ctrl_name} drives {sorted(driven)}, not {joint}. Building a new controller.")
+        return None
+    return ctrls[0]
+
+
+def _driven_nodes(ctrl):
+    """ctrl 通过约束驱动的节点 (长路径)。约束节点默认建在被约束物体下面"""
+    constraints = set(cmds.listConnections(ctrl, source=False, destination=True, type="constraint") or [])
+    driven = set()
+    for con in constraints:
+        driven.update(cmds.listRelatives(con, parent=True, fullPath=True) or [])
+    return driven
+
+
+def _side_color(name, color_data):
+    """左右两侧用 config.SIDE_COLORS，中间的用传进来的颜色"""
+    from .. import config
+    side, _ = detect_side(name)
+    if side in config.SIDE_COLORS:
+        return {"type": "index", "value": config.SIDE_COLORS[side]}
+    return color_data
+
+
+def get_selected_joints():
+    """选中的骨骼 (长路径)"""
+    return cmds.ls(selection=True, type="joint", long=True) or []
+
+
+def get_shape_names():
+    """形状库里的形状名 (给 Rig 页的下拉框)"""
+    return shape_library.list_shapes()
+
+
+def capture_selected_shape(name):
+    """把选中的曲线存成形状库里的新形状，返回存到的文件。没选曲线抛 ValueError"""
+    sel = cmds.ls(selection=True, long=True)
+    if not sel:
+        raise ValueError("Please select a curve first.")
+    curves = shape_library.capture_shape(sel[0])
+    return shape_library.save_shape(name, curves)
+
+
+def _create_shape(ctrl_name, shape, size):
+    # 形状数据来自形状库 (core/shape_library.py)，库里没有的退回圆
+    if shape not in shape_library.load_shapes():
+        print(f"Unknown shape '{shape}', using {shape_library.DEFAULT_SHAPE}.")
+        shape = shape_library.DEFAULT_SHAPE
+    return shape_library.create_curve(ctrl_name, shape, size)
+
+
+def _match(node, target, match_pos, match_rot):
+    try:
+        kwargs = {}
+        if match_pos:
+            kwargs['pos'] = True
+        if match_rot:
+            kwargs['rot'] = True
+
+        if kwargs:  # 至少有一个参数才调用
+            cmds.matchTransform(node, target, **kwargs)
+
+    except Exception as e:
+        print(e)
+
+
+def _constrain(ctrl, target, constrain_mode):
+    if constrain_mode == "None":
+        return
+    try:
+        if constrain_mode == "Parent":
+            cmds.parentConstraint(ctrl, target, mo=True)
+        elif constrain_mode == "Point":
+            cmds.pointConstraint(ctrl, target, mo=True)
+        elif constrain_mode == "Orient":
+            cmds.orientConstraint(ctrl, target, mo=True)
+    except Exception as e:
+        print(f"Constraint error: {e}")
+
+
 def _apply_color(node, color_data):
-    # (保持不变)
-    shapes = cmds.listRelatives(node, shapes=True)
+    # 多段曲线的形状每个 shape 都要上色
+    shapes = cmds.listRelatives(node, shapes=True, fullPath=True)
     if not shapes: return
-    shape = shapes[0]
-    cmds.setAttr(f"{shape}.overrideEnabled", 1)
-    if color_data['type'] == 'index':
-        cmds.setAttr(f"{shape}.overrideRGBColors", 0)
-        cmds.setAttr(f"{shape}.overrideColor", int(color_data['value']))
-    elif color_data['type'] == 'rgb':
-        cmds.setAttr(f"{shape}.overrideRGBColors", 1)
-        cmds.setAttr(f"{shape}.overrideColorRGB", *color_data['value'])
\ No newline at end of file
+    for shape in shapes:
+        cmds.setAttr(f"{shape}.overrideEnabled", 1)
+        if color_data['type'] == 'index':
+            cmds.setAttr(f"{shape}.overrideRGBColors", 0)
+            cmds.setAttr(f"{shape}.overrideColor", int(color_data['value']))
+        elif color_data['type'] == 'rgb':
+            cmds.setAttr(f"{shape}.overrideRGBColors", 1)
+            cmds.setAttr(f"{shape}.overrideColorRGB", *color_data['value'])
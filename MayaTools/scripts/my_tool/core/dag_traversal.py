@@ -0,0 +1,122 @@
+# my_tool/core/dag_traversal.py
+"""
+DAG 层级遍历 (改名工具和检查项共用)。
+
+以前展开选择是 ls(dagObjects=True) + set 去重 + 按长路径字符串长度排序，
+既要对长字符串排序，兄弟节点名字长短不一时顺序还是错的。
+这里直接在 SceneSnapshot 的 children 表上做深度优先遍历 (一次 cmds.ls 拿到整个 DAG)：
+    post_order: 子节点在前、父节点在后 (改名、删除这类 "先动子再动父" 的操作)
+    pre_order : 父节点在前，兄弟按场景里的顺序 (编号这类 "从根往下数" 的操作)
+每个节点只出现一次 (选择里有互相嵌套的也不会重复)，子孙节点排在祖先前面选中也不会打乱顺序。
+
+node_filter(path, snapshot) -> bool 只决定节点要不要出现在结果里，不影响往下遍历：
+    post_order(roots, node_filter=JOINTS)            # 只要骨骼
+    post_order(roots, node_filter=MESH_TRANSFORMS)   # 只要带 mesh 的 transform
+"""
+
+
+def type_filter(*node_types):
+    """按节点类型过滤 (精确匹配，"transform" 不包括 joint)"""
+    def node_filter(path, snapshot):
+        return snapshot.node_types.get(path) in node_types
+    return node_filter
+
+
+JOINTS = type_filter("joint")
+TRANSFORMS = type_filter("transform")
+
+
+def _is_mesh_transform(path, snapshot):
+    """带 mesh shape 的 transform (排除空组、骨骼)"""
+    return snapshot.node_types.get(path) == "transform" and snapshot.has_mesh_shape(path)
+
+
+MESH_TRANSFORMS = _is_mesh_transform
+
+
+def _snapshot_or_new(snapshot):
+    if snapshot is None:
+        from .checks.scene_snapshot import SceneSnapshot
+        snapshot = SceneSnapshot()
+    return snapshot
+
+
+def top_roots(roots):
+    """
+    去掉祖先也在 roots 里的节点 (它会在祖先的子树里走到)，其余保持原来的顺序。
+    选择顺序是 [|a|b, |a] 的话，先从 |a|b 开始走，|a 就排到它子节点后面去了
+    """
+    root_set = set(roots)
+    result = []
+    for root in roots:
+        parts = root.split("|")
+        if any("|".join(parts[:i]) in root_set for i in range(2, len(parts))):
+            continue
+        result.append(root)
+    return result
+
+
+def post_order(roots, snapshot=None, node_filter=None):
+    """roots 和它们下面的整棵子树，子节点在前 (roots 必须是长路径)"""
+    snapshot = _snapshot_or_new(snapshot)
+    children = snapshot.children
+    result = []
+    visited = set()
+
+    for root in top_roots(roots):
+        if root in visited:
+            continue
+        visited.add(root)
+        # 栈里放 (节点, 还没走完的子节点迭代器)，子节点都走完了才输出自己
+        stack = [(root, iter(children.get(root, ())))]
+        while stack:
+            path, child_iter = stack[-1]
+            for child in child_iter:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(children.get(child, ()))))
+                    break
+            else:
+                stack.pop()
+                if node_filter is None or node_filter(path, snapshot):
+                    result.append(path)
+    return result
+
+
+def pre_order(roots, snapshot=None, node_filter=None):
+    """roots 和它们下面的整棵子树，父节点在前，兄弟按场景顺序"""
+    snapshot = _snapshot_or_new(snapshot)
+    children = snapshot.children
+    result = []
+    visited = set()
+
+    for root in top_roots(roots):
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            if node_filter is None or node_filter(path, snapshot):
+                result.append(path)
+            # 倒着压栈，弹出来才是正序
+            for child in reversed(children.get(path, ())):
+                if child not in visited:
+                    visited.add(child)
+                    stack.append(child)
+    return result
+
+
+def depth(path):
+    """长路径的层级深度 ("|a|b" -> 2)，DG 节点是 0"""
+    return path.count("|")
+
+
+def children_first(paths):
+    """不展开层级，只把已有的列表排成子在前 (同一层保持原来的顺序)"""
+    return sorted(paths, key=depth, reverse=True)
+
+
+def parents_first(paths):
+    """不展开层级，只把已有的列表排成父在前 (同一层保持原来的顺序)"""
+    return sorted(paths, key=depth)
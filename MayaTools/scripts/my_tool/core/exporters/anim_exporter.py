@@ -3,6 +3,7 @@ import maya.mel as mel
 import json
 import os
 from .base_exporter import ExporterBase
+from .export_types import EXPORT_TYPES
 
 class AnimExporter(ExporterBase):
     """
@@ -14,9 +15,14 @@ class AnimExporter(ExporterBase):
     4. Isolation (断开层级，只导出骨骼)
     5. Export Selection (利用 FBX 导出选中项功能，自动过滤掉控制器垃圾)
     """
+    EXPORT_TYPE = EXPORT_TYPES["Animation"]
+    CHECK_MODE = EXPORT_TYPE.check_mode
+    # 针对动画导出的 FBX 设置 (见 export_types.ANIM_FBX_OPTIONS)
+    FBX_OPTIONS = EXPORT_TYPE.fbx_options
+
     def _process_logic(self):
         # --- 1. 通用检查 ---
-        if not self.run_preflight_checks("Animation"):
+        if not self.run_preflight_checks(self.CHECK_MODE):
             return False
 
         # --- 2. 寻找根骨骼 ---
@@ -108,20 +114,8 @@ class AnimExporter(ExporterBase):
         重写基类的导出命令。
         针对动画导出，我们需要特殊的 FBX 设置。
         """
-        # 1. 几何体设置 (保持平滑组)
-        mel.eval("FBXExportSmoothingGroups -v true")
-        mel.eval("FBXExportSmoothMesh -v true")
-
-        # 2. 动画设置
-        # 我们已经手动 Bake 过了，所以关掉 FBX 自带的 Bake
-        mel.eval("FBXExportBakeComplexAnimation -v false")
-        # 只导动画？不，通常游戏引擎需要骨骼结构，所以保持默认
-        mel.eval("FBXExportAnimationOnly -v false")
-        # 关掉输入连接 (防止把约束节点导出去)
-        mel.eval("FBXExportInputConnections -v false")
-
-        # 3. 轴向 (根据引擎需求，Unity=Y, Unreal=Z)
-        mel.eval("FBXExportUpAxis y")
+        # 1-3. FBX 设置 (见 FBX_OPTIONS)
+        self._apply_fbx_options()
 
         # 4. 【关键】使用 es=True (Export Selected)
         # 因为我们只选中了根骨骼，其他垃圾都不会被导出
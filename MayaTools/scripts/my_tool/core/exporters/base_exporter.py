@@ -3,6 +3,8 @@ import maya.cmds as cmds
 import maya.mel as mel
 from ... import config
 from .. import checker_logic
+from .. import check_profiler
+from . import export_types
 
 class ExporterBase:
     """
@@ -10,6 +12,12 @@ class ExporterBase:
     规定了所有导出器必须遵守的流程：
     Open -> Process (Check/Fix/Bake) -> Export
     """
+    # 导出类型的元数据 (检查模式、FBX 设置、输出文件)，见 export_types.py
+    EXPORT_TYPE = None
+    # 预检查读取 config.CHECK_LIST 里的哪个模式
+    CHECK_MODE = None
+    FBX_OPTIONS = export_types.BASE_FBX_OPTIONS
+
     def __init__(self):
         self.status = "Idle"
         self.log = []
@@ -31,11 +39,16 @@ class ExporterBase:
         """
         self.add_log(f"--- Running Pre-flight Checks for [{mode}] ---")
         check_instances = checker_logic.get_checks(mode)
+        # 所有检查项共用一个场景快照，先一起跑一遍 (data-only 的检查并行)
+        snapshot = checker_logic.run_checks(check_instances)
 
         all_passed = True
+        scene_modified = False
 
         for check_item in check_instances:
-            check_item.check()
+            # 前面有检查项 fix 过场景 (快照已作废)，这一项的结果可能过时了，重查一次
+            if scene_modified:
+                check_item.check(snapshot)
 
             if check_item.status == "Failed":
                 self.add_log(f"xx Failed: {check_item.label}")
@@ -44,7 +57,8 @@ class ExporterBase:
                 # 尝试修复
                 if check_item.is_fixable:
                     self.add_log(f"   >> Attempting Auto-fix...")
-                    check_item.fix()
+                    check_profiler.run_fix(check_item)
+                    scene_modified = True
 
                     # 修复后复查
                     if check_item.status == "Passed":
@@ -60,6 +74,9 @@ class ExporterBase:
                     break  # 致命错误，直接跳出循环
                 else:
                     self.add_log("Warning: Ignoring non-critical error.")
+
+        # 记一笔耗时历史，方便之后排查哪个检查项变慢了
+        check_profiler.record_run(mode, check_instances)
         return all_passed
 
     def run(self, file_path, output_dir):
@@ -97,9 +114,7 @@ class ExporterBase:
             return False
         # 3. 导出 FBX
         # 构造输出路径: OutputDir/FileName.fbx
-        file_name = os.path.basename(file_path)
-        name_no_ext = os.path.splitext(file_name)[0]
-        fbx_path = os.path.join(output_dir, f"{name_no_ext}.fbx").replace("\\", "/")
+        fbx_path = self.get_output_paths(file_path, output_dir)[0]
 
         try:
             self._export_fbx_command(fbx_path)
@@ -111,26 +126,33 @@ class ExporterBase:
             self.add_log(f"Error during export: {e}")
             return False
 
+    @classmethod
+    def get_output_paths(cls, file_path, output_dir):
+        """
+        这个文件会导出哪些文件。第一个永远是 FBX。
+        规则在 export_types 里 (父进程不开 Maya 也要算同样的路径)。
+        """
+        return cls.EXPORT_TYPE.output_paths(file_path, output_dir)
+
+    @classmethod
+    def get_output_name(cls, name):
+        """按 config.EXPORT_NAME_TEMPLATE 生成输出文件名 (不带扩展名)，没配置或匹配不上就用原名"""
+        return cls.EXPORT_TYPE.output_name(name)
+
     def _process_logic(self):
         raise NotImplementedError()
 
+    def _apply_fbx_options(self):
+        for option in self.FBX_OPTIONS:
+            mel.eval(option)
+
     def _export_fbx_command(self, path):
         """
         执行 FBX 导出命令。
         这里配置通用的 FBX 选项。
         """
-        # FBX 设置 (使用 MEL，因为 cmds.file 的 options 字符串太难拼)
-        # 1. 几何体
-        mel.eval("FBXExportSmoothingGroups -v true")
-        mel.eval("FBXExportSmoothMesh -v true")
-        mel.eval("FBXExportTriangulate -v false")  # 引擎通常自己会三角化，Maya这边保持四边面更干净
-
-        # 2. 动画 (子类可以在 process_logic 里覆盖这个设置)
-        mel.eval("FBXExportBakeComplexAnimation -v false")
-
-        # 3. 杂项
-        mel.eval("FBXExportUpAxis y")  # 引擎通常是 Y-Up (Unity) 或 Z-Up (Unreal)，需根据项目配置
-        mel.eval("FBXExportScaleFactor 1.0")
+        # 1-3. FBX 设置 (见 FBX_OPTIONS)
+        self._apply_fbx_options()
 
         # 4. 执行导出 (Export All)
         # 如果只想导出选中的，改为 es=True (Export Selected)
@@ -0,0 +1,448 @@
+# my_tool/core/exporters/batch_runner.py
+"""
+并行批量导出：把每个文件交给一个独立的 mayapy 进程 (export_worker)。
+同时最多跑 workers 个进程，单个文件有超时和重试。
+
+这里只用标准库，不 import maya，所以调度逻辑在普通 Python 里也能跑 (配合 use_stub=True)。
+"""
+import os
+import sys
+import glob
+import json
+import queue
+import argparse
+import shutil
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from .export_worker import EVENT_PREFIX
+from .export_types import get_export_type
+
+# scripts 根目录 (my_tool 的上一级)，worker 进程靠它 import my_tool
+SCRIPTS_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# maya.cmds 替身所在目录
+STUB_PATH = os.path.join(SCRIPTS_ROOT, "my_tool", "utils", "maya_stub")
+
+WORKER_MODULE = "my_tool.core.exporters.export_worker"
+
+
+def _path_key(path):
+    """比较路径用 (Windows 上大小写、斜杠方向不同也是同一个文件)"""
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+def find_mayapy():
+    """
+    找 mayapy 可执行文件：
+    1. config.MAYAPY_PATH
+    2. 当前 Maya 可执行文件的同级目录 (maya.exe -> mayapy.exe)
+    3. PATH
+    """
+    try:
+        from ... import config
+        if config.MAYAPY_PATH and os.path.exists(config.MAYAPY_PATH):
+            return config.MAYAPY_PATH
+    except ImportError:
+        pass
+
+    exe_name = "mayapy.exe" if sys.platform == "win32" else "mayapy"
+    candidate = os.path.join(os.path.dirname(sys.executable), exe_name)
+    if os.path.exists(candidate):
+        return candidate
+
+    return shutil.which("mayapy")
+
+
+class BatchExportRunner:
+    """
+    用法：
+        runner = BatchExportRunner("Animation", out_dir, workers=4)
+        for event in runner.iter_events(files):
+            ...
+
+    iter_events 运行期间可以从别的线程调用 submit() 追加文件，
+    pause()/resume() 控制是否开始新文件，cancel() 取消排队中的文件并杀掉正在跑的进程。
+
+    事件都是字典，type 字段区分：
+        queued   -> {"file", "index"}
+        started  -> {"file", "index", "attempt"}
+        log      -> {"file", "index", "message"}
+        finished -> {"file", "index", "success", "status", "attempts"}
+        done     -> {"success", "total"}
+    finished 的 status 是 "Success" / "Skipped" / "Rejected" / "Failed" / "Cancelled"。
+
+    use_cache=True 时会读写输出目录里的导出缓存 (export_cache)，源文件和设置都没变的文件直接 "Skipped"；
+    force=True 忽略缓存强制重新导出 (成功后仍然会更新缓存)。
+    prescan=True 时先用 ma_scanner 读一遍 .ma 文本，有不可修复的致命问题直接 "Rejected"，不启动 Maya。
+    同一批里输出文件撞名 (见 submit) 的也直接 "Rejected"。
+    """
+
+    def __init__(self, export_type, output_dir, workers=None, timeout=None, retries=None,
+                 python_exe=None, use_stub=False, use_cache=True, force=False, prescan=True):
+        if workers is None or timeout is None or retries is None:
+            from ... import config
+            workers = config.EXPORT_WORKERS if workers is None else workers
+            timeout = config.EXPORT_TIMEOUT if timeout is None else timeout
+            retries = config.EXPORT_RETRIES if retries is None else retries
+
+        self.export_type = export_type
+        self.spec = get_export_type(export_type)
+        self.output_dir = output_dir
+        self.workers = max(1, int(workers))
+        self.timeout = timeout
+        self.retries = max(0, int(retries))
+        self.use_stub = use_stub
+        self.force = force
+
+        # 预扫描用哪个模式的 CHECK_LIST (和导出器的 run_preflight_checks 一致)
+        self.prescan_mode = None
+        if prescan:
+            self.prescan_mode = self.spec.check_mode
+
+        self.manifest = None
+        if use_cache:
+            from .export_cache import ExportManifest
+            self.manifest = ExportManifest(output_dir, export_type)
+
+        if use_stub:
+            self.python_exe = python_exe or sys.executable
+        else:
+            self.python_exe = python_exe or find_mayapy()
+
+        # --- 运行状态 (多线程共享，统一用 _lock 保护) ---
+        self._lock = threading.Lock()
+        self._events = None
+        self._pool = None
+        self._closed = True
+        self._next_index = 0
+        self._pending = 0
+        self._procs = {}  # index -> 正在运行的 Popen
+        self._outputs = {}  # 这一批的输出文件 -> 源文件 (查撞名)
+        self._cancelled = set()  # 被单独取消的 index
+        self._cancel_all = threading.Event()
+        self._resume = threading.Event()  # set = 允许开始新文件
+        self._resume.set()
+
+    # ----------------------------------------------------------------
+    # 对外接口
+    # ----------------------------------------------------------------
+    def iter_events(self, files=(), heartbeat=None):
+        """
+        开始导出并逐条产出事件，所有文件 (包括中途 submit 的) 结束后返回。
+        heartbeat 不为空时，空闲超过这么多秒会产出一个 None，方便调用方趁机做别的事。
+        """
+        with self._lock:
+            self._events = queue.Queue()
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            self._closed = False
+            self._next_index = 0
+            self._pending = 0
+            self._outputs = {}
+            self._cancelled = set()
+            self._cancel_all.clear()
+
+        for f in files:
+            self.submit(f)
+
+        finished = 0
+        success_count = 0
+        try:
+            while True:
+                with self._lock:
+                    if self._pending == 0 and self._events.empty():
+                        # 没有活了：关门，之后的 submit 会被拒绝
+                        self._closed = True
+                        break
+                try:
+                    event = self._events.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield None
+                    continue
+
+                if event["type"] == "finished":
+                    finished += 1
+                    if event["success"]:
+                        success_count += 1
+                    with self._lock:
+                        self._pending -= 1
+                yield event
+        finally:
+            with self._lock:
+                self._closed = True
+            # 提前退出 (调用方 break) 时也要把进程收拾干净
+            if self._pending:
+                self.cancel()
+            self._pool.shutdown(wait=True)
+
+        yield {"type": "done", "success": success_count, "total": finished}
+
+    def run(self, files):
+        """阻塞版本：跑完后返回成功数量"""
+        result = 0
+        for event in self.iter_events(files):
+            if event["type"] == "done":
+                result = event["success"]
+        return result
+
+    def submit(self, file_path):
+        """
+        追加一个文件。返回任务 index；批次已经结束时返回 None。
+        输出文件和这一批里已有的文件撞了 (同一个文件提交两次，或者命名模板把两个文件算成同一个名字)
+        不会启动 worker，直接 "Rejected"，否则后导出的会悄悄覆盖先导出的。
+        """
+        outputs = [_path_key(p) for p in self.spec.output_paths(file_path, self.output_dir)]
+        with self._lock:
+            if self._closed:
+                return None
+            index = self._next_index
+            self._next_index += 1
+            self._pending += 1
+            self._events.put({"type": "queued", "file": file_path, "index": index})
+
+            owner = next((self._outputs[p] for p in outputs if p in self._outputs), None)
+            if owner is not None:
+                if _path_key(owner) == _path_key(file_path):
+                    message = "Already in this batch, not exported twice."
+                else:
+                    message = (f"Output collision: {os.path.basename(outputs[0])} is already exported from "
+                               f"{owner} (check EXPORT_NAME_TEMPLATE). Not exported.")
+                self._events.put({"type": "log", "file": file_path, "index": index, "message": message})
+                self._events.put({"type": "finished", "file": file_path, "index": index, "success": False,
+                                  "status": "Rejected", "attempts": 0})
+                return index
+
+            for p in outputs:
+                self._outputs[p] = file_path
+            self._pool.submit(self._run_file, file_path, index, self._events)
+        return index
+
+    def pause(self):
+        """暂停：正在跑的文件会跑完，但不会再开始新文件"""
+        self._resume.clear()
+
+    def resume(self):
+        self._resume.set()
+
+    def is_paused(self):
+        return not self._resume.is_set()
+
+    def cancel(self, index=None):
+        """取消某个任务；index 为 None 时取消全部"""
+        with self._lock:
+            if index is None:
+                self._cancel_all.set()
+                procs = list(self._procs.values())
+            else:
+                self._cancelled.add(index)
+                procs = [self._procs[index]] if index in self._procs else []
+        # 暂停中的任务也要能被唤醒，才能走到 "Cancelled"
+        self._resume.set()
+        for proc in procs:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+
+    # ----------------------------------------------------------------
+    # 内部逻辑 (在线程池里跑)
+    # ----------------------------------------------------------------
+    def _is_cancelled(self, index):
+        return self._cancel_all.is_set() or index in self._cancelled
+
+    def _build_command(self, file_path):
+        return [self.python_exe, "-m", WORKER_MODULE,
+                "--type", self.export_type,
+                "--output", self.output_dir,
+                file_path]
+
+    def _build_env(self):
+        env = dict(os.environ)
+        paths = [SCRIPTS_ROOT]
+        if self.use_stub:
+            paths.insert(0, STUB_PATH)
+        if env.get("PYTHONPATH"):
+            paths.append(env["PYTHONPATH"])
+        env["PYTHONPATH"] = os.pathsep.join(paths)
+        env["PYTHONUNBUFFERED"] = "1"
+        return env
+
+    def _run_file(self, file_path, index, events):
+        # 0. 增量缓存：源文件和设置都没变，直接跳过
+        if self.manifest and not self.force and not self._is_cancelled(index):
+            try:
+                up_to_date = self.manifest.is_up_to_date(file_path)
+            except Exception as e:
+                events.put({"type": "log", "file": file_path, "index": index, "message": f"Cache check failed: {e}"})
+                up_to_date = False
+            if up_to_date:
+                events.put({"type": "log", "file": file_path, "index": index, "message": "Up to date, skipped (use force to re-export)."})
+                events.put({"type": "finished", "file": file_path, "index": index, "success": True,
+                            "status": "Skipped", "attempts": 0})
+                return
+
+        # 1. 预扫描：不开 Maya 先读一遍 .ma，注定失败的文件不用占一个 mayapy 进程
+        if self.prescan_mode and not self._is_cancelled(index):
+            from .. import ma_scanner
+            try:
+                worth_opening, messages = ma_scanner.preflight_scan(file_path, self.prescan_mode)
+            except Exception as e:
+                worth_opening, messages = True, [f"Pre-scan skipped: {e}"]
+            for message in messages:
+                events.put({"type": "log", "file": file_path, "index": index, "message": message})
+            if not worth_opening:
+                events.put({"type": "finished", "file": file_path, "index": index, "success": False,
+                            "status": "Rejected", "attempts": 0})
+                return
+
+        success = False
+        attempts = 0  # 真正启动过的次数，排队时就被取消的是 0
+        for attempt in range(1, self.retries + 2):
+            # 暂停时在这里等着
+            self._resume.wait()
+            if self._is_cancelled(index):
+                break
+
+            attempts = attempt
+            events.put({"type": "started", "file": file_path, "index": index, "attempt": attempt})
+            if not self.python_exe:
+                events.put({"type": "log", "file": file_path, "index": index, "message": "Error: mayapy not found! Set config.MAYAPY_PATH."})
+                break
+            try:
+                success = self._run_once(file_path, index, events)
+            except Exception as e:
+                events.put({"type": "log", "file": file_path, "index": index, "message": f"Worker error: {e}"})
+                success = False
+            if success or self._is_cancelled(index):
+                break
+            if attempt <= self.retries:
+                events.put({"type": "log", "file": file_path, "index": index, "message": f"Retrying ({attempt}/{self.retries})..."})
+
+        if success:
+            status = "Success"
+            if self.manifest:
+                try:
+                    self.manifest.record(file_path)
+                except Exception as e:
+                    events.put({"type": "log", "file": file_path, "index": index, "message": f"Cache update failed: {e}"})
+        elif self._is_cancelled(index):
+            status = "Cancelled"
+        else:
+            status = "Failed"
+        events.put({"type": "finished", "file": file_path, "index": index, "success": success,
+                    "status": status, "attempts": attempts})
+
+    def _run_once(self, file_path, index, events):
+        proc = subprocess.Popen(
+            self._build_command(file_path),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=self._build_env(),
+            universal_newlines=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        with self._lock:
+            self._procs[index] = proc
+        # 刚启动就被取消的情况 (cancel 时还没登记进 _procs)
+        if self._is_cancelled(index):
+            proc.kill()
+
+        # 超时就直接杀进程，readline 会随之返回
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(self.timeout, _kill) if self.timeout else None
+        if timer:
+            timer.start()
+
+        result = None
+        tail = []  # 非事件输出只保留最后几行，进程崩溃时方便排查
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line.startswith(EVENT_PREFIX):
+                    try:
+                        event = json.loads(line[len(EVENT_PREFIX):])
+                    except ValueError:
+                        continue
+                    if event.get("type") == "log":
+                        events.put({"type": "log", "file": file_path, "index": index, "message": event.get("message", "")})
+                    elif event.get("type") == "result":
+                        result = bool(event.get("success"))
+                elif line.strip():
+                    tail = (tail + [line])[-10:]
+            proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            with self._lock:
+                self._procs.pop(index, None)
+
+        if self._is_cancelled(index):
+            events.put({"type": "log", "file": file_path, "index": index, "message": "Cancelled."})
+            return False
+
+        if timed_out.is_set():
+            events.put({"type": "log", "file": file_path, "index": index, "message": f"Timeout after {self.timeout}s, worker killed."})
+            return False
+
+        if result is None:
+            events.put({"type": "log", "file": file_path, "index": index, "message": f"Worker exited without result (code {proc.returncode})."})
+            for line in tail:
+                events.put({"type": "log", "file": file_path, "index": index, "message": f"  {line}"})
+            return False
+
+        return result
+
+
+def main(argv=None):
+    """
+    命令行入口 (比如夜间批量重导)：
+        mayapy -m my_tool.core.exporters.batch_runner --type Animation --output D:/exports D:/anims
+    参数可以是文件，也可以是文件夹 (取里面的 .ma/.mb)。
+    """
+    parser = argparse.ArgumentParser(description="Parallel FBX batch export")
+    parser.add_argument("sources", nargs="+", help="Maya files or folders")
+    parser.add_argument("--type", default="Model", choices=["Model", "Animation"])
+    parser.add_argument("--output", required=True, help="Output directory")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--timeout", type=int, default=None)
+    parser.add_argument("--retries", type=int, default=None)
+    parser.add_argument("--force", action="store_true", help="Ignore the export cache and re-export everything")
+    parser.add_argument("--no-prescan", action="store_true", help="Do not pre-scan .ma files before opening them")
+    args = parser.parse_args(argv)
+
+    files = []
+    for source in args.sources:
+        if os.path.isdir(source):
+            files.extend(sorted(glob.glob(os.path.join(source, "*.ma")) + glob.glob(os.path.join(source, "*.mb"))))
+        else:
+            files.append(source)
+    files = [f.replace("\\", "/") for f in files]
+
+    if not os.path.exists(args.output):
+        os.makedirs(args.output)
+
+    runner = BatchExportRunner(args.type, args.output, workers=args.workers, timeout=args.timeout,
+                               retries=args.retries, force=args.force, prescan=not args.no_prescan)
+
+    success_count = 0
+    total = 0
+    for event in runner.iter_events(files):
+        if event["type"] == "log":
+            print(f"[{os.path.basename(event['file'])}] {event['message']}")
+        elif event["type"] == "finished":
+            print(f"[{os.path.basename(event['file'])}] {event['status']}")
+        elif event["type"] == "done":
+            success_count, total = event["success"], event["total"]
+
+    print(f"=== Batch Complete. Success: {success_count}/{total} ===")
+    return 0 if success_count == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# my_tool/core/exporters/export_cache.py
+"""
+增量导出缓存 (Export Manifest)。
+在输出目录旁边存一个 .export_manifest.json，记录每个源文件上次导出时的：
+    - 文件大小 / 修改时间 (快速判断)
+    - 内容哈希 (大小或时间变了才重新算)
+    - 导出设置签名 (导出器类、FBX 选项、TARGET_FPS、该模式的 CHECK_LIST)
+源文件和设置都没变、输出文件也都还在，就可以跳过这次导出。
+"""
+import os
+import io
+import json
+import time
+import hashlib
+import threading
+
+from .export_types import get_export_type
+
+MANIFEST_FILE_NAME = ".export_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def hash_file(path, chunk_size=4 * 1024 * 1024):
+    """分块读取计算 sha1，大文件也不会一次塞进内存"""
+    sha = hashlib.sha1()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def build_settings(export_type):
+    """
+    导出结果依赖的所有设置。任何一项变了，旧的输出都作废。
+    """
+    from ... import config
+    from ..checks.registry import check_id
+
+    # 只读元数据，不 import 导出器 / 检查项 (它们依赖 Maya，这里在普通 Python 的父进程里跑)
+    spec = get_export_type(export_type)
+
+    return {
+        "exporter": spec.exporter_id,
+        "fbx_options": list(spec.fbx_options),
+        "target_fps": config.TARGET_FPS,
+        "output_name": [config.EXPORT_NAME_TEMPLATE, config.EXPORT_NAME_PATTERN],
+        "checks": [check_id(name) for name in config.CHECK_LIST.get(spec.check_mode, [])],
+    }
+
+
+def settings_signature(settings):
+    data = json.dumps(settings, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(data).hexdigest()
+
+
+class ExportManifest:
+    """
+    用法：
+        manifest = ExportManifest(out_dir, "Animation")
+        if manifest.is_up_to_date(src):   # 跳过
+            ...
+        manifest.record(src)              # 导出成功后登记
+    多个线程可以同时调用 (内部有锁)，每次 record 都会落盘。
+    """
+
+    def __init__(self, output_dir, export_type, settings=None):
+        self.output_dir = output_dir
+        self.export_type = export_type
+        self.path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+
+        self.settings = settings if settings is not None else build_settings(export_type)
+        self.signature = settings_signature(self.settings)
+
+        self._lock = threading.Lock()
+        self.entries = {}
+        self.load()
+
+    # ----------------------------------------------------------------
+    # 读写
+    # ----------------------------------------------------------------
+    def load(self):
+        self.entries = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with io.open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error loading export manifest: {e}")
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        data = {"version": MANIFEST_VERSION, "entries": self.entries}
+        # 先写临时文件再替换，写到一半崩了也不会留下坏掉的 manifest
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with io.open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Error saving export manifest: {e}")
+
+    @staticmethod
+    def _key(source_path):
+        return os.path.normcase(os.path.abspath(source_path)).replace("\\", "/")
+
+    # ----------------------------------------------------------------
+    # 查询 / 登记
+    # ----------------------------------------------------------------
+    def is_up_to_date(self, source_path):
+        """源文件、导出设置、输出文件都没变 -> True"""
+        key = self._key(source_path)
+        with self._lock:
+            entry = self.entries.get(key)
+        if not entry or not os.path.exists(source_path):
+            return False
+
+        # 1. 设置变了 (包括 CHECK_LIST / TARGET_FPS)
+        if entry.get("settings") != self.signature:
+            return False
+
+        # 2. 输出被删了
+        outputs = get_export_type(self.export_type).output_paths(source_path, self.output_dir)
+        if not all(os.path.exists(p) for p in outputs):
+            return False
+
+        # 3. 快速路径：大小和修改时间都没变，不读文件内容
+        stat = os.stat(source_path)
+        if stat.st_size == entry.get("size") and stat.st_mtime == entry.get("mtime"):
+            return True
+
+        # 4. 慢路径：算哈希 (比如文件被拷贝过，时间变了但内容没变)
+        if stat.st_size != entry.get("size"):
+            return False
+        if hash_file(source_path) != entry.get("hash"):
+            return False
+
+        # 内容没变，顺手刷新一下时间，下次走快速路径
+        with self._lock:
+            entry["mtime"] = stat.st_mtime
+            self.save()
+        return True
+
+    def record(self, source_path):
+        """导出成功后调用"""
+        stat = os.stat(source_path)
+        entry = {
+            "source": source_path.replace("\\", "/"),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "hash": hash_file(source_path),
+            "settings": self.signature,
+            "exporter": self.settings["exporter"],
+            "target_fps": self.settings["target_fps"],
+            "exported_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with self._lock:
+            self.entries[self._key(source_path)] = entry
+            self.save()
+
+    def invalidate(self, source_path=None):
+        """手动作废某个文件 (None = 全部)"""
+        with self._lock:
+            if source_path is None:
+                self.entries = {}
+            else:
+                self.entries.pop(self._key(source_path), None)
+            self.save()
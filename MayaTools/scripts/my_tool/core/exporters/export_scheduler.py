@@ -0,0 +1,100 @@
+# my_tool/core/exporters/export_scheduler.py
+"""
+导出任务调度器：在 QThread 里驱动 BatchExportRunner，UI 线程只接信号。
+这样打开文件、烘焙这些重活都在 mayapy 进程里，Maya 界面全程不卡。
+"""
+try:
+    from PySide2 import QtCore
+except ImportError:
+    from PySide6 import QtCore
+
+from ..signals import ExportSignals
+from .batch_runner import BatchExportRunner
+
+
+class ExportJob:
+    """一个文件 = 一个任务"""
+
+    def __init__(self, index, file_path):
+        self.index = index
+        self.file_path = file_path
+        self.status = "Queued"  # Queued, Running, Success, Skipped, Rejected, Failed, Cancelled
+        self.attempts = 0
+        self.log = []
+
+
+class ExportScheduler(QtCore.QThread):
+    """
+    用法：
+        scheduler = ExportScheduler("Model", out_dir, files, workers=4)
+        scheduler.signals.job_status_changed.connect(...)
+        scheduler.start()
+
+    运行期间可以 enqueue() 追加文件、pause()/resume()、cancel_job()/cancel()。
+    """
+
+    def __init__(self, export_type, output_dir, files, workers=None, timeout=None, retries=None, force=False,
+                 parent=None):
+        super().__init__(parent)
+        self.signals = ExportSignals()
+        self.runner = BatchExportRunner(export_type, output_dir, workers=workers, timeout=timeout, retries=retries,
+                                        force=force)
+
+        self._initial_files = list(files)
+        self.jobs = {}  # index -> ExportJob
+
+    # ----------------------------------------------------------------
+    # 控制接口 (UI 线程调用)
+    # ----------------------------------------------------------------
+    def enqueue(self, file_path):
+        """追加文件；批次已经结束返回 False"""
+        return self.runner.submit(file_path) is not None
+
+    def pause(self):
+        self.runner.pause()
+
+    def resume(self):
+        self.runner.resume()
+
+    def is_paused(self):
+        return self.runner.is_paused()
+
+    def cancel_job(self, index):
+        self.runner.cancel(index)
+
+    def cancel(self):
+        self.runner.cancel()
+
+    # ----------------------------------------------------------------
+    # 后台线程
+    # ----------------------------------------------------------------
+    def run(self):
+        finished = 0
+        for event in self.runner.iter_events(self._initial_files):
+            kind = event["type"]
+
+            if kind == "done":
+                self.signals.batch_finished.emit(event["success"], event["total"])
+                continue
+
+            index = event["index"]
+
+            if kind == "queued":
+                self.jobs[index] = ExportJob(index, event["file"])
+                self.signals.job_queued.emit(index, event["file"])
+                self.signals.progress.emit(finished, len(self.jobs))
+                continue
+
+            job = self.jobs[index]
+            if kind == "started":
+                job.status = "Running"
+                job.attempts = event["attempt"]
+                self.signals.job_status_changed.emit(index, job.status, job.attempts)
+            elif kind == "log":
+                job.log.append(event["message"])
+                self.signals.job_log.emit(index, event["message"])
+            elif kind == "finished":
+                job.status = event["status"]
+                finished += 1
+                self.signals.job_status_changed.emit(index, job.status, job.attempts)
+                self.signals.progress.emit(finished, len(self.jobs))
@@ -0,0 +1,89 @@
+# my_tool/core/exporters/export_types.py
+"""
+导出类型的元数据 (不依赖 Maya)。
+批量导出的父进程 (batch_runner / export_cache / 预扫描) 只需要知道：
+    用哪个检查模式、FBX 设置是什么、导出器是谁、会输出哪些文件
+这些都放在这里，父进程不用 import 导出器 (导出器会 import maya.cmds / maya.mel)。
+导出器类自己也从这里取，两边不会对不上。
+"""
+import os
+
+from ..name_template import NameTemplate
+
+# FBX 设置 (使用 MEL，因为 cmds.file 的 options 字符串太难拼)
+# 写成数据而不是散落的 mel.eval，导出缓存 (export_cache) 才能判断设置有没有变
+BASE_FBX_OPTIONS = (
+    # 1. 几何体
+    "FBXExportSmoothingGroups -v true",
+    "FBXExportSmoothMesh -v true",
+    "FBXExportTriangulate -v false",  # 引擎通常自己会三角化，Maya这边保持四边面更干净
+    # 2. 动画 (子类可以在 process_logic 里覆盖这个设置)
+    "FBXExportBakeComplexAnimation -v false",
+    # 3. 杂项
+    "FBXExportUpAxis y",  # 引擎通常是 Y-Up (Unity) 或 Z-Up (Unreal)，需根据项目配置
+    "FBXExportScaleFactor 1.0",
+)
+
+# 针对动画导出，我们需要特殊的 FBX 设置
+ANIM_FBX_OPTIONS = (
+    # 1. 几何体设置 (保持平滑组)
+    "FBXExportSmoothingGroups -v true",
+    "FBXExportSmoothMesh -v true",
+    # 2. 动画设置
+    # 我们已经手动 Bake 过了，所以关掉 FBX 自带的 Bake
+    "FBXExportBakeComplexAnimation -v false",
+    # 只导动画？不，通常游戏引擎需要骨骼结构，所以保持默认
+    "FBXExportAnimationOnly -v false",
+    # 关掉输入连接 (防止把约束节点导出去)
+    "FBXExportInputConnections -v false",
+    # 3. 轴向 (根据引擎需求，Unity=Y, Unreal=Z)
+    "FBXExportUpAxis y",
+)
+
+
+class ExportType:
+    """
+    一种导出类型。
+        exporter   : 导出器类 ("模块.类名"，相对这个包)，worker 里才 import
+        check_mode : 预检查读取 config.CHECK_LIST 里的哪个模式
+        sidecars   : FBX 之外还会写的文件扩展名 (Run.fbx -> Run.json)
+    """
+
+    def __init__(self, name, exporter, check_mode, fbx_options, sidecars=()):
+        self.name = name
+        self.exporter = exporter
+        self.check_mode = check_mode
+        self.fbx_options = fbx_options
+        self.sidecars = sidecars
+
+    @property
+    def exporter_id(self):
+        """导出器的完整路径 (和类的 __module__.__name__ 一致)"""
+        return f"{__package__}.{self.exporter}"
+
+    def output_name(self, name):
+        """按 config.EXPORT_NAME_TEMPLATE 生成输出文件名 (不带扩展名)，没配置或匹配不上就用原名"""
+        from ... import config
+        if not config.EXPORT_NAME_TEMPLATE:
+            return name
+        template = NameTemplate(config.EXPORT_NAME_TEMPLATE, config.EXPORT_NAME_PATTERN, tokens=("name", "mode"))
+        return template.format(name, mode=self.check_mode or "") or name
+
+    def output_paths(self, file_path, output_dir):
+        """这个文件会导出哪些文件。第一个永远是 FBX，后面是 sidecar"""
+        name_no_ext = self.output_name(os.path.splitext(os.path.basename(file_path))[0])
+        fbx_path = os.path.join(output_dir, f"{name_no_ext}.fbx").replace("\\", "/")
+        base = os.path.splitext(fbx_path)[0]
+        return [fbx_path] + [f"{base}{ext}" for ext in self.sidecars]
+
+
+EXPORT_TYPES = {
+    "Model": ExportType("Model", "model_exporter.ModelExporter", "Model", BASE_FBX_OPTIONS),
+    "Animation": ExportType("Animation", "anim_exporter.AnimExporter", "Animation", ANIM_FBX_OPTIONS,
+                            sidecars=(".json",)),
+}
+
+
+def get_export_type(export_type):
+    """根据类型名取元数据 (和以前 get_exporter_class 一样，不是 Model 的都按 Animation)"""
+    return EXPORT_TYPES.get(export_type, EXPORT_TYPES["Animation"])
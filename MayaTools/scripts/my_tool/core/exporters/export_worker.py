@@ -0,0 +1,77 @@
+# my_tool/core/exporters/export_worker.py
+"""
+Headless 导出 Worker。
+由 batch_runner 用 mayapy 启动：一个进程只处理一个文件，结果通过 stdout 回传。
+
+    mayapy -m my_tool.core.exporters.export_worker --type Model --output D:/out D:/shots/run.ma
+
+stdout 里以 EVENT_PREFIX 开头的行是结构化事件 (JSON)，其余行都是 Maya 自己的输出。
+"""
+import sys
+import json
+import argparse
+import importlib
+
+from .export_types import get_export_type
+
+EVENT_PREFIX = "@@MYTOOL@@ "
+
+
+def emit(kind, **payload):
+    """往父进程发一条事件"""
+    payload["type"] = kind
+    sys.stdout.write(EVENT_PREFIX + json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+
+def get_exporter_class(export_type):
+    """根据类型选导出器类 (和 ExporterWidget 的选择逻辑一致)，导出器会 import maya，只在 worker 里调用"""
+    module_name, _, cls_name = get_export_type(export_type).exporter.rpartition(".")
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, cls_name)
+
+
+def create_exporter(export_type):
+    return get_exporter_class(export_type)()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless FBX export worker")
+    parser.add_argument("file", help="Source .ma/.mb file")
+    parser.add_argument("--type", default="Model", choices=["Model", "Animation"])
+    parser.add_argument("--output", required=True, help="Output directory")
+    args = parser.parse_args(argv)
+
+    # 1. 启动 Maya (没有 UI)
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+
+    success = False
+    try:
+        worker = create_exporter(args.type)
+
+        # 2. 把 add_log 接到事件流上，父进程就能实时看到日志
+        original_add_log = worker.add_log
+
+        def add_log(message):
+            original_add_log(message)
+            emit("log", message=message)
+
+        worker.add_log = add_log
+
+        # 3. 真正干活：Open -> Check -> Fix -> Bake -> Export
+        success = bool(worker.run(args.file, args.output))
+    except Exception as e:
+        emit("log", message=f"Worker crashed: {e}")
+    finally:
+        emit("result", success=success)
+        try:
+            maya.standalone.uninitialize()
+        except Exception:
+            pass
+
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,15 @@
 from .base_exporter import ExporterBase
+from .export_types import EXPORT_TYPES
 from ..checks import geometry_checks
 from ..checks import naming_checks
 
 class ModelExporter(ExporterBase):
+    EXPORT_TYPE = EXPORT_TYPES["Model"]
+    CHECK_MODE = EXPORT_TYPE.check_mode
+    FBX_OPTIONS = EXPORT_TYPE.fbx_options
+
     def _process_logic(self):
-        if not self.run_preflight_checks("Model"):
+        if not self.run_preflight_checks(self.CHECK_MODE):
             return False
 
         self.add_log("Checks passed. Exporting...")
@@ -0,0 +1,252 @@
+# my_tool/core/live_checker.py
+"""
+Live 检查：监听场景变化，只复查受影响的检查项和节点。
+
+1. Maya 回调 (OpenMaya MMessage) + signals.asset_renamed 把变化的节点记进 dirty 集合
+2. QTimer 防抖：一串操作 (拖动、批量改名) 结束后才统一处理一次
+3. 按事件类型挑出相关的检查项 (CheckItem.live_events)，调用 recheck(dirty 节点)
+4. 发出 results_updated(行号列表)，UI 只刷新这几行
+"""
+try:
+    from PySide2 import QtCore
+except ImportError:
+    from PySide6 import QtCore
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+from .signals import signals
+from .checks.scene_snapshot import SceneSnapshot
+from . import check_profiler
+
+DEFAULT_DEBOUNCE_MS = 300
+
+# 事件类型 (和 CheckItem.live_events 对应)
+NODE_ADDED = "node_added"
+NODE_REMOVED = "node_removed"
+RENAMED = "renamed"
+ATTRIBUTE = "attribute"
+CONNECTION = "connection"
+TIME_UNIT = "time_unit"
+PLAYBACK = "playback"
+
+
+class LiveChecker(QtCore.QObject):
+    """
+    用法：
+        live = LiveChecker(checks)
+        live.results_updated.connect(on_rows_changed)
+        live.start()
+        ...
+        live.stop()
+    checks 必须已经完整跑过一遍 (有初始结果)。
+    """
+    results_updated = QtCore.Signal(list)  # 重新检查过的检查项下标
+
+    def __init__(self, checks, debounce_ms=DEFAULT_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.checks = list(checks)
+
+        self._callback_ids = []
+        self._attr_callbacks = {}  # MObjectHandle.hashCode() -> 属性回调 id
+        self._dirty_nodes = set()
+        self._dirty_events = set()
+        self._added_handles = []  # 新建的节点：回调时还没挂到父级下面，路径等 flush 时再取
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.flush)
+
+    # ----------------------------------------------------------------
+    # 开关
+    # ----------------------------------------------------------------
+    def is_running(self):
+        return bool(self._callback_ids)
+
+    def start(self):
+        if self.is_running():
+            return
+        ids = self._callback_ids
+        ids.append(om.MDGMessage.addNodeAddedCallback(self._on_node_added, "dependNode"))
+        ids.append(om.MDGMessage.addNodeRemovedCallback(self._on_node_removed, "dependNode"))
+        # kNullObj = 监听所有节点的改名
+        ids.append(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, self._on_name_changed))
+        ids.append(om.MDGMessage.addConnectionCallback(self._on_connection))
+        # 改父级 (parent / unparent) 也会改变长路径
+        ids.append(om.MDagMessage.addAllDagChangesCallback(self._on_dag_changed))
+        ids.append(om.MEventMessage.addEventCallback("timeUnitChanged", self._on_event, TIME_UNIT))
+        ids.append(om.MEventMessage.addEventCallback("playbackRangeChanged", self._on_event, PLAYBACK))
+        signals.asset_renamed.connect(self._on_asset_renamed)
+
+        self._watch_scene()
+
+    def stop(self):
+        self._timer.stop()
+        self._remove_attribute_callbacks()
+        if self._callback_ids:
+            om.MMessage.removeCallbacks(self._callback_ids)
+            self._callback_ids = []
+            try:
+                signals.asset_renamed.disconnect(self._on_asset_renamed)
+            except (RuntimeError, TypeError):
+                pass
+        self._dirty_nodes.clear()
+        self._dirty_events.clear()
+        self._added_handles = []
+
+    def _watch_scene(self):
+        """
+        属性变化只能按节点注册：盯住检查项关心的节点 (mesh 的 transform / shape、动画曲线)。
+        start() 时整个场景注册一遍；之后新建的节点在 flush 里补 (_watch_added)，
+        删掉的节点在回调里注销 (_unwatch_node)，不再每次增删节点都整场景重来。
+        """
+        self._remove_attribute_callbacks()
+        snapshot = SceneSnapshot()
+        nodes = list(snapshot.mesh_transforms)
+        nodes.extend(path for path, node_type in snapshot.node_types.items() if node_type == "mesh")
+        nodes.extend(cmds.ls(type="animCurve") or [])
+
+        sel = om.MSelectionList()
+        for node in nodes:
+            try:
+                sel.add(node)
+            except RuntimeError:
+                continue
+        for i in range(sel.length()):
+            self._watch_node(sel.getDependNode(i))
+
+    def _watch_added(self, handles):
+        """新建的 mesh (连同它的 transform) 和动画曲线补注册属性回调"""
+        for handle in handles:
+            if not handle.isValid():
+                continue  # 建完又被删掉了
+            node = handle.object()
+            if node.hasFn(om.MFn.kMesh):
+                self._watch_node(node)
+                dag_fn = om.MFnDagNode(node)
+                for i in range(dag_fn.parentCount()):
+                    self._watch_node(dag_fn.parent(i))
+            elif node.hasFn(om.MFn.kAnimCurve):
+                self._watch_node(node)
+
+    def _watch_node(self, node):
+        key = om.MObjectHandle(node).hashCode()
+        if key not in self._attr_callbacks:
+            self._attr_callbacks[key] = om.MNodeMessage.addAttributeChangedCallback(node, self._on_attribute_changed)
+
+    def _unwatch_node(self, node):
+        callback_id = self._attr_callbacks.pop(om.MObjectHandle(node).hashCode(), None)
+        if callback_id is not None:
+            om.MMessage.removeCallback(callback_id)
+
+    def _remove_attribute_callbacks(self):
+        if self._attr_callbacks:
+            om.MMessage.removeCallbacks(list(self._attr_callbacks.values()))
+            self._attr_callbacks = {}
+
+    # ----------------------------------------------------------------
+    # 回调 (只记录，不做检查；Maya 回调里不能干重活)
+    # ----------------------------------------------------------------
+    def _mark(self, event, paths=()):
+        self._dirty_events.add(event)
+        self._dirty_nodes.update(paths)
+        self._timer.start()  # 重新计时 = 防抖
+
+    @staticmethod
+    def _paths_of(node):
+        """MObject -> 长路径 (DAG 节点的所有实例 + shape 的父 transform)"""
+        if not node.hasFn(om.MFn.kDagNode):
+            return [om.MFnDependencyNode(node).name()]
+        paths = []
+        for dag_path in om.MDagPath.getAllPathsTo(node):
+            path = dag_path.fullPathName()
+            paths.append(path)
+            if node.hasFn(om.MFn.kShape):
+                paths.append(path.rsplit("|", 1)[0])
+        return paths
+
+    def _on_node_added(self, node, client_data):
+        self._added_handles.append(om.MObjectHandle(node))
+        self._mark(NODE_ADDED)
+
+    def _on_node_removed(self, node, client_data):
+        try:
+            self._unwatch_node(node)
+            self._mark(NODE_REMOVED, self._paths_of(node))
+        except Exception as e:
+            print(f"LiveChecker: {e}")
+
+    def _on_name_changed(self, node, previous_name, client_data):
+        try:
+            paths = self._paths_of(node)
+            # 旧名字的长路径 = 新路径把最后一段换回去
+            paths.extend(f"{path.rsplit('|', 1)[0]}|{previous_name}" for path in list(paths) if "|" in path)
+            self._mark(RENAMED, paths)
+        except Exception as e:
+            print(f"LiveChecker: {e}")
+
+    def _on_dag_changed(self, msg, child, parent, client_data):
+        try:
+            paths = [child.fullPathName()]
+            # 挂上/移出的那个父级下面的路径 (移出时就是旧路径)
+            paths.append(f"{parent.fullPathName()}|{om.MFnDagNode(child).name()}")
+            self._mark(RENAMED, paths)
+        except Exception as e:
+            print(f"LiveChecker: {e}")
+
+    def _on_asset_renamed(self, old_name, new_name):
+        # 工具自己发的改名信号：带着完整的旧路径，比 Maya 回调的短名准
+        self._mark(RENAMED, [old_name, new_name])
+
+    def _on_connection(self, src_plug, dst_plug, made, client_data):
+        try:
+            self._mark(CONNECTION, self._paths_of(src_plug.node()) + self._paths_of(dst_plug.node()))
+        except Exception as e:
+            print(f"LiveChecker: {e}")
+
+    def _on_attribute_changed(self, msg, plug, other_plug, client_data):
+        # 只关心 setAttr (手动修改、拖动操纵器)，不管每帧的求值
+        if not msg & om.MNodeMessage.kAttributeSet:
+            return
+        try:
+            self._mark(ATTRIBUTE, self._paths_of(plug.node()))
+        except Exception as e:
+            print(f"LiveChecker: {e}")
+
+    def _on_event(self, client_data):
+        self._mark(client_data)
+
+    # ----------------------------------------------------------------
+    # 防抖结束：统一复查
+    # ----------------------------------------------------------------
+    def flush(self):
+        events, self._dirty_events = self._dirty_events, set()
+        nodes, self._dirty_nodes = self._dirty_nodes, set()
+        handles, self._added_handles = self._added_handles, []
+        if not events:
+            return
+
+        # 新建的节点现在已经在最终的位置上了 (建完又被删掉的直接忽略)
+        for handle in handles:
+            if handle.isValid():
+                nodes.update(self._paths_of(handle.object()))
+
+        # 这一轮所有相关检查项共用一个新快照 (场景已经变了)
+        snapshot = SceneSnapshot()
+        updated = []
+        for row, item in enumerate(self.checks):
+            if item.live_events is not None and not events.intersection(item.live_events):
+                continue
+            try:
+                check_profiler.profiled(item, "check", item.recheck, nodes, snapshot)
+            except Exception as e:
+                print(f"LiveChecker: {item.label} failed: {e}")
+                continue
+            updated.append(row)
+
+        # 新节点也要盯住属性变化 (删掉的节点在 _on_node_removed 里已经注销了)
+        self._watch_added(handles)
+
+        if updated:
+            self.results_updated.emit(updated)
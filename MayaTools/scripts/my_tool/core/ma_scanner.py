@@ -0,0 +1,342 @@
+# my_tool/core/ma_scanner.py
+"""
+Maya ASCII (.ma) 扫描器：不开 Maya，直接读文本。
+用来在批量导出前快速分拣文件 (FPS 不对、有 Unknown 节点、重名……)，
+几百个文件几秒钟就能过一遍，只把值得打开的文件交给 Maya。
+
+全部是生成器 + 逐行读取，大文件也不会一次读进内存。
+只支持 .ma；.mb 是二进制格式，扫描器直接跳过。
+"""
+import io
+import shlex
+
+# 这些节点类型出现在文件里就说明有 Unknown 节点 (对应 UnknownNodeCheck)
+UNKNOWN_NODE_TYPES = {"unknown", "unknownDag", "unknownTransform"}
+
+# 会被 cmds.ls(type="transform") 列出来的常见类型 (对应 DuplicateNameCheck)
+# .ma 里没有类型继承信息，只能按名字近似：这里的类型 + 所有 xxxConstraint
+TRANSFORM_NODE_TYPES = {"transform", "joint", "ikHandle", "ikEffector", "place3dTexture", "lookAt",
+                        "hikIKEffector", "hikFKJoint"}
+
+# 预扫描能离线判断的检查项：类名 -> (界面上的名字, 扫出问题时是否直接拦下)
+# 要和检查项类上的 label / is_fixable / is_critical 对得上。检查项类依赖 maya.cmds，
+# 批量导出的父进程 (普通 Python) 不能 import，只能在这里抄一份
+#   FPS、Unknown 节点能自动修复，只记录；重名不可修复而且是致命的，拦下
+PRESCAN_CHECKS = {
+    "FPSCheck": ("FPS Setting Check", False),
+    "UnknownNodeCheck": ("Unknown Nodes Check", False),
+    "DuplicateNameCheck": ("Duplicate Names Check", True),
+}
+
+# 我们关心的语句，其余 (setAttr / connectAttr ...) 只找结尾，不解析
+_HEADER_COMMANDS = {"requires", "currentUnit", "fileInfo", "createNode"}
+
+
+class MaNode:
+    """一条 createNode 语句"""
+
+    def __init__(self, node_type, name, parent=None, path=None):
+        self.node_type = node_type
+        self.name = name
+        self.parent = parent  # -p 参数原文 (可能是短名，也可能是 |a|b 长路径)
+        self.path = path  # 推算出的 DAG 长路径 (非 DAG 节点就是名字本身)
+
+    def is_transform(self):
+        return self.node_type in TRANSFORM_NODE_TYPES or self.node_type.endswith("Constraint")
+
+    def __repr__(self):
+        return f"MaNode({self.node_type!r}, {self.path!r})"
+
+
+class MaSceneSummary:
+    """scan_scene() 的结果"""
+
+    def __init__(self, path):
+        self.path = path
+        self.maya_version = ""
+        self.units = {}  # {"linear": "centimeter", "angle": "degree", "time": "film"}
+        self.requires = []  # [{"plugin": "mtoa", "version": "5.0", "node_types": [...]}]
+        self.file_info = {}
+        self.nodes = []  # [MaNode]
+        self.playback = {}  # {"min": 1.0, "max": 120.0, "ast": ..., "aet": ...}
+
+    @property
+    def time_unit(self):
+        # 没写 -t 的文件是 Maya 默认的 film
+        return self.units.get("time", "film")
+
+    def nodes_of_type(self, *node_types):
+        return [n for n in self.nodes if n.node_type in node_types]
+
+    def unknown_nodes(self):
+        return [n for n in self.nodes if n.node_type in UNKNOWN_NODE_TYPES]
+
+    def duplicate_transform_names(self):
+        """短名重复的 transform 长路径列表 (DuplicateNameCheck 的离线版)"""
+        by_short = {}
+        for node in self.nodes:
+            if node.is_transform():
+                by_short.setdefault(node.name, []).append(node.path)
+        return [p for paths in by_short.values() if len(paths) > 1 for p in paths]
+
+
+# ----------------------------------------------------------------
+# 1. 语句切分
+# ----------------------------------------------------------------
+def _find_statement_end(line, pos, in_string):
+    """
+    从 pos 开始找语句结尾的 ';' (忽略字符串里的)。
+    返回 (';' 的位置 或 -1, 行尾时是否还在字符串里)
+    """
+    n = len(line)
+    while pos < n:
+        if in_string:
+            q = line.find('"', pos)
+            if q < 0:
+                return -1, True
+            # 数一下前面的反斜杠，\" 是转义不是结尾
+            k = q - 1
+            while k >= 0 and line[k] == "\\":
+                k -= 1
+            if (q - 1 - k) % 2 == 0:
+                in_string = False
+            pos = q + 1
+        else:
+            s = line.find(";", pos)
+            q = line.find('"', pos)
+            if s >= 0 and (q < 0 or s < q):
+                return s, False
+            if q < 0:
+                return -1, False
+            in_string = True
+            pos = q + 1
+    return -1, in_string
+
+
+def iter_statements(path, commands=None):
+    """
+    逐条产出顶层 MEL 语句 (command, text)。
+    commands 不为空时，只有这些命令会带上完整文本，其余语句的 text 是 None (省掉拼接大块数据的开销)。
+    """
+    with io.open(path, "r", encoding="utf-8", errors="replace") as f:
+        command = None
+        parts = None  # 当前语句的文本片段；不需要文本时为 None
+        in_string = False
+
+        for line in f:
+            pos = 0
+            while True:
+                if command is None:
+                    # 新语句开始
+                    stripped = line[pos:].lstrip()
+                    if not stripped or stripped.startswith("//"):
+                        break
+                    pos = len(line) - len(stripped)
+                    command = stripped.split(None, 1)[0].rstrip(";")
+                    want = commands is None or command in commands
+                    parts = [] if want else None
+
+                end, in_string = _find_statement_end(line, pos, in_string)
+                if end < 0:
+                    if parts is not None:
+                        parts.append(line[pos:])
+                    break
+
+                text = None
+                if parts is not None:
+                    parts.append(line[pos:end])
+                    text = "".join(parts).strip()
+                yield command, text
+                command = None
+                parts = None
+                pos = end + 1
+
+
+def tokenize(text):
+    """把一条语句拆成参数列表，字符串里的转义按 MEL 规则处理"""
+    lexer = shlex.shlex(text, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    return list(lexer)
+
+
+def _flag_value(tokens, *flags):
+    for i, token in enumerate(tokens[:-1]):
+        if token in flags:
+            return tokens[i + 1]
+    return None
+
+
+# ----------------------------------------------------------------
+# 2. 解析
+# ----------------------------------------------------------------
+def iter_nodes(path):
+    """只产出 createNode 节点 (带推算好的 DAG 长路径)"""
+    paths_by_name = {}  # 短名 -> 最近一次创建的长路径 (Maya 写文件时 -p 用的就是当时唯一的名字)
+
+    for command, text in iter_statements(path, commands={"createNode"}):
+        if command != "createNode":
+            continue
+        node = _parse_create_node(tokenize(text), paths_by_name)
+        if node:
+            yield node
+
+
+def _parse_create_node(tokens, paths_by_name):
+    # createNode transform -s -n "persp" -p "|group1";
+    if len(tokens) < 2:
+        return None
+    node_type = tokens[1]
+    name = _flag_value(tokens, "-n", "-name") or node_type
+    parent = _flag_value(tokens, "-p", "-parent")
+
+    if parent:
+        parent_path = parent if parent.startswith("|") else paths_by_name.get(parent, f"|{parent}")
+        path = f"{parent_path}|{name}"
+    elif node_type in TRANSFORM_NODE_TYPES or node_type.endswith("Constraint"):
+        path = f"|{name}"
+    else:
+        path = name
+
+    paths_by_name[name] = path
+    return MaNode(node_type, name, parent, path)
+
+
+def scan_scene(path):
+    """读完整个文件，返回 MaSceneSummary"""
+    summary = MaSceneSummary(path)
+    paths_by_name = {}
+    in_scene_config = False  # 当前是不是 sceneConfigurationScriptNode (里面存着 playbackOptions)
+
+    # select 只是用来打断 "当前节点" (select -ne :time1; 后面的 setAttr 属于 time1)
+    # setAttr 只在 sceneConfigurationScriptNode 下面才需要文本，其余的 (网格顶点之类的大块数据) 不拼接
+    wanted = _HEADER_COMMANDS | {"select"}
+    for command, text in iter_statements(path, commands=wanted):
+        if command == "createNode":
+            node = _parse_create_node(tokenize(text), paths_by_name)
+            if node:
+                summary.nodes.append(node)
+                in_scene_config = node.name == "sceneConfigurationScriptNode"
+                # iter_statements 每条语句开始时才查 commands，这里改集合下一条就生效
+                if in_scene_config:
+                    wanted.add("setAttr")
+                else:
+                    wanted.discard("setAttr")
+            continue
+
+        if command == "setAttr":
+            # 只关心 sceneConfigurationScriptNode 的 .b 属性
+            if in_scene_config and text and '".b"' in text:
+                _parse_playback(tokenize(text), summary)
+            continue
+
+        if text is None:
+            # rename / addAttr 之类的语句仍然属于上一个节点，不用解析
+            continue
+
+        # 其它顶层命令 (requires / select / ...) 之后的 setAttr 不再属于上一个节点
+        in_scene_config = False
+        wanted.discard("setAttr")
+        tokens = tokenize(text)
+
+        if command == "requires":
+            _parse_requires(tokens, summary)
+        elif command == "currentUnit":
+            for flag, key in (("-l", "linear"), ("-a", "angle"), ("-t", "time")):
+                value = _flag_value(tokens, flag)
+                if value:
+                    summary.units[key] = value
+        elif command == "fileInfo" and len(tokens) >= 3:
+            summary.file_info[tokens[1]] = tokens[2]
+
+    return summary
+
+
+def _parse_requires(tokens, summary):
+    # requires maya "2024";
+    # requires -nodeType "aiOptions" -nodeType "aiAOV" "mtoa" "5.3.0";
+    node_types = []
+    args = []
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        if token in ("-nodeType", "-dataType") and i + 1 < len(tokens):
+            if token == "-nodeType":
+                node_types.append(tokens[i + 1])
+            i += 2
+            continue
+        args.append(token)
+        i += 1
+
+    if not args:
+        return
+    plugin = args[0]
+    version = args[1] if len(args) > 1 else ""
+    if plugin == "maya":
+        summary.maya_version = version
+    else:
+        summary.requires.append({"plugin": plugin, "version": version, "node_types": node_types})
+
+
+def _parse_playback(tokens, summary):
+    # setAttr ".b" -type "string" "playbackOptions -min 1 -max 120 -ast 1 -aet 200 ";
+    script = tokens[-1] if tokens else ""
+    if "playbackOptions" not in script:
+        return
+    words = script.split()
+    for flag, key in (("-min", "min"), ("-max", "max"), ("-ast", "ast"), ("-aet", "aet")):
+        value = _flag_value(words, flag)
+        if value is not None:
+            try:
+                summary.playback[key] = float(value)
+            except ValueError:
+                pass
+
+
+# ----------------------------------------------------------------
+# 3. 导出前分拣
+# ----------------------------------------------------------------
+def preflight_scan(path, mode):
+    """
+    按 config.CHECK_LIST[mode] 里的检查项，用扫描结果提前判断。
+    返回 (是否值得打开, 消息列表)。
+    能自动修复的问题 (FPS、Unknown 节点) 只记录不拦截，和 run_preflight_checks 的行为一致；
+    不可修复的致命问题 (重名) 直接拦下，不浪费一个 Maya 进程。
+    .mb 文件无法扫描，永远返回 True。
+    只读 config 和 PRESCAN_CHECKS，不 import 检查项 (批量导出的父进程里没有 Maya)。
+    """
+    from .. import config
+
+    if not path.lower().endswith(".ma"):
+        return True, []
+
+    summary = scan_scene(path)
+    messages = []
+    ok = True
+
+    for check_name in config.CHECK_LIST.get(mode, []):
+        name = check_name.rpartition(".")[2]
+        if name not in PRESCAN_CHECKS:
+            continue
+        label, reject = PRESCAN_CHECKS[name]
+        failed = None
+
+        if name == "FPSCheck" and summary.time_unit != config.TARGET_FPS:
+            failed = f"FPS is {summary.time_unit}, expected {config.TARGET_FPS}"
+        elif name == "UnknownNodeCheck" and summary.unknown_nodes():
+            failed = f"{len(summary.unknown_nodes())} unknown nodes"
+        elif name == "DuplicateNameCheck":
+            duplicates = summary.duplicate_transform_names()
+            if duplicates:
+                failed = f"{len(duplicates)} transforms share a short name (e.g. {duplicates[0]})"
+
+        if not failed:
+            continue
+
+        if reject:
+            messages.append(f"Pre-scan: {label}: {failed} -> rejected")
+            ok = False
+        else:
+            messages.append(f"Pre-scan: {label}: {failed} (will be handled in Maya)")
+
+    return ok, messages
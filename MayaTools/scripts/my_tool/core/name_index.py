@@ -0,0 +1,284 @@
+# my_tool/core/name_index.py
+"""
+短名索引：短名 -> {长路径}，场景里所有 transform (含 joint 等子类)。
+
+以前每个要查重名/找节点的地方都自己 cmds.ls 一遍再数一遍，场景一大就很慢。
+这里只建一次，之后靠 Maya 回调增量维护：
+    - 新建节点：先记下 MObjectHandle，下次读取时再取路径 (回调时还没挂到父级下面)
+    - 删除节点 / 改父级：按旧长路径把整棵子树移掉
+    - 改名：用子节点表把整棵子树的长路径换成新前缀，不用重新查场景
+    - 打开/新建场景、加载引用：整个重建
+
+读取接口 (paths_of / duplicates / clashes ...) 都是查字典，和场景大小无关。
+没有 maya.api (比如 stub 环境) 时没法监听，退化成每次读取都重建。
+
+用法：
+    index = get_name_index()
+    index.paths_of("CTRL_Spine_01")   # {'|rig|...|CTRL_Spine_01'}
+    index.duplicates()                 # {'pCube1': ['|grp1|pCube1', '|grp2|pCube1']}
+    release_name_index()               # 关窗口 / 热重载前移除回调
+"""
+import maya.cmds as cmds
+
+_index = None
+
+
+def get_name_index():
+    """全局共享的索引 (第一次用到时建，并尝试开始监听场景)"""
+    global _index
+    if _index is None:
+        _index = ShortNameIndex()
+        _index.start_tracking()
+    return _index
+
+
+def release_name_index():
+    """
+    移除全局索引的回调并丢掉它。关窗口、热重载 (start_dev.py 删掉 sys.modules 里的 my_tool) 之前调用：
+    模块被删掉后旧索引的回调还挂在 Maya 里，每次增删改名都会白跑一遍，重载几次就叠几份。
+    """
+    global _index
+    if _index is not None:
+        _index.stop_tracking()
+        _index = None
+
+
+def short_name(path):
+    return path.rsplit("|", 1)[-1]
+
+
+class ShortNameIndex:
+    def __init__(self):
+        self._short_of = {}  # 长路径 -> 短名
+        self._by_short = {}  # 短名 -> {长路径}
+        self._children = {}  # 长路径 -> {子节点长路径} (改名/删除时按子树处理)
+        self._duplicates = set()  # 出现不止一次的短名
+
+        self._callback_ids = []
+        self._pending = {}  # 新建/改父级的节点 (hashCode -> MObjectHandle)，读取时再取路径
+        self._dirty = True
+
+    # ----------------------------------------------------------------
+    # 读取
+    # ----------------------------------------------------------------
+    def __len__(self):
+        self._sync()
+        return len(self._short_of)
+
+    def __contains__(self, path):
+        self._sync()
+        return path in self._short_of
+
+    def paths_of(self, name):
+        """短名对应的所有长路径 (返回副本)"""
+        self._sync()
+        return set(self._by_short.get(name, ()))
+
+    def find(self, name):
+        """短名唯一时返回它的长路径，不存在或有重名返回 None"""
+        paths = self.paths_of(name)
+        return next(iter(paths)) if len(paths) == 1 else None
+
+    def duplicates(self):
+        """重名的短名 -> 排好序的长路径列表"""
+        self._sync()
+        return {name: sorted(self._by_short[name]) for name in self._duplicates}
+
+    def children_of(self, parent):
+        """parent 下面的 transform 长路径 (parent 为 "" 表示顶层)"""
+        self._sync()
+        return set(self._children.get(parent, ()))
+
+    def clashes(self, name, ignore=()):
+        """改名前检查：场景里已经叫 name 的节点 (排除 ignore 里的，比如自己)"""
+        return sorted(self.paths_of(name).difference(ignore))
+
+    # ----------------------------------------------------------------
+    # 维护
+    # ----------------------------------------------------------------
+    def rebuild(self, paths=None):
+        """从头建索引 (paths 默认取场景里所有 transform)"""
+        if paths is None:
+            paths = cmds.ls(type="transform", long=True) or []
+        self._short_of = {}
+        self._by_short = {}
+        self._children = {}
+        self._duplicates = set()
+        self._pending = {}
+        for path in paths:
+            self._add_path(path)
+        self._dirty = False
+
+    def mark_dirty(self):
+        """下次读取时整个重建"""
+        self._dirty = True
+
+    def add(self, path):
+        self._add_path(path)
+
+    def remove(self, path):
+        """移除节点和它下面的整棵子树"""
+        for sub_path in self._subtree(path):
+            self._remove_path(sub_path)
+
+    def rename(self, old_path, new_path):
+        """节点改名/移动：子树里所有长路径换成新前缀"""
+        if old_path not in self._short_of:
+            self._add_path(new_path)
+            return
+        subtree = self._subtree(old_path)
+        for path in subtree:
+            self._remove_path(path)
+        for path in subtree:
+            self._add_path(new_path + path[len(old_path):])
+
+    def _sync(self):
+        if self._dirty or not self._callback_ids:
+            self.rebuild()
+        elif self._pending:
+            self._resolve_pending()
+
+    def _add_path(self, path):
+        if path in self._short_of:
+            return
+        name = short_name(path)
+        self._short_of[path] = name
+        paths = self._by_short.setdefault(name, set())
+        paths.add(path)
+        if len(paths) > 1:
+            self._duplicates.add(name)
+
+        # 顶层节点的父级记成 "" (world)
+        self._children.setdefault(path.rsplit("|", 1)[0], set()).add(path)
+
+    def _remove_path(self, path):
+        name = self._short_of.pop(path, None)
+        if name is None:
+            return
+        paths = self._by_short[name]
+        paths.discard(path)
+        if len(paths) < 2:
+            self._duplicates.discard(name)
+        if not paths:
+            del self._by_short[name]
+
+        parent = path.rsplit("|", 1)[0]
+        siblings = self._children.get(parent)
+        if siblings is not None:
+            siblings.discard(path)
+            if not siblings:
+                del self._children[parent]
+
+    def _subtree(self, path):
+        """path 和它所有后代 (父在前)，只看索引里已有的"""
+        if path not in self._short_of:
+            return []
+        result = [path]
+        for current in result:
+            result.extend(self._children.get(current, ()))
+        return result
+
+    # ----------------------------------------------------------------
+    # 场景监听 (OpenMaya 回调)
+    # ----------------------------------------------------------------
+    def is_tracking(self):
+        return bool(self._callback_ids)
+
+    def start_tracking(self):
+        """注册回调，返回是否成功 (没有 maya.api 时返回 False，之后每次读取都重建)"""
+        if self._callback_ids:
+            return True
+        try:
+            import maya.api.OpenMaya as om
+        except ImportError:
+            return False
+
+        ids = self._callback_ids
+        ids.append(om.MDGMessage.addNodeAddedCallback(self._on_node_added, "transform"))
+        ids.append(om.MDGMessage.addNodeRemovedCallback(self._on_node_removed, "transform"))
+        ids.append(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, self._on_name_changed))
+        ids.append(om.MDagMessage.addAllDagChangesCallback(self._on_dag_changed))
+        for msg in (om.MSceneMessage.kAfterNew, om.MSceneMessage.kAfterOpen,
+                    om.MSceneMessage.kAfterLoadReference, om.MSceneMessage.kAfterUnloadReference):
+            ids.append(om.MSceneMessage.addCallback(msg, self._on_scene_changed))
+        self._dirty = True
+        return True
+
+    def stop_tracking(self):
+        if not self._callback_ids:
+            return
+        import maya.api.OpenMaya as om
+        om.MMessage.removeCallbacks(self._callback_ids)
+        self._callback_ids = []
+        self._pending = {}
+
+    @staticmethod
+    def _is_transform(node):
+        import maya.api.OpenMaya as om
+        return node.hasFn(om.MFn.kTransform)
+
+    def _defer(self, node):
+        import maya.api.OpenMaya as om
+        handle = om.MObjectHandle(node)
+        self._pending[handle.hashCode()] = handle
+
+    def _resolve_pending(self):
+        import maya.api.OpenMaya as om
+        pending, self._pending = self._pending, {}
+        for handle in pending.values():
+            if not handle.isValid():
+                continue  # 建完又删掉了
+            for dag_path in om.MDagPath.getAllPathsTo(handle.object()):
+                path = dag_path.fullPathName()
+                self._add_path(path)
+                # 改父级时整棵子树一起挪过来了
+                for child in cmds.listRelatives(path, allDescendents=True, type="transform",
+                                                fullPath=True) or []:
+                    self._add_path(child)
+
+    # 回调里只改字典，不查场景
+    def _on_node_added(self, node, client_data):
+        self._defer(node)
+
+    def _on_node_removed(self, node, client_data):
+        try:
+            import maya.api.OpenMaya as om
+            for dag_path in om.MDagPath.getAllPathsTo(node):
+                self.remove(dag_path.fullPathName())
+        except Exception as e:
+            print(f"ShortNameIndex: {e}")
+            self._dirty = True
+
+    def _on_name_changed(self, node, previous_name, client_data):
+        if not self._is_transform(node):
+            return
+        try:
+            import maya.api.OpenMaya as om
+            for dag_path in om.MDagPath.getAllPathsTo(node):
+                new_path = dag_path.fullPathName()
+                old_path = f"{new_path.rsplit('|', 1)[0]}|{previous_name}"
+                if previous_name and old_path in self._short_of:
+                    self.rename(old_path, new_path)
+                else:
+                    # 刚建的节点 (还没进索引)：等读取时再加
+                    self._defer(node)
+        except Exception as e:
+            print(f"ShortNameIndex: {e}")
+            self._dirty = True
+
+    def _on_dag_changed(self, msg, child, parent, client_data):
+        try:
+            import maya.api.OpenMaya as om
+            node = child.node()
+            if not self._is_transform(node):
+                return
+            # 从旧父级下面移走 (旧路径 = 旧父级路径 + 名字)，挂到新父级后按新路径加回来
+            self.remove(f"{parent.fullPathName()}|{om.MFnDagNode(node).name()}")
+            if child.isValid():
+                self._defer(node)
+        except Exception as e:
+            print(f"ShortNameIndex: {e}")
+            self._dirty = True
+
+    def _on_scene_changed(self, client_data):
+        self._dirty = True
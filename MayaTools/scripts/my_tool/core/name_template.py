@@ -0,0 +1,96 @@
+# my_tool/core/name_template.py
+"""
+正则 / 模板命名引擎 (纯字符串，不依赖 Maya)，改名工具和导出命名共用。
+
+模板用 Python format 语法，花括号里是 token：
+    "{side}_{part}_{index:03d}_JNT"   ->  "L_arm_001_JNT"
+token 的来源：
+    - 调用方提供的：改名时是 name (原名)、index (序号)；导出时是 name (文件名)、mode
+    - 正则的命名分组：pattern = r"(?P<side>[LR])_(?P<part>[a-z]+)"，匹配原名得到 side / part
+
+正则和模板都只编译一次 (lru_cache)，批量处理时循环里只做匹配和拼接。
+"""
+import re
+import string
+from functools import lru_cache
+
+# 改名用的内置 token
+RENAME_TOKENS = ("name", "index")
+
+_formatter = string.Formatter()
+
+
+@lru_cache(maxsize=64)
+def compile_pattern(pattern, ignore_case=False):
+    """编译正则 (同一个 pattern 只编译一次)，写错了抛 ValueError"""
+    try:
+        return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        raise ValueError(f"Invalid pattern '{pattern}': {e}")
+
+
+@lru_cache(maxsize=64)
+def template_fields(template):
+    """模板里用到的 token 名 ("{index:03d}" -> "index")，格式写错了抛 ValueError"""
+    try:
+        fields = []
+        for _, field, _, _ in _formatter.parse(template):
+            if field is None:
+                continue
+            if not field or field.isdigit():
+                raise ValueError("positional fields are not supported, use a token name")
+            # "{a.b}" / "{a[0]}" 只取 token 名
+            fields.append(re.split(r"[.\[]", field, 1)[0])
+        return tuple(fields)
+    except ValueError as e:
+        raise ValueError(f"Invalid template '{template}': {e}")
+
+
+class NameTemplate:
+    """
+    编译好的 (模板 + 可选正则)。
+        tpl = NameTemplate("{side}_{part}_{index:03d}_JNT", r"(?P<side>[LR])_(?P<part>[a-z]+)")
+        tpl.format("L_arm", index=1)   # "L_arm_001_JNT"，原名匹配不上正则返回 None
+    """
+
+    def __init__(self, template, pattern="", tokens=RENAME_TOKENS):
+        self.template = template
+        self.regex = compile_pattern(pattern) if pattern else None
+        self.fields = template_fields(template)
+
+        # 模板里的 token 必须都有来源，不然批量跑到一半才报 KeyError
+        available = set(tokens)
+        if self.regex is not None:
+            available.update(self.regex.groupindex)
+        unknown = [field for field in self.fields if field not in available]
+        if unknown:
+            raise ValueError(f"Unknown token(s) in template: {', '.join(unknown)} "
+                             f"(available: {', '.join(sorted(available))})")
+
+    def match(self, name):
+        """原名 -> 正则分组的 token，没写正则返回 {}，匹配不上返回 None"""
+        if self.regex is None:
+            return {}
+        m = self.regex.search(name)
+        if m is None:
+            return None
+        # 没参与匹配的可选分组给空字符串
+        return {key: value or "" for key, value in m.groupdict().items()}
+
+    def format(self, name, **tokens):
+        groups = self.match(name)
+        if groups is None:
+            return None
+        values = {"name": name}
+        values.update(groups)
+        values.update(tokens)
+        return self.template.format(**values)
+
+
+def regex_replace(names, pattern, replacement, ignore_case=False):
+    """批量正则替换 (replacement 支持 \\1 / \\g<name>)，返回新名字列表，没匹配上的保持原名"""
+    sub = compile_pattern(pattern, ignore_case).sub
+    try:
+        return [sub(replacement, name) for name in names]
+    except (re.error, IndexError) as e:
+        raise ValueError(f"Invalid replacement '{replacement}': {e}")
@@ -1,29 +1,51 @@
 # my_tool/core/renamer_logic.py
 import maya.cmds as cmds
-from ..utils.decorators import undoable
-
-def get_safe_selection(include_hierarchy = False):
+from .rename_plan import build_plan, apply_plan
+from .name_template import NameTemplate, regex_replace
+from .checks.scene_snapshot import SceneSnapshot
+from . import dag_traversal
+
+# batch_replace 的模式
+MODE_ANYWHERE = 0
+MODE_START = 1
+MODE_END = 2
+MODE_REGEX = 3  # search 是正则，replace 里可以用 \1 / \g<name>
+
+def get_safe_selection(include_hierarchy = False, parents_first = False, node_filter = None):
+    """
+    当前选择 (长路径)，默认子节点在前。
+    include_hierarchy: 连同选中物体下面的整棵子树 (含 shape)
+    parents_first: 父节点在前 (编号从根往下数时用)
+    node_filter: 见 dag_traversal (比如 dag_traversal.JOINTS 只改骨骼)
+    """
     sel = cmds.ls(selection=True, long=True)
 
-    if include_hierarchy:
-        sel = cmds.ls(sel, dagObjects=True, long=True)
-
     if not sel:
         return []
 
-    sel = list(set(sel))
-    sel.sort(key=len, reverse=True)
-    return sel
-
-@undoable
-def batch_replace(search_str, replace_str, mode, include_hierarchy = False):
-    if search_str is None:
-        return
-
-    sel = get_safe_selection(include_hierarchy)
-    count = 0
-
-    for full_path in sel:
+    if include_hierarchy or node_filter is not None:
+        # 一次查询整个 DAG，在内存里做深度优先遍历
+        snapshot = SceneSnapshot()
+        walk = dag_traversal.pre_order if parents_first else dag_traversal.post_order
+        if include_hierarchy:
+            return walk(sel, snapshot, node_filter)
+        sel = [path for path in sel if node_filter(path, snapshot)]
+
+    # 不展开层级：按层级深度排 (同一层保持选择顺序)
+    sel = list(dict.fromkeys(sel))
+    return dag_traversal.parents_first(sel) if parents_first else dag_traversal.children_first(sel)
+
+# ----------------------------------------------------------------
+# 计算新名字 (纯字符串，不碰场景)：返回 [(长路径, 新短名)]，交给 rename_plan
+# ----------------------------------------------------------------
+def replace_names(paths, search_str, replace_str, mode):
+    if mode == MODE_REGEX:
+        # 正则只编译一次，整批一起替换
+        new_names = regex_replace([full_path.split("|")[-1] for full_path in paths], search_str, replace_str)
+        return list(zip(paths, new_names))
+
+    renames = []
+    for full_path in paths:
         short_name = full_path.split("|")[-1]
         new_name = short_name
 
@@ -35,70 +57,101 @@ def batch_replace(search_str, replace_str, mode, include_hierarchy = False):
                 new_name = replace_str + short_name[len(search_str):]
         elif mode == 2:
             # end
-            if short_name.endswith(replace_str):
+            if search_str and short_name.endswith(search_str):
                 new_name = short_name[:-len(search_str)] + replace_str
-        if new_name != short_name:
-            try:
-                cmds.rename(full_path, new_name)
-                count += 1
-            except Exception as e:
-                print(f"Skipped {short_name}: {e}")
-
-    print(f"Renamed {count} objects.")
-
-def batch_renumber(base_name, start_num, padding, include_hierarchy = False):
-    if base_name is None:
-        return
-
-    objects = get_safe_selection(include_hierarchy)
-
-    if not objects:
-        return
+        renames.append((full_path, new_name))
+    return renames
 
-    temp_names = []
-    for obj in objects:
-        try:
-            temp_name = cmds.rename(obj, "TEMP_RENAME_Process_#")
-            temp_names.append(temp_name)
-        except Exception as e:
-            print(f"Skipped {obj}: {e}")
-    temp_names.reverse()
-    count = 0
-    current_num = start_num
-
-    for tmp_name in temp_names:
+def renumber_names(paths, base_name, start_num, padding):
+    # 按 paths 的顺序编号 (从选择来的时候是父级在前，见 plan_renumber)
+    renames = []
+    for i, full_path in enumerate(paths):
         # 构造数字部分: f"{5:03d}" -> "005"
-        num_str = f"{current_num:0{padding}d}"
+        num_str = f"{start_num + i:0{padding}d}"
 
         if "#" in base_name:
             final_name = base_name.replace("#", num_str)
         else:
             final_name = f"{base_name}_{num_str}"
-
+        renames.append((full_path, final_name))
+    return renames
+
+def template_names(paths, template, pattern="", start_num=1):
+    """
+    模板改名："{side}_{part}_{index:03d}_JNT"，token 来自 pattern 的命名分组 + name / index。
+    原名匹配不上 pattern 的不改，也不占序号；按 paths 的顺序编号 (和 renumber 一样)。
+    """
+    tpl = NameTemplate(template, pattern)
+    renames = []
+    index = start_num
+    for full_path in paths:
+        short_name = full_path.split("|")[-1]
         try:
-            cmds.rename(tmp_name, final_name)
-            current_num += 1
-            count += 1
-        except Exception as e:
-            print(f"Error renaming {tmp_name}: {e}")
+            new_name = tpl.format(short_name, index=index)
+        except (ValueError, KeyError, IndexError) as e:
+            raise ValueError(f"Template '{template}' failed on '{short_name}': {e}")
+        if new_name is None:
+            continue
+        renames.append((full_path, new_name))
+        index += 1
+    return renames
+
+def prefix_suffix_names(paths, prefix, suffix):
+    # 拼接
+    return [(full_path, f"{prefix}{full_path.split('|')[-1]}{suffix}") for full_path in paths]
+
+# ----------------------------------------------------------------
+# 出改名计划：paths 不传就用当前选择；传一份路径列表就完全在内存里算 (UI 预览用)
+# 预览拿到的 plan 原样交给 apply_plan，执行的就是预览里看到的那一份
+# ----------------------------------------------------------------
+def plan_replace(search_str, replace_str, mode, include_hierarchy = False, paths=None):
+    if paths is None:
+        paths = get_safe_selection(include_hierarchy)
+    return build_plan(replace_names(paths, search_str, replace_str, mode))
+
+def plan_renumber(base_name, start_num, padding, include_hierarchy = False, paths=None):
+    if paths is None:
+        paths = get_safe_selection(include_hierarchy, parents_first=True)
+    return build_plan(renumber_names(paths, base_name, start_num, padding))
+
+def plan_template(template, pattern="", start_num=1, include_hierarchy = False, paths=None):
+    if paths is None:
+        paths = get_safe_selection(include_hierarchy, parents_first=True)
+    return build_plan(template_names(paths, template, pattern, start_num))
+
+def plan_prefix_suffix(prefix, suffix, include_hierarchy = False, paths=None):
+    if paths is None:
+        paths = get_safe_selection(include_hierarchy)
+    return build_plan(prefix_suffix_names(paths, prefix, suffix))
+
+# ----------------------------------------------------------------
+# 执行：先出完整的改名计划 (撞名/互换都在内存里算好)，再一次性改
+# ----------------------------------------------------------------
+def batch_replace(search_str, replace_str, mode, include_hierarchy = False):
+    if search_str is None:
+        return
 
-    print(f"Renumbered {count} objects.")
+    count = apply_plan(plan_replace(search_str, replace_str, mode, include_hierarchy))
+    print(f"Renamed {count} objects.")
 
-def batch_prefix_suffix(prefix, suffix, include_hierarchy = False):
-    objects = get_safe_selection(include_hierarchy)
-    count = 0
+def batch_renumber(base_name, start_num, padding, include_hierarchy = False):
+    if base_name is None:
+        return
 
-    for full_path in objects:
-        short_name = full_path.split("|")[-1]
+    # 不再先全部改成 TEMP_RENAME_Process_#：只有真正互换名字的才借临时名
+    count = apply_plan(plan_renumber(base_name, start_num, padding, include_hierarchy))
+    print(f"Renumbered {count} objects.")
 
-        # 拼接
-        new_name = f"{prefix}{short_name}{suffix}"
+def batch_template(template, pattern="", start_num=1, include_hierarchy = False):
+    count = apply_plan(plan_template(template, pattern, start_num, include_hierarchy))
+    print(f"Renamed {count} objects.")
 
-        if new_name != short_name:
-            try:
-                cmds.rename(full_path, new_name)
-                count += 1
-            except:
-                pass
+def batch_prefix_suffix(prefix, suffix, include_hierarchy = False):
+    count = apply_plan(plan_prefix_suffix(prefix, suffix, include_hierarchy))
+    print(f"Modified {count} objects.")
 
-    print(f"Modified {count} objects.")
\ No newline at end of file
+def apply_preview(plan):
+    """执行预览过的计划"""
+    count = apply_plan(plan)
+    print(f"Renamed {count} objects.")
+    return count
@@ -0,0 +1,238 @@
+# my_tool/core/rename_plan.py
+"""
+批量改名计划：先在内存里把每个节点的最终名字算好，再一次性执行。
+
+以前的做法是循环里逐个 cmds.rename，renumber 还要先全部改成 TEMP_RENAME_Process_# 再改一遍。
+现在分两步：
+    1. build_plan([(长路径, 新短名), ...])  纯计算，不碰场景
+        - 同一个父级下改完会撞名的 (兄弟之间 / 和不改名的兄弟) -> "clash"，不执行
+        - 名字不合法 -> "invalid"，不执行
+        - 和场景里别处的节点重名 -> "duplicate"，只是提示，照样执行
+        - 互相占名的 (A->B, B->C) 排好先后顺序；真正的互换 (A->B, B->A) 才借一个临时名
+    2. apply_plan(plan)  按算好的步骤执行，整个计划一个 Undo
+兄弟节点的信息来自 name_index (内存里的短名索引)，所以预览和执行用的是同一份计划。
+
+注意：MDagModifier.renameNode 虽然能一次提交，但在插件命令之外没法撤销，
+所以执行阶段还是 cmds.rename (一个节点一次，但不会再改两遍)。
+"""
+import re
+from collections import Counter
+
+import maya.cmds as cmds
+from ..utils.decorators import undoable
+from .signals import signals
+from .name_index import get_name_index, short_name
+
+CLASH = "clash"
+INVALID = "invalid"
+DUPLICATE = "duplicate"
+
+# 跳过不执行的冲突 (duplicate 只是提示)
+BLOCKING = (CLASH, INVALID)
+
+# 合法的 Maya 节点名 (可以带 namespace)
+_VALID_NAME = re.compile(r"^(?:[A-Za-z_]\w*:)*[A-Za-z_]\w*$")
+
+
+class RenameOp:
+    """一个节点的改名"""
+
+    __slots__ = ("path", "parent", "old_name", "new_name", "conflict")
+
+    def __init__(self, path, new_name):
+        self.path = path  # 改名前的长路径
+        # parent: DAG 节点的父级长路径 (顶层是 "")，DG 节点 (路径里没有 "|") 是 None
+        parent, sep, self.old_name = path.rpartition("|")
+        self.parent = parent if sep else None
+        self.new_name = new_name
+        self.conflict = ""
+
+    @property
+    def new_path(self):
+        """改名后的长路径 (不算父级的改名)"""
+        return self.path_for(self.new_name)
+
+    def path_for(self, name):
+        return name if self.parent is None else f"{self.parent}|{name}"
+
+    @property
+    def blocked(self):
+        return self.conflict in BLOCKING
+
+    def __repr__(self):
+        return f"RenameOp({self.path!r} -> {self.new_name!r}{', ' + self.conflict if self.conflict else ''})"
+
+
+class RenamePlan:
+    """
+    ops: 所有名字会变的节点 (名字不变的不在里面)
+    steps: 执行顺序 [(op, 名字)]，同一个 op 出现两次说明先借了临时名
+    """
+
+    def __init__(self, ops, steps):
+        self.ops = ops
+        self.steps = steps
+
+    def __len__(self):
+        return len(self.ops)
+
+    @property
+    def conflicts(self):
+        return [op for op in self.ops if op.conflict]
+
+    @property
+    def runnable(self):
+        return [op for op in self.ops if not op.blocked]
+
+
+def build_plan(renames, index=None):
+    """
+    renames: [(长路径, 新短名)]，新名字为空或和原名一样的忽略，同一路径只取第一次。
+    index: 短名索引 (默认全局的 get_name_index())，只用来查兄弟和重名，不查场景。
+    """
+    index = index if index is not None else get_name_index()
+
+    # 1. 名字有变化的才进计划
+    ops = []
+    seen = set()
+    for path, new_name in renames:
+        if path in seen:
+            continue
+        seen.add(path)
+        if new_name and new_name != short_name(path):
+            ops.append(RenameOp(path, new_name))
+
+    # 2. 按父级分组检查撞名
+    groups = {}
+    for op in ops:
+        groups.setdefault(op.parent, []).append(op)
+
+    renamed_paths = {op.path for op in ops}
+    target_counts = Counter(op.new_name for op in ops)
+    for parent, group in groups.items():
+        siblings = _siblings(index, parent, renamed_paths)
+        for op in group:
+            if not _VALID_NAME.match(op.new_name):
+                op.conflict = INVALID
+        # 被跳过的 op 还留着旧名字，可能又挡住别人，反复检查直到没有新的冲突
+        changed = True
+        while changed:
+            changed = False
+            moving = [op for op in group if not op.blocked]
+            taken = siblings | {op.old_name for op in group if op.blocked}
+            counts = Counter(op.new_name for op in moving)
+            for op in moving:
+                if counts[op.new_name] > 1 or op.new_name in taken:
+                    op.conflict = CLASH
+                    changed = True
+        for op in group:
+            if not op.conflict and (target_counts[op.new_name] > 1
+                                    or index.paths_of(op.new_name).difference(renamed_paths)):
+                op.conflict = DUPLICATE
+
+    # 3. 排执行顺序：子节点先改 (父级的长路径在它改名前一直有效)，同一父级内按占名关系排
+    steps = []
+    for parent in sorted(groups, key=lambda p: -1 if p is None else p.count("|"), reverse=True):
+        group = [op for op in groups[parent] if not op.blocked]
+        steps.extend(_order_siblings(group, _siblings(index, parent, renamed_paths)))
+
+    return RenamePlan(ops, steps)
+
+
+def _siblings(index, parent, renamed_paths):
+    """parent 下面不改名的兄弟占着的名字 (DG 节点没有父级，不查)"""
+    if parent is None:
+        return set()
+    return {short_name(path) for path in index.children_of(parent) if path not in renamed_paths}
+
+
+def _order_siblings(group, siblings):
+    """
+    同一父级下的改名顺序。A 的新名字是 B 的旧名字时，B 必须先改 (B 先让位)。
+    每个名字最多被一个 op 占着/想要，所以依赖关系只会是链或环：
+    链直接排好顺序，环 (互换) 先把其中一个改成临时名打断。
+    """
+    by_old = {op.old_name: op for op in group}
+    waiter = {}  # B -> 等着 B 让位的 A
+    ready = []
+    for op in group:
+        blocker = by_old.get(op.new_name)
+        if blocker is None:
+            ready.append(op)
+        else:
+            waiter[blocker] = op
+
+    steps = []
+    done = set()
+
+    def release(op):
+        # op 改完了，等它让位的那个可以改了，一路传下去
+        while op is not None and op not in done:
+            steps.append((op, op.new_name))
+            done.add(op)
+            op = waiter.get(op)
+
+    for op in ready:
+        release(op)
+
+    # 剩下的都在环里：借一个临时名
+    taken = siblings | set(by_old) | {op.new_name for op in group}
+    for op in group:
+        if op in done:
+            continue
+        temp = _temp_name(op.old_name, taken)
+        taken.add(temp)
+        steps.append((op, temp))
+        release(waiter[op])
+        release(op)
+    return steps
+
+
+def _final_path(path, leaf_names):
+    """改名前的长路径 -> 所有改名 (包括祖先的) 做完之后的长路径"""
+    if "|" not in path:
+        return leaf_names.get(path, path)  # DG 节点
+    parent, _, leaf = path.rpartition("|")
+    return f"{_final_path(parent, leaf_names) if parent else ''}|{leaf_names.get(path, leaf)}"
+
+
+def _temp_name(base, taken):
+    i = 0
+    while True:
+        temp = f"{base}__renameTmp{i}"
+        if temp not in taken:
+            return temp
+        i += 1
+
+
+@undoable
+def apply_plan(plan):
+    """按计划执行，返回改成功的个数 (有 clash/invalid 的 op 不执行)"""
+    current = {}  # op -> 当前长路径 (借过临时名之后会变)
+    renamed = []  # 改到最终名字的 op
+    for op, name in plan.steps:
+        path = current.get(op, op.path)
+        try:
+            result = cmds.rename(path, name)
+        except Exception as e:
+            print(f"Skipped {op.old_name}: {e}")
+            continue
+        current[op] = op.path_for(result)
+        if name != op.new_name:
+            continue  # 临时名，后面还会再改
+        if result != name:
+            print(f"Warning: {op.old_name} was renamed to '{result}' instead of '{name}'")
+        renamed.append(op)
+
+    # 子节点比父节点先改，改子节点那一刻的路径里还是父节点的旧名字：
+    # 全部改完之后再按最终的路径发信号 (Live 检查拿新路径去查，不能是已经不存在的)
+    leaf_names = {op.path: path.rsplit("|", 1)[-1] for op, path in current.items()}
+    for op in renamed:
+        signals.asset_renamed.emit(op.path, _final_path(op.path, leaf_names))
+
+    for op in plan.conflicts:
+        if op.blocked:
+            print(f"Skipped {op.old_name} -> {op.new_name}: {op.conflict}")
+        else:
+            print(f"Warning: '{op.new_name}' already exists elsewhere in the scene")
+    return len(renamed)
@@ -0,0 +1,149 @@
+# my_tool/core/shape_library.py
+"""
+控制器形状库 (Model 层数据：my_tool/data/controller_shapes.json)。
+
+以前每种形状都是现场 "造" 出来的：cmds.circle + xform 转 45 度 + makeIdentity 冻结，
+批量建 FK 时每个控制器都要走一遍，Cube 也只是个圆。
+现在形状直接存 CV 数据，建控制器就是一次 cmds.curve (多段曲线的形状每段一次)：
+
+    {"version": 1, "shapes": {
+        "circle": [{"degree": 3, "form": "periodic", "cvs": [[x, y, z], ...], "knots": [...]}],
+        ...
+    }}
+
+    - 一个形状可以有多段曲线，建出来是同一个 transform 下的多个 shape
+    - cvs 是 size = 1 时的物体空间坐标，建的时候乘 size
+    - periodic 的曲线 cvs 里包含首尾重叠的 degree 个点，knots 是 Maya 的写法 (cv 数 + degree - 1 个)
+
+内置形状在包里的 JSON，用户从场景里 Capture 的形状存到 ~/.my_tool/controller_shapes.json
+(同名的覆盖内置的)。两个文件都只在第一次用的时候读一次，之后走内存。
+"""
+import io
+import os
+import json
+
+import maya.cmds as cmds
+
+BUILTIN_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "controller_shapes.json")
+
+FORMAT_VERSION = 1
+DEFAULT_SHAPE = "circle"
+
+# MFnNurbsCurve.form -> 存盘的写法
+_FORMS = {1: "open", 2: "closed", 3: "periodic"}
+
+_shapes = None  # 形状名 -> [曲线数据]，None = 还没读
+
+
+def get_user_path():
+    from .. import config
+    if config.CONTROLLER_SHAPE_LIBRARY:
+        return config.CONTROLLER_SHAPE_LIBRARY
+    return os.path.join(os.path.expanduser("~"), ".my_tool", "controller_shapes.json")
+
+
+def _read_file(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with io.open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("shapes", {})
+    except Exception as e:
+        print(f"Error reading shape library {path}: {e}")
+        return {}
+
+
+def load_shapes(reload=False):
+    """内置 + 用户的形状 (只读一次，reload=True 重新读盘)"""
+    global _shapes
+    if _shapes is None or reload:
+        shapes = _read_file(BUILTIN_PATH)
+        shapes.update(_read_file(get_user_path()))
+        _shapes = shapes
+    return _shapes
+
+
+def list_shapes():
+    """形状名 (内置的在前，用户的按加入顺序接在后面)"""
+    return list(load_shapes())
+
+
+def get_shape(name):
+    """形状数据，没有这个形状抛 KeyError"""
+    shapes = load_shapes()
+    if name not in shapes:
+        raise KeyError(f"Unknown controller shape '{name}' (available: {', '.join(shapes)})")
+    return shapes[name]
+
+
+def create_curve(name, shape=DEFAULT_SHAPE, size=1.0):
+    """按形状数据建一条控制器曲线，返回 transform 名"""
+    curves = get_shape(shape)
+
+    transform = None
+    for curve in curves:
+        points = [(x * size, y * size, z * size) for x, y, z in curve["cvs"]]
+        node = cmds.curve(n=name, d=curve["degree"], p=points, k=curve["knots"],
+                          per=curve.get("form") == "periodic")
+        if transform is None:
+            transform = node
+            continue
+        # 多段曲线：shape 挂到第一个 transform 下面，空 transform 删掉
+        curve_shape = cmds.listRelatives(node, shapes=True, fullPath=True)[0]
+        cmds.parent(curve_shape, transform, relative=True, shape=True)
+        cmds.delete(node)
+
+    # shape 统一改成 <控制器>Shape / <控制器>Shape1 ...
+    for i, curve_shape in enumerate(cmds.listRelatives(transform, shapes=True, fullPath=True) or []):
+        cmds.rename(curve_shape, f"{transform.split('|')[-1]}Shape{i or ''}")
+    return transform
+
+
+def capture_shape(node):
+    """
+    从场景里的曲线读出形状数据 (node 是 transform 或 nurbsCurve shape)。
+    读的是物体空间的 CV，保存后按 size = 1 的大小用。
+    """
+    import maya.api.OpenMaya as om
+
+    shapes = cmds.listRelatives(node, shapes=True, type="nurbsCurve", fullPath=True) or []
+    if not shapes and cmds.nodeType(node) == "nurbsCurve":
+        shapes = [node]
+    if not shapes:
+        raise ValueError(f"'{node}' has no NURBS curve shapes")
+
+    sel = om.MSelectionList()
+    for shape in shapes:
+        sel.add(shape)
+
+    curves = []
+    for i in range(sel.length()):
+        fn = om.MFnNurbsCurve(sel.getDagPath(i))
+        curves.append({
+            "degree": fn.degree,
+            "form": _FORMS.get(fn.form, "open"),
+            "cvs": [[round(p.x, 6), round(p.y, 6), round(p.z, 6)] for p in fn.cvPositions(om.MSpace.kObject)],
+            "knots": [round(k, 6) for k in fn.knots()],
+        })
+    return curves
+
+
+def save_shape(name, curves, path=None):
+    """把形状存进用户形状库 (同名覆盖)，内存里的缓存一起更新"""
+    path = path or get_user_path()
+    shapes = _read_file(path)
+    shapes[name] = curves
+
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    # 先写临时文件再替换，写到一半出错不会把整个库写坏
+    tmp_path = f"{path}.tmp"
+    with io.open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": FORMAT_VERSION, "shapes": shapes}, f, indent=1)
+    os.replace(tmp_path, path)
+
+    if _shapes is not None:
+        _shapes[name] = curves
+    return path
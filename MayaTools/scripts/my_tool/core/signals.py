@@ -1,9 +1,21 @@
 # my_tool/core/signals.py
-from PySide6.QtCore import QObject, Signal
+try:
+    from PySide2.QtCore import QObject, Signal
+except ImportError:
+    from PySide6.QtCore import QObject, Signal
 
 class GlobalSignals(QObject):
     """全局信号中心"""
     asset_renamed = Signal(str, str)  # 发送 (旧名字, 新名字)
 
 # 单例实例
-signals = GlobalSignals()
\ No newline at end of file
+signals = GlobalSignals()
+
+
+class ExportSignals(QObject):
+    """批量导出的进度信号 (每个 ExportScheduler 一份)"""
+    job_queued = Signal(int, str)  # (任务 index, 文件路径)
+    job_status_changed = Signal(int, str, int)  # (任务 index, 状态, 第几次尝试)
+    job_log = Signal(int, str)  # (任务 index, 日志)
+    progress = Signal(int, int)  # (已完成数, 总数)
+    batch_finished = Signal(int, int)  # (成功数, 总数)
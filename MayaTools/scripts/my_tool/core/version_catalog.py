@@ -0,0 +1,254 @@
+# my_tool/core/version_catalog.py
+"""
+整个项目的版本目录 (本地 SQLite)，不依赖 Maya。
+
+每个镜头文件夹各有一份 meta.json (+ meta.journal)，以前 Pipeline 页只看得到当前场景那一个。
+要跨 400 个镜头列 "周一以来所有 Published 的版本"，就得打开 400 个文件逐个解析。
+现在由爬虫把所有镜头的版本信息收进一个 SQLite 库，查询走索引：
+
+    catalog = VersionCatalog()
+    catalog.crawl("Z:/Project/Shots")                     # 增量：meta 文件没变的镜头只 stat 一下
+    catalog.query(published=True, since=start_of_week())  # [{"asset", "version", ..., "full_path"}]
+
+库默认放在本机 ~/.my_tool/version_catalog.db (SQLite 不适合放在网络盘上多人写)，
+每个人的库都是从共享目录爬出来的缓存，删掉重爬就行。
+"""
+import os
+import time
+import sqlite3
+import datetime
+
+from .version_store import VersionStore, VERSION_DIR_NAME, META_FILE_NAME, JOURNAL_SUFFIX
+
+SCHEMA_VERSION = 1
+
+# 爬的时候不往里走的文件夹 (版本库 / 导出目录 / 隐藏文件夹)
+SKIP_DIRS = (VERSION_DIR_NAME, "_exports")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shots (
+    workspace   TEXT PRIMARY KEY,
+    asset_name  TEXT,
+    stamp       TEXT,  -- meta.json / meta.journal 的 mtime + size，没变就不重新解析
+    scanned_at  REAL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    workspace    TEXT NOT NULL,
+    version      TEXT NOT NULL,
+    asset_name   TEXT,
+    author       TEXT,
+    time         TEXT,  -- "YYYY-mm-dd HH:MM:SS"，字符串比较就是时间先后
+    comment      TEXT,
+    path         TEXT,  -- 相对 workspace
+    thumbnail    TEXT,  -- 相对 workspace
+    is_published INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (workspace, version)
+);
+CREATE INDEX IF NOT EXISTS idx_versions_published_time ON versions (is_published, time);
+CREATE INDEX IF NOT EXISTS idx_versions_asset ON versions (asset_name);
+"""
+
+_COLUMNS = ("workspace", "version", "asset_name", "author", "time", "comment", "path", "thumbnail", "is_published")
+
+
+def get_catalog_path():
+    from .. import config
+    if config.VERSION_CATALOG:
+        return config.VERSION_CATALOG
+    return os.path.join(os.path.expanduser("~"), ".my_tool", "version_catalog.db")
+
+
+def start_of_week(now=None):
+    """这周一 00:00 (查 "周一以来" 用)"""
+    now = now or datetime.datetime.now()
+    monday = now.date() - datetime.timedelta(days=now.weekday())
+    return datetime.datetime.combine(monday, datetime.time())
+
+
+def start_of_day(now=None):
+    now = now or datetime.datetime.now()
+    return datetime.datetime.combine(now.date(), datetime.time())
+
+
+def _time_key(value):
+    """datetime / date / 字符串 -> 和 meta.json 里 "time" 一样格式的字符串"""
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, datetime.date):
+        return value.strftime("%Y-%m-%d 00:00:00")
+    return str(value)
+
+
+def _norm(path):
+    return os.path.normpath(path).replace("\\", "/")
+
+
+class VersionCatalog:
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or get_catalog_path()
+        folder = os.path.dirname(self.db_path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self._init_schema()
+
+    def _init_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # 只是缓存：结构变了直接重建
+            self.conn.executescript("DROP TABLE IF EXISTS versions; DROP TABLE IF EXISTS shots;")
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # ----------------------------------------------------------------
+    # 爬虫
+    # ----------------------------------------------------------------
+    def crawl(self, root, cancelled=None):
+        """
+        扫描 root 下所有镜头文件夹 (有 meta.json 或 _versions 的文件夹)，更新目录。
+        meta 文件的 mtime / size 没变的镜头跳过，root 下已经不存在的镜头从目录里删掉。
+        返回 (镜头数, 重新解析的镜头数)。
+        cancelled() 返回 True 时提前停下 (已经解析的镜头照样存)，返回 None。
+        网络盘上整个项目走一遍要很久，界面上要放到后台线程里调 (连接不能跨线程，线程里自己开一个 VersionCatalog)。
+        """
+        root = _norm(root)
+        known = {row["workspace"]: row["stamp"] for row in self.conn.execute(
+            "SELECT workspace, stamp FROM shots WHERE workspace = ? OR workspace LIKE ? ESCAPE '\\'",
+            (root, _like_prefix(root)))}
+
+        found = set()
+        updated = 0
+        with self.conn:  # 整次爬取一个事务
+            for workspace in _find_workspaces(root):
+                if cancelled is not None and cancelled():
+                    return None
+                found.add(workspace)
+                stamp = _stamp(workspace)
+                if known.get(workspace) == stamp:
+                    continue
+                self._index_workspace(workspace, stamp)
+                updated += 1
+
+            for workspace in set(known) - found:
+                self._remove_workspace(workspace)
+        return len(found), updated
+
+    def _index_workspace(self, workspace, stamp):
+        data = VersionStore(os.path.join(workspace, META_FILE_NAME),
+                            os.path.join(workspace, VERSION_DIR_NAME)).load()
+        asset_name = data.get("asset_name", "")
+
+        rows = []
+        for code, info in data.get("versions", {}).items():
+            rows.append((
+                workspace,
+                info.get("version", code),
+                asset_name,
+                info.get("author", ""),
+                info.get("time", ""),
+                info.get("comment", ""),
+                info.get("path", ""),
+                info.get("thumbnail", ""),
+                1 if info.get("is_published") else 0,
+            ))
+
+        self.conn.execute("DELETE FROM versions WHERE workspace = ?", (workspace,))
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO versions ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+            rows)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO shots (workspace, asset_name, stamp, scanned_at) VALUES (?, ?, ?, ?)",
+            (workspace, asset_name, stamp, time.time()))
+
+    def _remove_workspace(self, workspace):
+        self.conn.execute("DELETE FROM versions WHERE workspace = ?", (workspace,))
+        self.conn.execute("DELETE FROM shots WHERE workspace = ?", (workspace,))
+
+    # ----------------------------------------------------------------
+    # 查询
+    # ----------------------------------------------------------------
+    def query(self, published=None, since=None, until=None, asset=None, author=None, root=None):
+        """
+        条件都是可选的，返回按时间倒序的版本列表 (dict，多一个 full_path 是版本文件的绝对路径)。
+            catalog.query(published=True, since=start_of_week())
+        """
+        where = []
+        params = []
+        if published is not None:
+            where.append("is_published = ?")
+            params.append(1 if published else 0)
+        if since is not None:
+            where.append("time >= ?")
+            params.append(_time_key(since))
+        if until is not None:
+            where.append("time < ?")
+            params.append(_time_key(until))
+        if asset:
+            where.append("asset_name = ?")
+            params.append(asset)
+        if author:
+            where.append("author = ?")
+            params.append(author)
+        if root:
+            root = _norm(root)
+            where.append("(workspace = ? OR workspace LIKE ? ESCAPE '\\')")
+            params.extend([root, _like_prefix(root)])
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM versions"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY time DESC, workspace, version DESC"
+
+        results = []
+        for row in self.conn.execute(sql, params):
+            info = dict(row)
+            info["is_published"] = bool(info["is_published"])
+            info["full_path"] = _norm(os.path.join(info["workspace"], info["path"])) if info["path"] else ""
+            results.append(info)
+        return results
+
+    def shot_count(self, root=None):
+        if not root:
+            return self.conn.execute("SELECT COUNT(*) FROM shots").fetchone()[0]
+        root = _norm(root)
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM shots WHERE workspace = ? OR workspace LIKE ? ESCAPE '\\'",
+            (root, _like_prefix(root))).fetchone()[0]
+
+
+def _like_prefix(root):
+    """root 下面的路径的 LIKE 模式 (转义 % 和 _，"_versions" 之类的名字很常见)"""
+    escaped = root.rstrip("/").replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "/%"
+
+
+def _find_workspaces(root):
+    """
+    root 下面所有镜头文件夹 (不进 _versions / _exports / 隐藏文件夹)。
+    找到镜头文件夹就不再往里走：镜头下面是场景、贴图、缓存，不会再套一个镜头，没必要全走一遍
+    """
+    for current, dirs, files in os.walk(root):
+        if META_FILE_NAME in files or VERSION_DIR_NAME in dirs:
+            yield _norm(current)
+            dirs[:] = []
+            continue
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
+
+
+def _stamp(workspace):
+    """meta.json + meta.journal 的 mtime / size，有一个变了就要重新解析"""
+    parts = []
+    meta_path = os.path.join(workspace, META_FILE_NAME)
+    for path in (meta_path, os.path.splitext(meta_path)[0] + JOURNAL_SUFFIX):
+        try:
+            st = os.stat(path)
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
@@ -1,15 +1,12 @@
 import maya.cmds as cmds
 
 import os
-import json
 import shutil
 import datetime
 import getpass # 获取当前用户名
-import io
 
-# 定义版本库的隐藏文件夹名
-VERSION_DIR_NAME = "_versions"
-META_FILE_NAME = "meta.json"
+# 版本库的隐藏文件夹名 / 索引文件名定义在 version_store (不依赖 Maya，目录爬虫也要用)
+from .version_store import VersionStore, VersionLockError, VERSION_DIR_NAME, META_FILE_NAME
 
 class VersionManager:
 
@@ -17,6 +14,7 @@ class VersionManager:
         self.version_root = ""
         self.workspace_path = ""
         self.meta_path = ""
+        self.store = None
         self.data = {}
 
         self.refresh_context()
@@ -26,6 +24,7 @@ class VersionManager:
         if not scene_name:
             # not saved
             self.workspace_path = None
+            self.store = None
             return
 
         # 获取当前文件所在的文件夹
@@ -48,6 +47,8 @@ class VersionManager:
         self.version_root = os.path.join(self.workspace_path, VERSION_DIR_NAME)
         # Z:/Shots/Shot_010/meta.json
         self.meta_path = os.path.join(self.workspace_path, META_FILE_NAME)
+        # 读写都走 VersionStore (日志 + 文件锁)，多人同时发版本不会互相覆盖
+        self.store = VersionStore(self.meta_path, self.version_root, self._get_asset_name_from_scene())
 
         self.load_data()
 
@@ -62,28 +63,19 @@ class VersionManager:
             except Exception as e:
                 print(f"Migration failed: {e}")
 
-        if not self.meta_path or not os.path.exists(self.meta_path):
-            self.data = {
-                "asset_name": self._get_asset_name_from_scene(),
-                "versions": {}
-            }
-        else:
-            try:
-                with io.open(self.meta_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
-            except Exception as e:
-                print(f"Error loading meta.json: {e}")
-                self.data = {"versions": {}}
+        self.data = self.store.load()
 
-    def save_data(self):
+    def set_published(self, version_code, state=True):
+        """改发布状态：只往日志里追加一行，不重写整个 meta.json"""
         if not self.workspace_path:
-            return
-
+            return False
         try:
-            with io.open(self.meta_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving meta.json: {e}")
+            self.store.set_published(version_code, state)
+        except VersionLockError as e:
+            print(f"Error saving publish state: {e}")
+            return False
+        self.load_data()
+        return True
 
     def create_version(self, comment = "", make_thumbnail = True):
         """
@@ -97,15 +89,13 @@ class VersionManager:
         if not self.workspace_path:
             return False
 
-        # 1.CAL VERSIONS
-        current_count = len(self.data.get("versions", {}))
-        next_version_num = current_count + 1
-        version_code = f"v{next_version_num:03d}"
-
-        # .../_versions/v001/
-        version_dir = os.path.join(self.version_root, version_code)
-        if not os.path.exists(version_dir):
-            os.makedirs(version_dir)
+        # 1.CAL VERSIONS + 建文件夹 .../_versions/v001/
+        # 版本号由 store 在锁里分配 (只增不减)，别人同时发版本也拿不到同一个号
+        try:
+            version_code, version_dir = self.store.allocate_version()
+        except VersionLockError as e:
+            print(f"Error creating version: {e}")
+            return False
 
         current_scene = cmds.file(query=True, sceneName=True)
         base_name = os.path.basename(current_scene) # Work.ma
@@ -144,9 +134,12 @@ class VersionManager:
             "is_published": False  # 默认为 False
         }
 
-        self.data["versions"][version_code] = version_info
-
-        self.save_data()
+        try:
+            self.store.add_version(version_info)
+        except VersionLockError as e:
+            print(f"Error saving {version_code} to meta.json: {e}")
+            return False
+        self.load_data()
 
         print(f"Version {version_code} created successfully!")
         return version_info
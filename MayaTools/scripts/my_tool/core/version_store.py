@@ -0,0 +1,297 @@
+# my_tool/core/version_store.py
+"""
+版本库的读写 (纯文件操作，不依赖 Maya，VersionManager 和批处理脚本都能用)。
+
+以前每次发版本 / 勾 Publish 都把整个 meta.json 重写一遍，没有锁：
+两个人同时在一个镜头文件夹里发版本，后写的会把先写的条目覆盖掉；
+版本号用 len(versions) + 1 算，删掉一个版本后会撞号。
+
+现在一个镜头文件夹下面是：
+    meta.json          索引 (压缩好的完整状态)
+    meta.journal       日志 (JSON Lines，只追加)，每次改动一行
+    meta.json.lock     写锁 (O_EXCL 建文件，网络盘上也管用)
+
+    写：拿锁 -> 往 meta.journal 追加一行 -> 放锁 (几百个版本也只写一行)
+        日志超过 COMPACT_THRESHOLD 行时顺手压缩：重放日志写出新的 meta.json (写临时文件再 os.replace)，清空日志
+    读：meta.json + 重放 meta.journal，不用拿锁
+        日志里的操作都是幂等的 (同一行重放两次结果一样)，压缩到一半断掉也不会丢数据
+        meta.json 和 meta.journal 都带 generation，读到 "旧索引 + 新日志" (中间有人压缩了) 就重读
+    版本号：索引里记着 next_version (只增不减)，再用 os.mkdir 建版本文件夹占号，
+        建不了 (别人先建了 / 删掉的版本文件夹还在) 就往后顺延
+"""
+import io
+import os
+import json
+import time
+import getpass
+import socket
+
+# 定义版本库的隐藏文件夹名
+VERSION_DIR_NAME = "_versions"
+META_FILE_NAME = "meta.json"
+JOURNAL_SUFFIX = ".journal"  # meta.json -> meta.journal
+LOCK_SUFFIX = ".lock"
+
+COMPACT_THRESHOLD = 64  # 日志超过多少行压缩一次
+LOCK_TIMEOUT = 10.0  # 等锁的最长时间 (秒)
+LOCK_STALE = 60.0  # 锁文件超过这个时间没动，认为拿锁的人已经崩了
+
+VERSION_PREFIX = "v"
+
+
+class VersionLockError(RuntimeError):
+    """等不到版本库的写锁"""
+
+
+def version_code(number):
+    return f"{VERSION_PREFIX}{number:03d}"
+
+
+def version_number(code):
+    """"v012" -> 12，不是版本号格式的返回 None"""
+    if code.startswith(VERSION_PREFIX) and code[len(VERSION_PREFIX):].isdigit():
+        return int(code[len(VERSION_PREFIX):])
+    return None
+
+
+class FileLock:
+    """
+    用 O_CREAT | O_EXCL 建锁文件实现的跨进程 / 跨机器的锁 (SMB / NFS 上建文件是原子的)。
+        with FileLock(path):
+            ...
+    锁文件里写着谁拿的锁，超过 LOCK_STALE 秒没释放的当成死锁清掉。
+    """
+
+    def __init__(self, path, timeout=LOCK_TIMEOUT, stale=LOCK_STALE):
+        self.path = path
+        self.timeout = timeout
+        self.stale = stale
+
+    def acquire(self):
+        deadline = time.time() + self.timeout
+        delay = 0.01
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._break_stale()
+                if time.time() > deadline:
+                    raise VersionLockError(f"Timed out waiting for {self.path} (held by {self.owner() or 'unknown'})")
+                time.sleep(delay)
+                delay = min(delay * 2, 0.2)
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(f"{getpass.getuser()}@{socket.gethostname()} pid {os.getpid()}")
+            return
+
+    def release(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def owner(self, path=None):
+        try:
+            with io.open(path or self.path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    def _is_stale(self, path):
+        try:
+            return time.time() - os.path.getmtime(path) > self.stale
+        except OSError:
+            return False  # 别人刚好放了锁 / 已经清掉了
+
+    def _break_stale(self):
+        # 1. 先看一眼，没过期就不动
+        if not self._is_stale(self.path):
+            return
+        # 2. 原子地把锁文件改名成只有自己知道的墓碑，而不是直接删：
+        #    两个人同时清，只有一个改名成功，另一个拿到 OSError 就算了，
+        #    不会出现 "A 删了旧锁、C 拿了新锁、B 又把 C 的锁删掉" 的情况
+        tombstone = f"{self.path}.{socket.gethostname()}.{os.getpid()}.{time.time():.6f}.stale"
+        try:
+            os.rename(self.path, tombstone)
+        except OSError:
+            return
+        # 3. 改名不会改 mtime，再看一次墓碑：检查的和删除的是同一个文件
+        #    1 和 2 之间锁被别人清掉又重新拿了的话，改走的是新锁，用 link 放回去 (目标已存在时会失败，不会覆盖)
+        if not self._is_stale(tombstone):
+            try:
+                os.link(tombstone, self.path)
+            except OSError:
+                pass
+        else:
+            print(f"Removing stale lock {self.path} ({self.owner(tombstone)})")
+        try:
+            os.remove(tombstone)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class VersionStore:
+    """
+    一个镜头文件夹的版本索引。
+        store = VersionStore(meta_path, version_root)
+        data = store.load()                     # {"asset_name", "versions": {...}, "next_version", "generation"}
+        code, folder = store.allocate_version() # 占一个新版本号 (已经建好文件夹)
+        store.add_version(info)                 # 记录新版本
+        store.update_version("v003", is_published=True)
+    """
+
+    def __init__(self, meta_path, version_root, asset_name=""):
+        self.meta_path = meta_path
+        self.version_root = version_root
+        self.asset_name = asset_name  # 索引里还没有资产名时用这个
+        self.journal_path = os.path.splitext(meta_path)[0] + JOURNAL_SUFFIX
+        self.lock_path = meta_path + LOCK_SUFFIX
+
+    def lock(self):
+        return FileLock(self.lock_path)
+
+    # ----------------------------------------------------------------
+    # 读
+    # ----------------------------------------------------------------
+    def load(self):
+        """索引 + 日志重放后的完整状态 (不拿锁)"""
+        for _ in range(5):
+            data = self._read_index()
+            generation, entries = self._read_journal()
+            # 读索引和读日志之间有人压缩了：旧索引 + 新日志会漏掉被压缩进去的条目，重读
+            if generation <= data["generation"]:
+                break
+        for entry in entries:
+            _apply(data, entry)
+        data.setdefault("asset_name", self.asset_name)
+        return data
+
+    def _read_index(self):
+        data = {}
+        if os.path.exists(self.meta_path):
+            try:
+                with io.open(self.meta_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"Error loading {self.meta_path}: {e}")
+        data.setdefault("versions", {})
+        data.setdefault("generation", 0)
+        # 老的 meta.json 没有 next_version：从已有版本号接着往后
+        numbers = [version_number(code) or 0 for code in data["versions"]]
+        data.setdefault("next_version", max(numbers, default=0) + 1)
+        return data
+
+    def _read_journal(self):
+        """-> (日志的 generation, 操作列表)。最后一行写到一半 (对方崩了) 的直接跳过"""
+        generation = 0
+        entries = []
+        if not os.path.exists(self.journal_path):
+            return generation, entries
+        with io.open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("op") == "header":
+                    generation = entry.get("generation", 0)
+                else:
+                    entries.append(entry)
+        return generation, entries
+
+    # ----------------------------------------------------------------
+    # 写 (都在锁里)
+    # ----------------------------------------------------------------
+    def allocate_version(self):
+        """占一个新的版本号，返回 (版本号, 版本文件夹)。号只增不减，删掉的版本不会被重用"""
+        with self.lock():
+            number = self.load()["next_version"]
+            if not os.path.exists(self.version_root):
+                os.makedirs(self.version_root)
+            while True:
+                code = version_code(number)
+                folder = os.path.join(self.version_root, code)
+                try:
+                    os.mkdir(folder)  # 原子操作：建成功了这个号就是我们的
+                except FileExistsError:
+                    number += 1
+                    continue
+                break
+            self._append({"op": "reserve", "next_version": number + 1})
+        return code, folder
+
+    def add_version(self, info):
+        # 第一个版本顺便把资产名记下来 (之后别人从别的场景名打开也还是这个资产名)
+        self._commit({"op": "add", "version": info, "asset_name": self.asset_name})
+
+    def update_version(self, code, **fields):
+        self._commit({"op": "update", "version": code, "fields": fields})
+
+    def set_published(self, code, state=True):
+        self.update_version(code, is_published=bool(state))
+
+    def _commit(self, entry):
+        with self.lock():
+            count = self._append(entry)
+            if count >= COMPACT_THRESHOLD:
+                self._compact()
+
+    def compact(self):
+        """手动压缩 (把日志合进 meta.json)"""
+        with self.lock():
+            self._compact()
+
+    def _append(self, entry):
+        """往日志追加一行 (调用方拿着锁)，返回日志现在的行数"""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with io.open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        with io.open(self.journal_path, "r", encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def _compact(self):
+        data = self.load()
+        data["generation"] += 1
+        # 1. 先写新索引 (这时候旧日志还在，读到 "新索引 + 旧日志" 重放结果也一样)
+        _write_atomic(self.meta_path, json.dumps(data, indent=4, ensure_ascii=False))
+        # 2. 再换成只有表头的新日志
+        header = json.dumps({"op": "header", "generation": data["generation"]}) + "\n"
+        _write_atomic(self.journal_path, header)
+
+
+def _apply(data, entry):
+    """重放一条日志 (幂等)"""
+    op = entry.get("op")
+    if op == "reserve":
+        data["next_version"] = max(data["next_version"], entry["next_version"])
+    elif op == "add":
+        if entry.get("asset_name"):
+            data.setdefault("asset_name", entry["asset_name"])
+        info = entry["version"]
+        data["versions"][info["version"]] = info
+        number = version_number(info["version"])
+        if number is not None:
+            data["next_version"] = max(data["next_version"], number + 1)
+    elif op == "update":
+        info = data["versions"].get(entry["version"])
+        if info is not None:
+            info.update(entry["fields"])
+
+
+def _write_atomic(path, text):
+    """写临时文件再 os.replace，别人读到的要么是旧文件要么是新文件"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with io.open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
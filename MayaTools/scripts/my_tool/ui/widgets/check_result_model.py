@@ -0,0 +1,169 @@
+try:
+    from PySide2 import QtWidgets, QtCore, QtGui
+except ImportError:
+    from PySide6 import QtWidgets, QtCore, QtGui
+
+from ...core import check_profiler
+
+# 失败物体每次展开/滚动到底部时加载多少行
+PAGE_SIZE = 500
+
+COLUMNS = ["Check Item", "Status", "Message", "Profile"]
+
+STATUS_COLORS = {
+    "Passed": "#66FF66",
+    "Failed": "#FF5555",
+}
+
+
+class CheckResultModel(QtCore.QAbstractItemModel):
+    """
+    检查结果的 Model (两层：检查项 -> 失败物体)。
+    失败物体不会一次性建成控件，只记录 "已经加载了多少行"，
+    真正显示的时候才从 item.failed_objects 里按下标去取 (几万个 N-gon 也不会卡)。
+
+    internalId 约定：检查项行是 0，失败物体行是 "所属检查项行号 + 1"。
+    UserRole 返回的数据和以前的 QTreeWidget 一样：检查项行是 CheckItem，
+    物体行是 failed_objects 里的原始条目 (节点路径字符串或 ComponentFailure)。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.checks = []
+        self._loaded = []  # 每个检查项已经加载的子行数
+
+        style = QtWidgets.QApplication.style()
+        self._icons = {
+            "Passed": style.standardIcon(QtWidgets.QStyle.SP_DialogApplyButton),
+            "Failed": style.standardIcon(QtWidgets.QStyle.SP_MessageBoxCritical),
+        }
+
+    # ----------------------------------------------------------------
+    # 数据接口
+    # ----------------------------------------------------------------
+    def set_checks(self, checks):
+        self.beginResetModel()
+        self.checks = list(checks)
+        self._loaded = [0] * len(self.checks)
+        self.endResetModel()
+
+    def refresh_check(self, row):
+        """某个检查项重新跑过 (比如 fix 之后)：清空已加载的子行，刷新这一行"""
+        if self._loaded[row]:
+            self.beginRemoveRows(self.index(row, 0), 0, self._loaded[row] - 1)
+            self._loaded[row] = 0
+            self.endRemoveRows()
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+
+    def check_at(self, index):
+        """index 所属的检查项 (物体行返回它的父检查项)"""
+        if not index.isValid():
+            return None
+        check_id = index.internalId()
+        return self.checks[index.row() if check_id == 0 else check_id - 1]
+
+    def is_object_index(self, index):
+        return index.isValid() and index.internalId() != 0
+
+    # ----------------------------------------------------------------
+    # QAbstractItemModel 必须实现的部分
+    # ----------------------------------------------------------------
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        # 只有两层：物体行没有子行
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QtCore.QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return len(self.checks)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self._loaded[parent.row()]
+        return 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(COLUMNS)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return bool(self.checks)
+        if parent.internalId() == 0:
+            # 还没加载也要显示展开箭头
+            return bool(self.checks[parent.row()].failed_objects)
+        return False
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+        return self._loaded[parent.row()] < len(self.checks[parent.row()].failed_objects)
+
+    def fetchMore(self, parent):
+        row = parent.row()
+        total = len(self.checks[row].failed_objects)
+        start = self._loaded[row]
+        count = min(PAGE_SIZE, total - start)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, start, start + count - 1)
+        self._loaded[row] += count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if index.internalId() != 0:
+            return self._object_data(index, role)
+
+        item = self.checks[index.row()]
+        column = index.column()
+
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return item.label
+            if column == 1:
+                return item.status
+            if column == 2:
+                if item.failed_objects:
+                    return f"{item.info_message} ({len(item.failed_objects)} items)"
+                return item.info_message
+            if column == 3:
+                if "fix" in item.profile:
+                    return f"fix: {check_profiler.format_profile(item.profile['fix'])}"
+                return check_profiler.format_profile(item.profile.get("check"))
+        elif role == QtCore.Qt.ForegroundRole and column == 1:
+            color = STATUS_COLORS.get(item.status)
+            return QtGui.QBrush(QtGui.QColor(color)) if color else None
+        elif role == QtCore.Qt.DecorationRole and column == 0:
+            return self._icons.get(item.status)
+        elif role == QtCore.Qt.UserRole:
+            return item
+        return None
+
+    def _object_data(self, index, role):
+        item = self.checks[index.internalId() - 1]
+        if index.row() >= len(item.failed_objects):
+            # fix 之后 failed_objects 已经变了，旧的行还没来得及删
+            return None
+        obj = item.failed_objects[index.row()]
+
+        if role == QtCore.Qt.DisplayRole:
+            if index.column() == 0:
+                return str(obj)  # ComponentFailure 显示成 "mesh (N faces)"
+            if index.column() == 2:
+                return item.get_object_detail(obj)
+        elif role == QtCore.Qt.UserRole:
+            return obj
+        return None
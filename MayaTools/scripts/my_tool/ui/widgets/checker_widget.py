@@ -3,12 +3,16 @@ try:
 except ImportError:
     from PySide6 import QtWidgets, QtCore, QtGui
 
-import maya.cmds as cmds
 from ...core import checker_logic  # 导入逻辑层
+from ...core import check_profiler
+from ...core.checks import api_backend
+from ...core.checks.failures import ComponentFailure
+from .check_result_model import CheckResultModel
 
 class CheckerWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.live_checker = None  # Live 模式下监听场景变化的 LiveChecker
         self._init_ui()
         self._connect_signals()
 
@@ -35,12 +39,20 @@ class CheckerWidget(QtWidgets.QWidget):
         top_layout.addWidget(self.combo_mode)
         top_layout.addWidget(self.btn_run)
 
+        # Live：检查跑完后继续监听场景，改了哪里就只复查哪里
+        self.chk_live = QtWidgets.QCheckBox("Live")
+        self.chk_live.setToolTip("Re-check changed nodes automatically after the first run")
+        top_layout.addWidget(self.chk_live)
+
         # --- B. 核心展示区 ---
-        self.tree = QtWidgets.QTreeWidget()
-        self.tree.setColumnCount(3)
-        self.tree.setHeaderLabels(["Check Item", "Status", "Message"])
+        # Model/View：失败物体按需分页加载，不再给每个物体建一个 QTreeWidgetItem
+        self.model = CheckResultModel(self)
+        self.tree = QtWidgets.QTreeView()
+        self.tree.setModel(self.model)
+        self.tree.setUniformRowHeights(True)  # 行高一致，滚动几万行也不用逐行算高度
         self.tree.setColumnWidth(0, 220)
         self.tree.setColumnWidth(1, 80)
+        self.tree.setColumnWidth(2, 260)
         self.tree.setAlternatingRowColors(True)
 
         # --- C. 底部功能区 ---
@@ -62,17 +74,20 @@ class CheckerWidget(QtWidgets.QWidget):
 
     def _connect_signals(self):
         self.btn_run.clicked.connect(self.run_checks)
-        self.tree.itemDoubleClicked.connect(self.on_item_double_clicked)
-        self.tree.itemClicked.connect(self.on_item_clicked)  # 单击用于更新“修复按钮”状态
+        self.tree.doubleClicked.connect(self.on_item_double_clicked)
+        self.tree.clicked.connect(self.on_item_clicked)  # 单击用于更新“修复按钮”状态
         self.btn_select_fail.clicked.connect(self.select_all_failed_in_ui)
         self.btn_fix.clicked.connect(self.fix_selected_item)
         self.btn_export.clicked.connect(self.export_report)
+        self.chk_live.toggled.connect(self.on_live_toggled)
 
     # ----------------------------------------------------------------
     # 核心逻辑：运行检查并填充 UI
     # ----------------------------------------------------------------
     def run_checks(self):
-        self.tree.clear()
+        # 旧的检查项马上要被换掉，先停掉监听
+        self._stop_live()
+        self.model.set_checks([])
 
         # 1. 获取当前模式
         mode = self.combo_mode.currentText()
@@ -83,51 +98,81 @@ class CheckerWidget(QtWidgets.QWidget):
 
         print(f"UI: Running {len(checks)} checks for {mode}...")
 
-        # 3. 遍历运行并生成 UI
-        for item in checks:
-            # --- 运行核心检查代码 ---
-            item.check()
-
-            # --- 创建父节点 ---
-            root = QtWidgets.QTreeWidgetItem(self.tree)
-            root.setText(0, item.label)
-            root.setText(1, item.status)
-            root.setText(2, item.info_message)
-
-            # 【黑科技】把整个 item 对象存入 UI 控件中
-            # UserRole 是 Qt 预留给我们存私货的地方
-            root.setData(0, QtCore.Qt.UserRole, item)
-
-            # --- 设置样式 ---
-            if item.status == "Passed":
-                root.setForeground(1, QtGui.QBrush(QtGui.QColor("#66FF66")))  # 绿字
-                root.setIcon(0, self.style().standardIcon(QtWidgets.QStyle.SP_DialogApplyButton))
-            elif item.status == "Failed":
-                root.setForeground(1, QtGui.QBrush(QtGui.QColor("#FF5555")))  # 红字
-                root.setIcon(0, self.style().standardIcon(QtWidgets.QStyle.SP_MessageBoxCritical))
-
-                # --- 如果失败，添加子节点显示具体物体 ---
-                if item.failed_objects:
-                    for obj in item.failed_objects:
-                        child = QtWidgets.QTreeWidgetItem(root)
-                        child.setText(0, obj)
-                        # 把具体的物体名字也存起来
-                        child.setData(0, QtCore.Qt.UserRole, obj)
-
-                        # 展开所有项方便查看
-        self.tree.expandAll()
+        # --- 运行核心检查代码 ---
+        # 所有检查项共用一个场景快照 (场景只查一遍)，不碰场景的检查项并行跑
+        checker_logic.run_checks(checks)
+
+        # 记录耗时历史，比以往明显变慢的检查项打印出来
+        check_profiler.record_run(mode, checks)
+        for label, elapsed, median in check_profiler.find_regressions(check_profiler.load_history(), mode):
+            print(f"UI: [Slow] {label}: {elapsed * 1000:.1f} ms (usually {median * 1000:.1f} ms)")
+
+        # 3. 把结果交给 Model (样式、子节点都由 CheckResultModel 负责)
+        self.model.set_checks(checks)
+
+        # 展开失败的检查项方便查看 (只会加载第一页物体，不用 expandAll)
+        for row, item in enumerate(checks):
+            if item.status == "Failed" and item.failed_objects:
+                self.tree.expand(self.model.index(row, 0))
+
+        if self.chk_live.isChecked():
+            self._start_live()
+
+    # ----------------------------------------------------------------
+    # Live 模式
+    # ----------------------------------------------------------------
+    def on_live_toggled(self, checked):
+        if not checked:
+            self._stop_live()
+        elif self.model.checks:
+            # 已经有结果了：直接在这批结果上开始监听
+            self._start_live()
+        else:
+            # 还没跑过：先完整跑一遍 (跑完会自动开始监听)
+            self.run_checks()
+
+    def _start_live(self):
+        from ...core.live_checker import LiveChecker
+
+        self._stop_live()
+        self.live_checker = LiveChecker(self.model.checks, parent=self)
+        self.live_checker.results_updated.connect(self.on_live_results)
+        self.live_checker.start()
+        print("UI: Live check started.")
+
+    def _stop_live(self):
+        if self.live_checker is None:
+            return
+        self.live_checker.stop()
+        self.live_checker.deleteLater()
+        self.live_checker = None
+        print("UI: Live check stopped.")
+
+    def on_live_results(self, rows):
+        for row in rows:
+            self.model.refresh_check(row)
+            item = self.model.checks[row]
+            if item.status == "Failed" and item.failed_objects:
+                self.tree.expand(self.model.index(row, 0))
+
+    def closeEvent(self, event):
+        # 窗口关掉后回调还留在 Maya 里会一直触发，必须移除
+        self._stop_live()
+        super().closeEvent(event)
 
     # ----------------------------------------------------------------
     # 交互逻辑
     # ----------------------------------------------------------------
-    def on_item_double_clicked(self, item, col):
+    def on_item_double_clicked(self, index):
         """双击逻辑：如果是物体则选中，如果是检查项则无视"""
-        data = item.data(0, QtCore.Qt.UserRole)
-
-        # 如果存的是字符串，说明是具体的物体
-        if isinstance(data, str):
-            if cmds.objExists(data):
-                cmds.select(data)
+        data = index.data(QtCore.Qt.UserRole)
+
+        # 如果存的是字符串 (具体的物体) 或 ComponentFailure (某个 mesh 上的一堆面)
+        # FPS 这类检查项的 "物体行" 只是说明文字，不是节点
+        check_obj = self.model.check_at(index)
+        if isinstance(data, (str, ComponentFailure)) and check_obj.failures_are_nodes:
+            valid, stale = api_backend.select_items([data])
+            if valid:
                 print(f"Selected: {data}")
             else:
                 print(f"Object not found: {data}")
@@ -135,9 +180,9 @@ class CheckerWidget(QtWidgets.QWidget):
         # 如果存的是 CheckItem 对象，说明点了父节点，这里不做操作
         # (或者你可以设计成双击父节点就是一键修复)
 
-    def on_item_clicked(self, item, col):
+    def on_item_clicked(self, index):
         """单击逻辑：判断修复按钮是否可用"""
-        data = item.data(0, QtCore.Qt.UserRole)
+        data = index.data(QtCore.Qt.UserRole)
 
         # 检查 data 是否是 CheckItem 实例，并且是否支持 fix
         # hasattr 检查是为了防止拿到的是字符串(子节点)
@@ -150,48 +195,37 @@ class CheckerWidget(QtWidgets.QWidget):
 
     def fix_selected_item(self):
         """点击修复按钮"""
-        item = self.tree.currentItem()
-        if not item: return
+        index = self.tree.currentIndex()
+        if not index.isValid() or self.model.is_object_index(index): return
 
         # 取出藏好的对象 checkItem
-        check_obj = item.data(0, QtCore.Qt.UserRole)
+        check_obj = self.model.check_at(index)
 
         if hasattr(check_obj, "fix"):
             print(f"UI: Fixing {check_obj.label}...")
             # 1. 调用 Core 的修复
-            check_obj.fix()
+            check_profiler.run_fix(check_obj)
 
             # 2. 修复完后，Core 会自动 re-check
-            # 我们只需要更新 UI 这一行的文字和颜色即可
-            item.setText(1, check_obj.status)
-            item.setText(2, check_obj.info_message)
-
-            # 简单粗暴的方法：修复完直接变成绿色
-            if check_obj.status == "Passed":
-                item.setForeground(1, QtGui.QBrush(QtGui.QColor("#66FF66")))
-                item.setIcon(0, self.style().standardIcon(QtWidgets.QStyle.SP_DialogApplyButton))
-                # 删除所有子节点 (错误列表)
-                item.takeChildren()
+            # 我们只需要让 Model 刷新这一行 (文字、颜色、子节点都会跟着 failed_objects 变)
+            self.model.refresh_check(index.row())
 
     def select_all_failed_in_ui(self):
-        """把 Tree 里所有展开的、红色的子节点对应的物体都选中"""
+        """把所有失败检查项里的物体都选中 (包括还没加载到 UI 的)"""
         all_failed_objs = []
 
-        # 遍历根节点
-        iterator = QtWidgets.QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            data = item.data(0, QtCore.Qt.UserRole)
-
-            # 如果是字符串 (代表是子物体)
-            if isinstance(data, str) and cmds.objExists(data):
-                all_failed_objs.append(data)
-
-            iterator += 1
+        # 遍历检查项
+        for item in self.model.checks:
+            if item.status == "Failed" and item.failures_are_nodes:
+                all_failed_objs.extend(item.failed_objects)
 
         if all_failed_objs:
-            cmds.select(all_failed_objs)
-            print(f"Selected {len(all_failed_objs)} failed objects.")
+            # 一次性建好 MSelectionList 再选中；ComponentFailure 按 mesh 加，不逐个面拼字符串
+            # 已经不存在的物体会被跳过
+            valid, stale = api_backend.select_items(all_failed_objs)
+            print(f"Selected {len(valid)} failed objects.")
+            if stale:
+                print(f"{len(stale)} objects no longer exist (renamed or deleted), e.g. {stale[0]}")
 
 
 
@@ -201,20 +235,16 @@ class CheckerWidget(QtWidgets.QWidget):
         """将当前检查结果导出为 JSON 文件"""
         report_data = {}
 
-        # 1. 遍历 TreeWidget 收集数据
-        iterator = QtWidgets.QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            check_obj = item.data(0, QtCore.Qt.UserRole)
-
-            # 只要是 CheckItem 对象 (排除子节点物体)
-            if hasattr(check_obj, "label"):
-                report_data[check_obj.label] = {
-                    "status": check_obj.status,
-                    "message": check_obj.info_message,
-                    "failed_count": len(check_obj.failed_objects)
-                }
-            iterator += 1
+        # 1. 遍历 Model 里的检查项收集数据
+        for check_obj in self.model.checks:
+            data = check_obj.get_report_data()
+            # 检查之后被改名/删掉的物体单独列出来，报告里不会混进已经不存在的路径
+            if check_obj.failed_objects and check_obj.failures_are_nodes:
+                _, stale, _ = api_backend.resolve_items(check_obj.failed_objects)
+                if stale:
+                    data["stale_count"] = len(stale)
+                    data["stale_objects"] = [str(obj) for obj in stale]
+            report_data[check_obj.label] = data
 
         # 2. 保存文件 (保存到当前用户的桌面)
         desktop = os.path.join(os.path.expanduser("~"), "Desktop")
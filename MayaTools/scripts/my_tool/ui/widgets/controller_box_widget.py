@@ -43,13 +43,19 @@ class ControlBoxWidget(QtWidgets.QWidget):
         self.input_name = QtWidgets.QLineEdit()
         self.input_name.setPlaceholderText("Auto-generated name")
         self.combo_shape = QtWidgets.QComboBox()
-        self.combo_shape.addItems(["circle", "Square", "Cube"])
+        self.combo_shape.addItems(controller_logic.get_shape_names())
+        # 把选中的曲线存进形状库 (存到用户形状库，下拉框里马上能选)
+        self.btn_capture_shape = QtWidgets.QPushButton("Capture")
+        self.btn_capture_shape.setToolTip("Save the selected curve as a new controller shape.")
+        layout_shape = QtWidgets.QHBoxLayout()
+        layout_shape.addWidget(self.combo_shape, 1)
+        layout_shape.addWidget(self.btn_capture_shape)
         self.spin_size = QtWidgets.QDoubleSpinBox()
         self.spin_size.setValue(1.0)
         self.spin_size.setRange(0.1, 100.0)
 
         layout_settings.addRow("Name", self.input_name)
-        layout_settings.addRow("Shape", self.combo_shape)
+        layout_settings.addRow("Shape", layout_shape)
         layout_settings.addRow("Size", self.spin_size)
 
         # --- Section C: Color ---
@@ -82,17 +88,28 @@ class ControlBoxWidget(QtWidgets.QWidget):
         layout_opts.addWidget(self.chk_offset)
         layout_opts.addWidget(self.combo_constrain)
 
+        # 镜像 (只对批量 FK 生效)：左右一起建，颜色按左右自动分
+        self.chk_mirror = QtWidgets.QCheckBox("Mirror Sides (L/R) for FK Build")
+        self.chk_mirror.setToolTip("Also builds the opposite side (arm_L -> arm_R). Side colors come from config.SIDE_COLORS.")
+        layout_opts.addWidget(self.chk_mirror)
+
         # --- Section E: Action ---
         self.btn_create = QtWidgets.QPushButton("Create Controller")
         self.btn_create.setMinimumHeight(40)
         self.btn_create.setStyleSheet("font-weight: bold; font-size: 14px; background-color: #444;")
 
+        # 批量：选中根骨骼，一次给整棵骨骼树建 FK 控制器 (用上面同一套设置)
+        self.btn_build_fk = QtWidgets.QPushButton("Build FK Hierarchy (Selected Joints)")
+        self.btn_build_fk.setMinimumHeight(30)
+        self.btn_build_fk.setToolTip("Creates CTRL_<joint> for every joint under the selected roots in one undo step.")
+
         # --- add to main ---
         self.main_layout.addWidget(self.grp_target)
         self.main_layout.addWidget(self.grp_settings)
         self.main_layout.addWidget(self.grp_color)
         self.main_layout.addWidget(self.grp_options)
         self.main_layout.addWidget(self.btn_create)
+        self.main_layout.addWidget(self.btn_build_fk)
         self.main_layout.addStretch() # 底部顶上去
 
     def _create_color_btn(self, css_color, maya_idx):
@@ -114,11 +131,15 @@ class ControlBoxWidget(QtWidgets.QWidget):
         self.btn_blue.clicked.connect(self.on_preset_color_clicked)
         self.btn_yellow.clicked.connect(self.on_preset_color_clicked)
 
-        # 3. 自定义颜色
+        # 3. 形状库
+        self.btn_capture_shape.clicked.connect(self.on_capture_shape_clicked)
+
+        # 4. 自定义颜色
         self.btn_custom_color.clicked.connect(self.on_custom_color_clicked)
 
-        # 4. 创建按钮
+        # 5. 创建按钮
         self.btn_create.clicked.connect(self.on_create_clicked)
+        self.btn_build_fk.clicked.connect(self.on_build_fk_clicked)
 
     def on_load_selection(self):
         sel_name = controller_logic.get_current_selection_name()
@@ -149,6 +170,24 @@ class ControlBoxWidget(QtWidgets.QWidget):
 
             # (可选) 给个视觉反馈，比如让按钮边框变白，这里先略过
 
+    def on_capture_shape_clicked(self):
+        """选中的曲线存成新形状"""
+        name, ok = QtWidgets.QInputDialog.getText(self, "Capture Shape", "Shape name:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        try:
+            path = controller_logic.capture_selected_shape(name)
+        except (ValueError, RuntimeError) as e:
+            QtWidgets.QMessageBox.warning(self, "Capture Shape", str(e))
+            return
+        print(f"UI: Shape '{name}' saved to {path}")
+
+        # 刷新下拉框并选中新形状
+        self.combo_shape.clear()
+        self.combo_shape.addItems(controller_logic.get_shape_names())
+        self.combo_shape.setCurrentText(name)
+
     def on_custom_color_clicked(self):
         """点击 Custom 时触发"""
         # 弹出颜色选择框
@@ -192,4 +231,26 @@ class ControlBoxWidget(QtWidgets.QWidget):
         )
 
         # 3. 简单的反馈
-        print(f"UI: Core 返回结果 -> {result}")
\ No newline at end of file
+        print(f"UI: Core 返回结果 -> {result}")
+
+    def on_build_fk_clicked(self):
+        """批量建 FK：选中的骨骼 (没选就用 Load 进来的目标) 作为根"""
+        roots = controller_logic.get_selected_joints()
+        if not roots and self.current_target:
+            roots = [self.current_target]
+        if not roots:
+            print("UI: Please select the root joint(s) first.")
+            return
+
+        created = controller_logic.build_fk_hierarchy(
+            roots,
+            shape=self.combo_shape.currentText(),
+            size=self.spin_size.value(),
+            color_data=self.current_color_data,
+            match_pos=self.chk_match_pos.isChecked(),
+            match_rot=self.chk_match_rot.isChecked(),
+            use_offset=self.chk_offset.isChecked(),
+            constrain_mode=self.combo_constrain.currentText(),
+            mirror=self.chk_mirror.isChecked()
+        )
+        print(f"UI: Built {len(created)} controllers.")
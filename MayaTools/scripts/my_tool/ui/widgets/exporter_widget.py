@@ -5,8 +5,36 @@ except ImportError:
 
 import os
 import glob
-from ...core import version_manager
-from ...core.exporters import model_exporter, anim_exporter
+import datetime
+from ... import config
+from ...core import version_manager, version_catalog
+from ...core.exporters import export_scheduler
+
+
+class _CatalogCrawler(QtCore.QThread):
+    """后台爬项目目录 (网络盘上几百个镜头要好一会儿)，UI 线程只管查 SQLite"""
+
+    # (镜头数, 重新解析的镜头数)；被取消时不发
+    crawled = QtCore.Signal(int, int)
+    crawl_failed = QtCore.Signal(str)
+
+    def __init__(self, db_path, root, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.root = root
+
+    def run(self):
+        # sqlite 连接不能跨线程用，这里自己开一个
+        catalog = version_catalog.VersionCatalog(self.db_path)
+        try:
+            result = catalog.crawl(self.root, cancelled=self.isInterruptionRequested)
+        except Exception as e:
+            self.crawl_failed.emit(str(e))
+            return
+        finally:
+            catalog.close()
+        if result is not None:
+            self.crawled.emit(*result)
 
 
 class ExporterWidget(QtWidgets.QWidget):
@@ -16,6 +44,15 @@ class ExporterWidget(QtWidgets.QWidget):
         # 实例化版本管理器 (用于 Pipeline 模式)
         self.vm = version_manager.VersionManager()
 
+        # 整个项目的版本目录 (SQLite)，第一次用 Project 模式时才打开
+        self.catalog = None
+        self.crawler = None  # 正在跑的后台爬虫 (_CatalogCrawler)
+        self._auto_scanned = set()  # 自动爬过的根目录 (每个根目录只自动爬一次，之后靠 Rescan)
+
+        # 当前正在跑的导出批次 (没有就是 None)
+        self.scheduler = None
+        self.job_rows = {}  # 任务 index -> 表格行号
+
         self._init_ui()
         self._connect_signals()
 
@@ -34,6 +71,31 @@ class ExporterWidget(QtWidgets.QWidget):
         self.list_pipeline = QtWidgets.QListWidget()
         self.list_pipeline.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)  # 允许多选
         self.btn_refresh_pipe = QtWidgets.QPushButton("Refresh Published Versions")
+
+        # 整个项目：从版本目录 (SQLite) 查所有镜头的 Published 版本，不只是当前场景的
+        project_layout = QtWidgets.QHBoxLayout()
+        self.chk_project = QtWidgets.QCheckBox("Whole Project")
+        self.chk_project.setToolTip("List published versions from every shot under the project root (version catalog).")
+        self.input_project_root = QtWidgets.QLineEdit(config.PROJECT_ROOT)
+        self.input_project_root.setPlaceholderText("Project root (e.g. Z:/Project/Shots)")
+        self.input_project_root.setEnabled(False)
+        self.btn_browse_project = QtWidgets.QPushButton("...")
+        self.btn_browse_project.setFixedWidth(30)
+        self.btn_browse_project.setEnabled(False)
+        self.combo_since = QtWidgets.QComboBox()
+        self.combo_since.addItems(["Any Time", "Today", "Since Monday", "Last 7 Days"])
+        self.combo_since.setEnabled(False)
+        # 筛选只查目录；重新爬一遍项目要手动点 (在后台线程里跑)
+        self.btn_rescan = QtWidgets.QPushButton("Rescan")
+        self.btn_rescan.setToolTip("Crawl the project root again to pick up new versions (runs in the background).")
+        self.btn_rescan.setEnabled(False)
+        project_layout.addWidget(self.chk_project)
+        project_layout.addWidget(self.input_project_root)
+        project_layout.addWidget(self.btn_browse_project)
+        project_layout.addWidget(self.combo_since)
+        project_layout.addWidget(self.btn_rescan)
+
+        layout_pipe.addLayout(project_layout)
         layout_pipe.addWidget(self.list_pipeline)
         layout_pipe.addWidget(self.btn_refresh_pipe)
 
@@ -75,6 +137,31 @@ class ExporterWidget(QtWidgets.QWidget):
         layout_settings.addWidget(self.input_output, 1, 1)
         layout_settings.addWidget(self.btn_browse_out, 1, 2)
 
+        # 并行设置：每个文件交给一个 mayapy 后台进程
+        self.spin_workers = QtWidgets.QSpinBox()
+        self.spin_workers.setRange(1, 32)
+        self.spin_workers.setValue(config.EXPORT_WORKERS)
+
+        self.spin_timeout = QtWidgets.QSpinBox()
+        self.spin_timeout.setRange(10, 24 * 3600)
+        self.spin_timeout.setSuffix(" s")
+        self.spin_timeout.setValue(config.EXPORT_TIMEOUT)
+
+        self.spin_retries = QtWidgets.QSpinBox()
+        self.spin_retries.setRange(0, 10)
+        self.spin_retries.setValue(config.EXPORT_RETRIES)
+
+        layout_settings.addWidget(QtWidgets.QLabel("Workers:"), 2, 0)
+        layout_settings.addWidget(self.spin_workers, 2, 1)
+        layout_settings.addWidget(QtWidgets.QLabel("Timeout / File:"), 3, 0)
+        layout_settings.addWidget(self.spin_timeout, 3, 1)
+        layout_settings.addWidget(QtWidgets.QLabel("Retries:"), 4, 0)
+        layout_settings.addWidget(self.spin_retries, 4, 1)
+
+        # 增量导出：默认跳过源文件和设置都没变的文件
+        self.chk_force = QtWidgets.QCheckBox("Force re-export (ignore export cache)")
+        layout_settings.addWidget(self.chk_force, 5, 0, 1, 3)
+
         # --- C. 底部：执行与日志 ---
         self.progress_bar = QtWidgets.QProgressBar()
         self.progress_bar.setValue(0)
@@ -89,37 +176,66 @@ class ExporterWidget(QtWidgets.QWidget):
         self.btn_export.setMinimumHeight(50)
         self.btn_export.setStyleSheet("background-color: #D35400; color: white; font-weight: bold; font-size: 14px;")
 
+        # 任务队列：每个文件一行，显示状态
+        self.table_jobs = QtWidgets.QTableWidget(0, 3)
+        self.table_jobs.setHorizontalHeaderLabels(["File", "Status", "Attempts"])
+        self.table_jobs.horizontalHeader().setStretchLastSection(True)
+        self.table_jobs.setColumnWidth(0, 300)
+        self.table_jobs.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_jobs.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table_jobs.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.table_jobs.setMaximumHeight(180)
+
+        queue_layout = QtWidgets.QHBoxLayout()
+        self.btn_pause = QtWidgets.QPushButton("Pause")
+        self.btn_pause.setEnabled(False)
+        self.btn_cancel = QtWidgets.QPushButton("Cancel All")
+        self.btn_cancel.setEnabled(False)
+        queue_layout.addWidget(self.btn_pause)
+        queue_layout.addWidget(self.btn_cancel)
+
         # --- 组装 ---
         main_layout.addWidget(self.tabs)
         main_layout.addWidget(grp_settings)
         main_layout.addWidget(self.btn_export)
+        main_layout.addWidget(self.table_jobs)
+        main_layout.addLayout(queue_layout)
         main_layout.addWidget(self.progress_bar)
         main_layout.addWidget(self.text_log)
 
     def _connect_signals(self):
         self.btn_refresh_pipe.clicked.connect(self.refresh_pipeline_list)
+        self.chk_project.toggled.connect(self.on_project_toggled)
+        self.btn_browse_project.clicked.connect(self.browse_project_root)
+        self.combo_since.currentIndexChanged.connect(self.refresh_pipeline_list)
+        self.btn_rescan.clicked.connect(self.rescan_project)
         self.btn_browse.clicked.connect(self.browse_source_folder)
         self.btn_browse_out.clicked.connect(self.browse_output_folder)
         self.btn_export.clicked.connect(self.run_batch_export)
         self.input_folder.textChanged.connect(self.refresh_file_list)  # 路径变了自动刷新列表
+        self.btn_pause.clicked.connect(self.toggle_pause)
+        self.btn_cancel.clicked.connect(self.cancel_export)
+        self.table_jobs.customContextMenuRequested.connect(self.on_job_context_menu)
 
     # ----------------------------------------------------------------
     # 逻辑部分
     # ----------------------------------------------------------------
 
     def log(self, msg):
-        """往 UI 日志框里写字，并强制刷新界面"""
+        """往 UI 日志框里写字"""
         self.text_log.append(msg)
         # 强制滚动到底部
         cursor = self.text_log.textCursor()
         cursor.movePosition(QtGui.QTextCursor.End)
         self.text_log.setTextCursor(cursor)
-        # 【关键】让 UI 立即重绘，否则循环时界面是死的
-        QtWidgets.QApplication.processEvents()
 
     def refresh_pipeline_list(self):
         """Tab 1: 读取 meta.json 里的 Published 版本"""
         self.list_pipeline.clear()
+        if self.chk_project.isChecked():
+            self.refresh_project_list()
+            return
+
         self.vm.refresh_context()  # 刷新后端路径
 
         versions = self.vm.data.get("versions", {})
@@ -146,6 +262,94 @@ class ExporterWidget(QtWidgets.QWidget):
 
         self.log(f"Pipeline: Found {count} published versions.")
 
+    def on_project_toggled(self, checked):
+        self.input_project_root.setEnabled(checked)
+        self.btn_browse_project.setEnabled(checked)
+        self.combo_since.setEnabled(checked)
+        self.btn_rescan.setEnabled(checked and self.crawler is None)
+        self.refresh_pipeline_list()
+
+    def browse_project_root(self):
+        path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Project Root")
+        if path:
+            self.input_project_root.setText(path)
+            self.refresh_pipeline_list()
+
+    def _since_filter(self):
+        """时间下拉框 -> query 的 since"""
+        text = self.combo_since.currentText()
+        if text == "Today":
+            return version_catalog.start_of_day()
+        if text == "Since Monday":
+            return version_catalog.start_of_week()
+        if text == "Last 7 Days":
+            return version_catalog.start_of_day() - datetime.timedelta(days=7)
+        return None
+
+    def _project_root(self):
+        root = self.input_project_root.text().strip()
+        if not root or not os.path.isdir(root):
+            self.log("Pipeline: Please set a valid project root.")
+            return None
+        if self.catalog is None:
+            self.catalog = version_catalog.VersionCatalog()
+        return root
+
+    def refresh_project_list(self):
+        """Tab 1 (Whole Project): 只从 SQLite 查 Published 版本 (改筛选条件不会重新爬目录)"""
+        root = self._project_root()
+        if not root:
+            return
+
+        # 目录里还没有这个根目录的镜头 (第一次用)：后台爬一遍，爬完会再刷新
+        if not self.catalog.shot_count(root) and root not in self._auto_scanned:
+            self._auto_scanned.add(root)
+            self.rescan_project()
+            return
+
+        versions = self.catalog.query(published=True, since=self._since_filter(), root=root)
+
+        for info in versions:
+            item = QtWidgets.QListWidgetItem(
+                f"{info['asset_name']} {info['version']} | {info['comment']} ({info['author']}, {info['time']})")
+            item.setToolTip(info["full_path"])
+            item.setData(QtCore.Qt.UserRole, info["full_path"])
+            item.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon))
+            self.list_pipeline.addItem(item)
+
+        self.log(f"Pipeline: Found {len(versions)} published versions in {self.catalog.shot_count(root)} shots.")
+
+    def rescan_project(self):
+        """后台增量爬一遍项目目录，爬完刷新列表"""
+        if self.crawler is not None:
+            return  # 上一次还没爬完
+        root = self._project_root()
+        if not root:
+            return
+
+        self.log(f"Pipeline: Scanning {root} ...")
+        self.btn_rescan.setEnabled(False)
+        self.crawler = _CatalogCrawler(self.catalog.db_path, root, parent=self)
+        self.crawler.crawled.connect(self.on_project_crawled)
+        self.crawler.crawl_failed.connect(self.on_project_crawl_failed)
+        self.crawler.finished.connect(self._on_crawler_finished)
+        self.crawler.start()
+
+    def on_project_crawled(self, shots, updated):
+        self.log(f"Pipeline: Scanned {shots} shots ({updated} changed).")
+        if self.chk_project.isChecked():
+            self.list_pipeline.clear()
+            if shots:
+                self.refresh_project_list()
+
+    def on_project_crawl_failed(self, message):
+        self.log(f"Pipeline: Scan failed: {message}")
+
+    def _on_crawler_finished(self):
+        self.crawler.deleteLater()
+        self.crawler = None
+        self.btn_rescan.setEnabled(self.chk_project.isChecked())
+
     def browse_source_folder(self):
         """Tab 2: 选择源文件夹"""
         path = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Folder with .ma files")
@@ -209,14 +413,21 @@ class ExporterWidget(QtWidgets.QWidget):
             self.log("No files to export!")
             return
 
-        # 2. 准备导出器
+        # 2. 已经有批次在跑：直接排进队列
+        if self.scheduler and self.scheduler.isRunning():
+            added = 0
+            for file_path in tasks:
+                if self.scheduler.enqueue(file_path):
+                    added += 1
+            if added:
+                self.log(f"Queued {added} more files.")
+                return
+            # enqueue 失败说明批次刚好结束，往下开一个新批次
+
+        # 3. 准备导出设置
         export_type = self.combo_type.currentText()
-        if export_type == "Model":
-            worker = model_exporter.ModelExporter()
-        else:
-            worker = anim_exporter.AnimExporter()
 
-        # 3. 准备输出路径
+        # 4. 准备输出路径
         out_dir = self.input_output.text()
         if not out_dir:
             # 默认路径：在第一个文件的同级建立 _exports 文件夹
@@ -227,41 +438,154 @@ class ExporterWidget(QtWidgets.QWidget):
         if not os.path.exists(out_dir):
             os.makedirs(out_dir)
 
-        # 4. 开始循环 (Batch Loop)
+        # 5. 交给后台调度器 (QThread + mayapy 进程池)，UI 线程只接信号
         self.text_log.clear()
+        self.table_jobs.setRowCount(0)
+        self.job_rows = {}
         self.log(f"=== Starting Batch Export ({len(tasks)} files) ===")
         self.log(f"Mode: {export_type}")
         self.log(f"Output: {out_dir}")
+        self.log(f"Workers: {self.spin_workers.value()}")
 
         self.progress_bar.setRange(0, len(tasks))
         self.progress_bar.setValue(0)
 
-        success_count = 0
-
-        for i, file_path in enumerate(tasks):
-            file_name = os.path.basename(file_path)
-            self.log(f"\n[{i + 1}/{len(tasks)}] Processing: {file_name}...")
-
-            # --- 核心调用 ---
-            # run() 方法里包含了 Open -> Check -> Fix -> Bake -> Export
-            result = worker.run(file_path, out_dir)
+        self.scheduler = export_scheduler.ExportScheduler(
+            export_type,
+            out_dir,
+            tasks,
+            workers=self.spin_workers.value(),
+            timeout=self.spin_timeout.value(),
+            retries=self.spin_retries.value(),
+            force=self.chk_force.isChecked(),
+            parent=self,
+        )
+        for signal, slot in self._scheduler_connections():
+            signal.connect(slot)
+
+        self.btn_export.setText("ADD TO QUEUE")
+        self.btn_pause.setEnabled(True)
+        self.btn_pause.setText("Pause")
+        self.btn_cancel.setEnabled(True)
+
+        self.scheduler.start()
+
+    def _scheduler_connections(self):
+        """调度器信号 -> 槽 (连接和断开用同一张表)"""
+        signals = self.scheduler.signals
+        return (
+            (signals.job_queued, self.on_job_queued),
+            (signals.job_status_changed, self.on_job_status_changed),
+            (signals.job_log, self.on_job_log),
+            (signals.progress, self.on_export_progress),
+            (signals.batch_finished, self.on_batch_finished),
+        )
+
+    def closeEvent(self, event):
+        # 窗口关了批次还在跑：mayapy 进程会一直占着，调度线程还会往已经销毁的控件发信号
+        # 先断开信号 (排队中的信号不再进来)，再杀掉所有进程，等线程退出
+        if self.scheduler:
+            for signal, slot in self._scheduler_connections():
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    pass  # 已经断开了 (closeEvent 可能被调两次)
+            self.scheduler.cancel()
+            self.scheduler.wait()
+            self.scheduler = None
+        if self.crawler is not None:
+            # 爬虫每个镜头之间都会看一下有没有被叫停
+            self.crawler.requestInterruption()
+            self.crawler.wait()
+        super().closeEvent(event)
 
-            # --- 收集后端日志 ---
-            # 把 worker 里的 log 搬运到 UI 上
-            for msg in worker.log:
-                self.text_log.append(f"  | {msg}")
-
-            if result:
-                self.log(f"  ✅ Success!")
-                success_count += 1
-            else:
-                self.log(f"  ❌ Failed!")
-
-            # 更新进度
-            self.progress_bar.setValue(i + 1)
+    # ----------------------------------------------------------------
+    # 队列控制
+    # ----------------------------------------------------------------
+    def toggle_pause(self):
+        if not self.scheduler:
+            return
+        if self.scheduler.is_paused():
+            self.scheduler.resume()
+            self.btn_pause.setText("Pause")
+            self.log("Resumed.")
+        else:
+            self.scheduler.pause()
+            self.btn_pause.setText("Resume")
+            self.log("Paused: running files will finish, no new files will start.")
+
+    def cancel_export(self):
+        if self.scheduler:
+            self.scheduler.cancel()
+            self.log("Cancelling all jobs...")
+
+    def on_job_context_menu(self, pos):
+        """右键某一行：取消这个任务"""
+        row = self.table_jobs.rowAt(pos.y())
+        if row < 0 or not self.scheduler:
+            return
+        index = self.table_jobs.item(row, 0).data(QtCore.Qt.UserRole)
 
-            # 【防卡死关键】
-            QtWidgets.QApplication.processEvents()
+        menu = QtWidgets.QMenu(self)
+        action_cancel = menu.addAction("Cancel Job")
+        if menu.exec_(self.table_jobs.viewport().mapToGlobal(pos)) == action_cancel:
+            self.scheduler.cancel_job(index)
 
-        self.log(f"\n=== Batch Complete. Success: {success_count}/{len(tasks)} ===")
-        QtWidgets.QMessageBox.information(self, "Done", f"Exported {success_count} files.\nCheck logs for details.")
\ No newline at end of file
+    # ----------------------------------------------------------------
+    # 调度器信号 (都在 UI 线程里执行)
+    # ----------------------------------------------------------------
+    def on_job_queued(self, index, file_path):
+        row = self.table_jobs.rowCount()
+        self.table_jobs.insertRow(row)
+        self.job_rows[index] = row
+
+        item_file = QtWidgets.QTableWidgetItem(os.path.basename(file_path))
+        item_file.setToolTip(file_path)
+        item_file.setData(QtCore.Qt.UserRole, index)
+        self.table_jobs.setItem(row, 0, item_file)
+        self.table_jobs.setItem(row, 1, QtWidgets.QTableWidgetItem("Queued"))
+        self.table_jobs.setItem(row, 2, QtWidgets.QTableWidgetItem("0"))
+
+    def on_job_status_changed(self, index, status, attempts):
+        row = self.job_rows.get(index)
+        if row is None:
+            return
+        item_status = self.table_jobs.item(row, 1)
+        item_status.setText(status)
+        colors = {"Running": "#FFD166", "Success": "#66FF66", "Skipped": "#66AAFF", "Rejected": "#FF8844",
+                  "Failed": "#FF5555", "Cancelled": "#888888"}
+        if status in colors:
+            item_status.setForeground(QtGui.QBrush(QtGui.QColor(colors[status])))
+        self.table_jobs.item(row, 2).setText(str(attempts))
+
+        file_name = self.table_jobs.item(row, 0).text()
+        if status == "Running":
+            self.log(f"\n[{file_name}] Processing (attempt {attempts})...")
+        elif status == "Success":
+            self.log(f"[{file_name}] ✅ Success!")
+        elif status == "Skipped":
+            self.log(f"[{file_name}] Up to date, skipped.")
+        elif status == "Rejected":
+            self.log(f"[{file_name}] ❌ Rejected (not opened, see log above).")
+        elif status == "Failed":
+            self.log(f"[{file_name}] ❌ Failed!")
+        elif status == "Cancelled":
+            self.log(f"[{file_name}] Cancelled.")
+
+    def on_job_log(self, index, message):
+        row = self.job_rows.get(index)
+        file_name = self.table_jobs.item(row, 0).text() if row is not None else index
+        self.text_log.append(f"  | {file_name}: {message}")
+
+    def on_export_progress(self, finished, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(finished)
+
+    def on_batch_finished(self, success_count, total):
+        self.btn_export.setText("BATCH EXPORT")
+        self.btn_pause.setEnabled(False)
+        self.btn_pause.setText("Pause")
+        self.btn_cancel.setEnabled(False)
+
+        self.log(f"\n=== Batch Complete. Success: {success_count}/{total} ===")
+        QtWidgets.QMessageBox.information(self, "Done", f"Exported {success_count} files.\nCheck logs for details.")
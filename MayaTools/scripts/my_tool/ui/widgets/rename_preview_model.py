@@ -0,0 +1,64 @@
+try:
+    from PySide2 import QtCore, QtGui
+except ImportError:
+    from PySide6 import QtCore, QtGui
+
+from ...core import rename_plan
+
+COLUMNS = ["Old Name", "New Name", "Conflict"]
+
+CONFLICT_COLORS = {
+    rename_plan.CLASH: "#FF5555",
+    rename_plan.INVALID: "#FF5555",
+    rename_plan.DUPLICATE: "#FFAA33",
+}
+
+
+class RenamePreviewModel(QtCore.QAbstractTableModel):
+    """
+    改名预览表 (一行一个 RenameOp)。
+    只持有 RenamePlan，显示时按行号去取，一万个节点也不用建一万个 item。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.plan = None
+
+    def set_plan(self, plan):
+        self.beginResetModel()
+        self.plan = plan
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or self.plan is None:
+            return 0
+        return len(self.plan.ops)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        op = self.plan.ops[index.row()]
+        column = index.column()
+
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0:
+                return op.old_name
+            if column == 1:
+                return op.new_name
+            if column == 2:
+                return op.conflict
+        elif role == QtCore.Qt.ToolTipRole:
+            return op.path
+        elif role == QtCore.Qt.ForegroundRole and op.conflict and column in (1, 2):
+            return QtGui.QBrush(QtGui.QColor(CONFLICT_COLORS[op.conflict]))
+        elif role == QtCore.Qt.UserRole:
+            return op
+        return None
@@ -4,6 +4,7 @@ except ImportError:
     from PySide6 import QtWidgets, QtCore, QtGui
 
 from ...core import rename_logic
+from .rename_preview_model import RenamePreviewModel
 
 class RenamerWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
@@ -20,13 +21,15 @@ class RenamerWidget(QtWidgets.QWidget):
         self.tab_replace = self._create_replace_tab()
         self.tab_renumber = self._create_renumber_tab()
         self.tab_modify = self._create_modify_tab()
+        self.tab_template = self._create_template_tab()
 
         self.tabs.addTab(self.tab_replace, "Search && Replace")
         self.tabs.addTab(self.tab_renumber, "Renumber")
         self.tabs.addTab(self.tab_modify, "Prefix / Suffix")
+        self.tabs.addTab(self.tab_template, "Template")
 
         self.main_layout.addWidget(self.tabs)
-        self.main_layout.addStretch()
+        self.main_layout.addWidget(self._create_preview_group())
 
     def _create_replace_tab(self):
         widget = QtWidgets.QWidget()
@@ -50,6 +53,7 @@ class RenamerWidget(QtWidgets.QWidget):
         self.radio_all = QtWidgets.QRadioButton("Anywhere")
         self.radio_start = QtWidgets.QRadioButton("Start Only")
         self.radio_end = QtWidgets.QRadioButton("End Only")
+        self.radio_regex = QtWidgets.QRadioButton("Regex")
 
         self.radio_all.setChecked(True)  # 默认选中
 
@@ -57,10 +61,12 @@ class RenamerWidget(QtWidgets.QWidget):
         self.radio_all.setToolTip("Example: 'arm' -> 'leg' (arm_armor -> leg_legor)")
         self.radio_start.setToolTip("Only replace if it starts with the text.")
         self.radio_end.setToolTip("Only replace if it ends with the text (Safest for sides).")
+        self.radio_regex.setToolTip(r"Search is a regular expression. Example: '^(L|R)_(\w+)' -> '\2_\1'")
 
         layout_mode.addWidget(self.radio_all)
         layout_mode.addWidget(self.radio_start)
         layout_mode.addWidget(self.radio_end)
+        layout_mode.addWidget(self.radio_regex)
 
         # C. 选中范围
         self.chk_hierarchy = QtWidgets.QCheckBox("Include Hierarchy")
@@ -146,6 +152,69 @@ class RenamerWidget(QtWidgets.QWidget):
 
         return widget
 
+    def _create_template_tab(self):
+        widget = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(widget)
+
+        form = QtWidgets.QFormLayout()
+        self.input_template = QtWidgets.QLineEdit()
+        self.input_template.setPlaceholderText("e.g. {side}_{part}_{index:03d}_JNT")
+        self.input_template.setToolTip("Tokens: {name}, {index} and the named groups of the match pattern.")
+
+        self.input_pattern = QtWidgets.QLineEdit()
+        self.input_pattern.setPlaceholderText("e.g. (?P<side>[LR])_(?P<part>[a-z]+)")
+        self.input_pattern.setToolTip("Optional regex. Objects that don't match are left unchanged.")
+
+        self.spin_template_start = QtWidgets.QSpinBox()
+        self.spin_template_start.setRange(0, 9999)
+        self.spin_template_start.setValue(1)
+
+        form.addRow("Template:", self.input_template)
+        form.addRow("Match:", self.input_pattern)
+        form.addRow("Start {index}:", self.spin_template_start)
+
+        self.chk_template_hi = QtWidgets.QCheckBox("Include Hierarchy")
+
+        self.btn_apply_template = QtWidgets.QPushButton("Rename with Template")
+        self.btn_apply_template.setMinimumHeight(40)
+
+        layout.addLayout(form)
+        layout.addSpacing(10)
+        layout.addWidget(self.chk_template_hi)
+        layout.addWidget(self.btn_apply_template)
+        layout.addStretch()
+
+        return widget
+
+    def _create_preview_group(self):
+        """预览区：先看改名计划 (旧名/新名/冲突)，确认了再执行"""
+        grp = QtWidgets.QGroupBox("Preview")
+        layout = QtWidgets.QVBoxLayout(grp)
+
+        self.preview_model = RenamePreviewModel(self)
+        self.table_preview = QtWidgets.QTableView()
+        self.table_preview.setModel(self.preview_model)
+        self.table_preview.verticalHeader().setVisible(False)
+        self.table_preview.verticalHeader().setDefaultSectionSize(20)  # 固定行高，几万行也不卡
+        self.table_preview.horizontalHeader().setStretchLastSection(True)
+        self.table_preview.setColumnWidth(0, 180)
+        self.table_preview.setColumnWidth(1, 180)
+        self.table_preview.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+
+        self.lbl_preview = QtWidgets.QLabel("Preview the current tab before applying.")
+
+        btn_layout = QtWidgets.QHBoxLayout()
+        self.btn_preview = QtWidgets.QPushButton("Preview")
+        self.btn_apply_preview = QtWidgets.QPushButton("Apply Preview")
+        self.btn_apply_preview.setEnabled(False)  # 先预览才能执行
+        btn_layout.addWidget(self.btn_preview)
+        btn_layout.addWidget(self.btn_apply_preview)
+
+        layout.addWidget(self.table_preview)
+        layout.addWidget(self.lbl_preview)
+        layout.addLayout(btn_layout)
+        return grp
+
     def _connect_signals(self):
         # 1. Replace Tab
         self.btn_apply_replace.clicked.connect(self.on_replace_clicked)
@@ -157,18 +226,25 @@ class RenamerWidget(QtWidgets.QWidget):
         self.btn_add_prefix.clicked.connect(self.on_prefix_suffix_clicked)
         self.btn_add_suffix.clicked.connect(self.on_prefix_suffix_clicked)
 
+        # 4. Template Tab
+        self.btn_apply_template.clicked.connect(self.on_template_clicked)
+
+        # 5. Preview
+        self.btn_preview.clicked.connect(self.on_preview_clicked)
+        self.btn_apply_preview.clicked.connect(self.on_apply_preview_clicked)
+        self.tabs.currentChanged.connect(self._clear_preview)  # 换了操作，旧预览就不作数了
+
     # --- Slots ---
 
     def on_replace_clicked(self):
         search = self.input_search.text()
         replace = self.input_replace.text()
-        # 获取模式索引 (0, 1, 2)
-        # 这里用个小技巧：检查哪个 radio 被选中
-        mode = 0
-        if self.radio_start.isChecked(): mode = 1
-        if self.radio_end.isChecked(): mode = 2
+        mode = self._replace_mode()
         include_hi = self.chk_hierarchy.isChecked()
-        rename_logic.batch_replace(search, replace, mode, include_hi)
+        try:
+            rename_logic.batch_replace(search, replace, mode, include_hi)
+        except ValueError as e:
+            print(e)  # 正则写错了
 
     def on_renumber_clicked(self):
         base = self.input_base_name.text()
@@ -191,4 +267,80 @@ class RenamerWidget(QtWidgets.QWidget):
         pre = self.input_prefix.text()
         suf = self.input_suffix.text()
         include_hi = self.chk_modify_hi.isChecked()
-        rename_logic.batch_prefix_suffix(pre, suf, include_hierarchy=include_hi)
\ No newline at end of file
+        rename_logic.batch_prefix_suffix(pre, suf, include_hierarchy=include_hi)
+
+    def on_template_clicked(self):
+        template = self.input_template.text()
+        if not template:
+            print("Please enter a template (e.g. {side}_{part}_{index:03d}_JNT)")
+            return
+        try:
+            rename_logic.batch_template(template, self.input_pattern.text(), self.spin_template_start.value(),
+                                        include_hierarchy=self.chk_template_hi.isChecked())
+        except ValueError as e:
+            print(e)  # 模板 / 正则写错了
+
+    def _replace_mode(self):
+        # 获取模式索引 (0, 1, 2, 3)
+        # 这里用个小技巧：检查哪个 radio 被选中
+        if self.radio_start.isChecked(): return rename_logic.MODE_START
+        if self.radio_end.isChecked(): return rename_logic.MODE_END
+        if self.radio_regex.isChecked(): return rename_logic.MODE_REGEX
+        return rename_logic.MODE_ANYWHERE
+
+    # --- Preview ---
+
+    def _build_plan(self):
+        """按当前 tab 的输入出改名计划 (只算不改)，输入不完整返回 None"""
+        tab = self.tabs.currentWidget()
+        if tab is self.tab_replace:
+            return rename_logic.plan_replace(self.input_search.text(), self.input_replace.text(),
+                                             self._replace_mode(), self.chk_hierarchy.isChecked())
+        if tab is self.tab_renumber:
+            base = self.input_base_name.text()
+            if not base:
+                print("Please enter a base name format (e.g. Item_#)")
+                return None
+            return rename_logic.plan_renumber(base, self.spin_start.value(), self.spin_padding.value(),
+                                              include_hierarchy=self.chk_renumber_hi.isChecked())
+        if tab is self.tab_template:
+            template = self.input_template.text()
+            if not template:
+                print("Please enter a template (e.g. {side}_{part}_{index:03d}_JNT)")
+                return None
+            return rename_logic.plan_template(template, self.input_pattern.text(),
+                                              self.spin_template_start.value(),
+                                              include_hierarchy=self.chk_template_hi.isChecked())
+        return rename_logic.plan_prefix_suffix(self.input_prefix.text(), self.input_suffix.text(),
+                                               include_hierarchy=self.chk_modify_hi.isChecked())
+
+    def on_preview_clicked(self):
+        try:
+            plan = self._build_plan()
+        except ValueError as e:
+            # 模板 / 正则写错了：显示在预览区，不弹窗
+            self._clear_preview()
+            self.lbl_preview.setText(str(e))
+            return
+        if plan is None:
+            return
+        self.preview_model.set_plan(plan)
+
+        conflicts = plan.conflicts
+        blocked = len(plan.ops) - len(plan.runnable)
+        self.lbl_preview.setText(f"{len(plan.ops)} renames, {len(conflicts)} conflicts "
+                                 f"({blocked} will be skipped)")
+        self.btn_apply_preview.setEnabled(bool(plan.runnable))
+
+    def on_apply_preview_clicked(self):
+        plan = self.preview_model.plan
+        if plan is None:
+            return
+        # 执行的就是表里这一份计划，不再重新计算
+        rename_logic.apply_preview(plan)
+        self._clear_preview()
+
+    def _clear_preview(self):
+        self.preview_model.set_plan(None)
+        self.lbl_preview.setText("Preview the current tab before applying.")
+        self.btn_apply_preview.setEnabled(False)
@@ -0,0 +1,108 @@
+try:
+    from PySide2 import QtCore, QtGui
+except ImportError:
+    from PySide6 import QtCore, QtGui
+
+import os
+from collections import OrderedDict
+
+
+class _LoaderSignals(QtCore.QObject):
+    # (缓存 key, 缩放好的图，读失败是空 QImage)
+    loaded = QtCore.Signal(object, QtGui.QImage)
+
+
+class _ThumbnailTask(QtCore.QRunnable):
+    """线程池里读图 + 缩放 (QImage 可以在子线程用，QPixmap 不行)"""
+
+    def __init__(self, key, signals):
+        super().__init__()
+        self.key = key
+        self.signals = signals
+
+    def run(self):
+        path, _, _, width, height = self.key
+        reader = QtGui.QImageReader(path)
+        reader.setAutoTransform(True)
+        image = reader.read()
+        if not image.isNull():
+            image = image.scaled(width, height, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.signals.loaded.emit(self.key, image)
+
+
+class ThumbnailLoader(QtCore.QObject):
+    """
+    异步缩略图：读盘和缩放在 QThreadPool 里做，UI 线程只把结果转成 QPixmap。
+        loader = ThumbnailLoader(QtCore.QSize(320, 240))
+        loader.thumbnail_ready.connect(on_ready)   # (path, QPixmap)，文件不存在 / 读不了是空 QPixmap
+        pixmap = loader.load(path)                  # 缓存里有直接返回，没有返回 None，好了发信号
+        loader.prefetch([...])                      # 提前读 (优先级低于 load)
+
+    缓存是 LRU，key = (路径, mtime, 文件大小, 宽, 高)：文件被覆盖 (重新截图) 后 key 变了，自然会重新读。
+    """
+
+    thumbnail_ready = QtCore.Signal(str, QtGui.QPixmap)
+
+    def __init__(self, size, cache_size=200, threads=2, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.cache_size = cache_size
+
+        # 网络盘上同时读太多反而慢，线程数不用多
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(threads)
+
+        self._cache = OrderedDict()  # key -> QPixmap
+        self._pending = set()
+        self._signals = _LoaderSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    def _key(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (path, st.st_mtime_ns, st.st_size, self.size.width(), self.size.height())
+
+    def load(self, path):
+        """缓存里有就直接返回 QPixmap；否则丢给线程池，读好了发 thumbnail_ready，返回 None"""
+        key = self._key(path)
+        if key is None:
+            self.thumbnail_ready.emit(path, QtGui.QPixmap())
+            return None
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self._request(key, priority=1)
+        return None
+
+    def prefetch(self, paths):
+        """提前把缩略图读进缓存 (比如列表里选中项前后的几个)"""
+        for path in paths:
+            key = self._key(path)
+            if key is not None and key not in self._cache:
+                self._request(key, priority=0)
+
+    def _request(self, key, priority):
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        self.pool.start(_ThumbnailTask(key, self._signals), priority)
+
+    def _on_loaded(self, key, image):
+        self._pending.discard(key)
+        pixmap = QtGui.QPixmap.fromImage(image) if not image.isNull() else QtGui.QPixmap()
+        if not pixmap.isNull():
+            self._cache[key] = pixmap
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        self.thumbnail_ready.emit(key[0], pixmap)
+
+    def cancel_pending(self):
+        """丢掉还没开始的任务 (列表刷新了，之前排队的都没用了)"""
+        self.pool.clear()
+        self._pending.clear()
+
+    def clear(self):
+        self.cancel_pending()
+        self._cache.clear()
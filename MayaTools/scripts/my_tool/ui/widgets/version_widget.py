@@ -5,6 +5,13 @@ except ImportError:
 
 import os
 from ...core import version_manager  # 导入我们刚写好的后端
+from .thumbnail_loader import ThumbnailLoader
+
+THUMB_SIZE = QtCore.QSize(320, 240)
+ICON_SIZE = QtCore.QSize(160, 120)
+PREFETCH_RANGE = 2  # 选中一个版本时顺便预读前后几个的缩略图
+ICON_STATE_ROLE = QtCore.Qt.UserRole + 1  # 网格图标：None 还没读 / True 已经有图 / False 读不了 (缺图 / 坏图，别再读)
+BADGE_SIZE = 24  # 网格模式下发布角标的大小
 
 
 class VersionWidget(QtWidgets.QWidget):
@@ -14,6 +21,12 @@ class VersionWidget(QtWidgets.QWidget):
         # 实例化后端逻辑
         self.manager = version_manager.VersionManager()
 
+        # 缩略图在线程池里读 + 缩放，点列表不再卡 (详情大图和网格小图各一份缓存)
+        self.thumb_loader = ThumbnailLoader(THUMB_SIZE, parent=self)
+        self.icon_loader = ThumbnailLoader(ICON_SIZE, cache_size=500, parent=self)
+        self.current_thumb_path = ""  # 详情面板正在等的图
+        self.items_by_thumb = {}  # 缩略图绝对路径 -> 列表项 (网格模式设图标用)
+
         self._init_ui()
         self._connect_signals()
 
@@ -33,8 +46,15 @@ class VersionWidget(QtWidgets.QWidget):
         self.btn_refresh = QtWidgets.QPushButton("Refresh")
         self.btn_refresh.setFixedWidth(80)
 
+        # 列表 / 缩略图网格切换
+        self.btn_grid = QtWidgets.QPushButton("Grid")
+        self.btn_grid.setCheckable(True)
+        self.btn_grid.setFixedWidth(60)
+        self.btn_grid.setToolTip("Show versions as a thumbnail grid")
+
         info_layout.addWidget(self.lbl_project)
         info_layout.addStretch()
+        info_layout.addWidget(self.btn_grid)
         info_layout.addWidget(self.btn_refresh)
 
         # --- B. 中间核心区 (左右分栏) ---
@@ -122,6 +142,14 @@ class VersionWidget(QtWidgets.QWidget):
         self.btn_save.clicked.connect(self.on_save_clicked)
         self.btn_refresh.clicked.connect(self.refresh_list)
         self.btn_open.clicked.connect(self.on_open_clicked)
+        self.btn_grid.toggled.connect(self.on_grid_toggled)
+
+        # 缩略图
+        self.thumb_loader.thumbnail_ready.connect(self.on_thumbnail_ready)
+        self.icon_loader.thumbnail_ready.connect(self.on_icon_ready)
+        # 网格模式：滚动 / 窗口变大时才去读露出来的图标
+        self.list_widget.verticalScrollBar().valueChanged.connect(self.load_visible_icons)
+        self.list_widget.viewport().installEventFilter(self)
 
         # 列表交互
         self.list_widget.itemClicked.connect(self.on_item_clicked)
@@ -137,6 +165,9 @@ class VersionWidget(QtWidgets.QWidget):
     def refresh_list(self):
         """调用 Core 读取数据并刷新列表"""
         self.list_widget.clear()
+        self.items_by_thumb = {}
+        self.thumb_loader.cancel_pending()
+        self.icon_loader.cancel_pending()
         self.manager.refresh_context()  # 确保路径是对的
 
         # 1. 更新顶部资产名
@@ -164,9 +195,18 @@ class VersionWidget(QtWidgets.QWidget):
 
             # 数据绑定：把整条 info 字典存进去，方便后面取图片路径
             item.setData(QtCore.Qt.UserRole, info)
+            item.setToolTip(display_text)
+
+            thumb_path = self._thumb_path(info)
+            if thumb_path:
+                self.items_by_thumb[thumb_path] = item
 
             self.list_widget.addItem(item)
 
+        if self.btn_grid.isChecked():
+            # 等布局算好了再看哪些项露出来了
+            QtCore.QTimer.singleShot(0, self.load_visible_icons)
+
     def on_save_clicked(self):
         comment = self.input_comment.toPlainText()
         make_thumb = self.chk_make_thumb.isChecked()
@@ -202,23 +242,104 @@ class VersionWidget(QtWidgets.QWidget):
         # 3. 启用打开按钮
         self.btn_open.setEnabled(True)
 
-        # 4. 【核心】显示图片
-        thumb_rel_path = info.get("thumbnail")
-        if thumb_rel_path:
-            # 拼出绝对路径
-            full_thumb_path = os.path.join(self.manager.workspace_path, thumb_rel_path)
-
-            if os.path.exists(full_thumb_path):
-                pixmap = QtGui.QPixmap(full_thumb_path)
-                # 缩放以适应标签 (KeepAspectRatio)
-                scaled_pix = pixmap.scaled(self.lbl_thumbnail.size(), QtCore.Qt.KeepAspectRatio,
-                                           QtCore.Qt.SmoothTransformation)
-                self.lbl_thumbnail.setPixmap(scaled_pix)
-            else:
-                self.lbl_thumbnail.setText("Image Missing")
+        # 4. 【核心】显示图片 (缓存里有直接显示，没有的话后台读，读好了 on_thumbnail_ready 再显示)
+        self.current_thumb_path = self._thumb_path(info)
+        if self.current_thumb_path:
+            # 先显示 Loading，文件不存在的话 load 里会马上发信号改成 Image Missing
+            self.lbl_thumbnail.setText("Loading...")
+            pixmap = self.thumb_loader.load(self.current_thumb_path)
+            if pixmap is not None:
+                self.lbl_thumbnail.setPixmap(pixmap)
         else:
             self.lbl_thumbnail.setText("No Preview")
 
+        # 5. 预读前后几个版本的缩略图，上下翻的时候直接出图
+        row = self.list_widget.row(item)
+        neighbours = []
+        for offset in range(1, PREFETCH_RANGE + 1):
+            for r in (row + offset, row - offset):
+                neighbour = self.list_widget.item(r) if 0 <= r < self.list_widget.count() else None
+                if neighbour is not None:
+                    neighbours.append(self._thumb_path(neighbour.data(QtCore.Qt.UserRole)))
+        self.thumb_loader.prefetch([path for path in neighbours if path])
+
+    def _thumb_path(self, info):
+        """版本信息里的缩略图 -> 绝对路径 (没有缩略图返回空字符串)"""
+        thumb_rel_path = info.get("thumbnail")
+        if not thumb_rel_path or not self.manager.workspace_path:
+            return ""
+        return os.path.join(self.manager.workspace_path, thumb_rel_path)
+
+    def on_thumbnail_ready(self, path, pixmap):
+        # 读好的可能是预读的、或者用户已经点了别的版本，只显示当前这张
+        if path != self.current_thumb_path:
+            return
+        if pixmap.isNull():
+            self.lbl_thumbnail.setText("Image Missing")
+        else:
+            self.lbl_thumbnail.setPixmap(pixmap)
+
+    # -----------------------------------------------------------
+    # 网格模式 (图标懒加载)
+    # -----------------------------------------------------------
+    def on_grid_toggled(self, checked):
+        if checked:
+            self.list_widget.setViewMode(QtWidgets.QListView.IconMode)
+            self.list_widget.setIconSize(ICON_SIZE)
+            self.list_widget.setGridSize(QtCore.QSize(ICON_SIZE.width() + 20, ICON_SIZE.height() + 40))
+            self.list_widget.setResizeMode(QtWidgets.QListView.Adjust)
+            self.list_widget.setMovement(QtWidgets.QListView.Static)
+            self.list_widget.setWordWrap(True)
+        else:
+            self.list_widget.setViewMode(QtWidgets.QListView.ListMode)
+            self.list_widget.setIconSize(QtCore.QSize())
+            self.list_widget.setGridSize(QtCore.QSize())
+            self.list_widget.setWordWrap(False)
+        # 图标 (发布的勾 / 缩略图) 跟着模式重建一遍
+        self.refresh_list()
+
+    def eventFilter(self, obj, event):
+        if obj is self.list_widget.viewport() and event.type() == QtCore.QEvent.Resize:
+            self.load_visible_icons()
+        return super().eventFilter(obj, event)
+
+    def load_visible_icons(self):
+        """只给露在视口里的项读缩略图 (几百个版本也不会一次全读)"""
+        if not self.btn_grid.isChecked():
+            return
+        viewport = self.list_widget.viewport().rect()
+        for path, item in self.items_by_thumb.items():
+            if item.data(ICON_STATE_ROLE) is not None:
+                continue  # 已经有图了 / 读过了读不了，滚动时不再每次去 stat
+            if not self.list_widget.visualItemRect(item).intersects(viewport):
+                continue
+            pixmap = self.icon_loader.load(path)
+            if pixmap is not None:
+                self.on_icon_ready(path, pixmap)
+
+    def on_icon_ready(self, path, pixmap):
+        item = self.items_by_thumb.get(path)
+        if item is None:
+            return
+        if pixmap.isNull():
+            # 缺图 / 读不了：记下来，留着原来的图标 (发布的勾)
+            item.setData(ICON_STATE_ROLE, False)
+            return
+        info = item.data(QtCore.Qt.UserRole) or {}
+        if info.get("is_published"):
+            pixmap = self._with_published_badge(pixmap)
+        item.setIcon(QtGui.QIcon(pixmap))
+        item.setData(ICON_STATE_ROLE, True)
+
+    def _with_published_badge(self, pixmap):
+        """缩略图换掉了列表模式的勾，网格里在右下角补一个 (画在副本上，不动缓存里的图)"""
+        badged = QtGui.QPixmap(pixmap)
+        badge = self.style().standardIcon(QtWidgets.QStyle.SP_DialogApplyButton).pixmap(BADGE_SIZE, BADGE_SIZE)
+        painter = QtGui.QPainter(badged)
+        painter.drawPixmap(badged.width() - badge.width() - 2, badged.height() - badge.height() - 2, badge)
+        painter.end()
+        return badged
+
     def on_open_clicked(self):
         # 获取当前选中的
         item = self.list_widget.currentItem()
@@ -244,12 +365,9 @@ class VersionWidget(QtWidgets.QWidget):
         info = item.data(QtCore.Qt.UserRole)
         new_state = self.chk_publish.isChecked()
 
-        # 修改内存数据
+        # 保存到磁盘 (只追加一条记录)
         v_code = info['version']
-        self.manager.data['versions'][v_code]['is_published'] = new_state
-
-        # 保存到磁盘
-        self.manager.save_data()
+        self.manager.set_published(v_code, new_state)
 
         # 刷新列表 UI (更新图标颜色)
         self.refresh_list()
\ No newline at end of file
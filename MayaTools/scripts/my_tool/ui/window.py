@@ -3,6 +3,7 @@ import maya.OpenMayaUI as omui
 import os
 
 from .widgets.renamer_widget import RenamerWidget
+from ..core import name_index
 
 # --- 1. 兼容性导入 ---
 try:
@@ -94,6 +95,14 @@ class MainWindow(QtWidgets.QWidget):
     def switch_page(self, index):
         self.stack.setCurrentIndex(index)
 
+    def closeEvent(self, event):
+        # 子页面收不到顶层窗口的 closeEvent，手动通知一下 (比如 Checker 要移除 Live 回调)
+        for i in range(self.stack.count()):
+            self.stack.widget(i).close()
+        # 短名索引的 Maya 回调也要移除 (下次打开窗口用到时会重建)
+        name_index.release_name_index()
+        super().closeEvent(event)
+
     # --- 单例启动方法 ---
     @classmethod
     def show_ui(cls):
@@ -0,0 +1,3 @@
+# my_tool/utils/maya_stub/maya/__init__.py
+# 【替身】不装 Maya 时用来顶替真正的 maya 包。
+# 只在 batch_runner 的 use_stub 模式下被加进 sys.path，用来在普通 Python 里跑通批量导出的调度流程。
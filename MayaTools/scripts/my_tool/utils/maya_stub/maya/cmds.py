@@ -0,0 +1,70 @@
+# my_tool/utils/maya_stub/maya/cmds.py
+"""
+maya.cmds 的最小替身。
+只实现导出流程真正会走到的几个命令，其余命令一律返回 None。
+"""
+import os
+import time
+
+# 当前 "打开" 的场景 (模拟 cmds.file(q=True, sceneName=True))
+_scene = {"name": ""}
+
+# 调试用：打开文件时人为延迟 (秒)，用来测试 worker 超时
+OPEN_DELAY_ENV = "MAYA_STUB_OPEN_DELAY"
+
+
+def file(*args, **kwargs):
+    if kwargs.get("query") or kwargs.get("q"):
+        if kwargs.get("sceneName") or kwargs.get("sn"):
+            return _scene["name"]
+        if kwargs.get("modified"):
+            return False
+        return None
+
+    if kwargs.get("open") or kwargs.get("o"):
+        path = args[0]
+        if not os.path.exists(path):
+            raise RuntimeError(f"File not found: {path}")
+        delay = float(os.environ.get(OPEN_DELAY_ENV, 0) or 0)
+        if delay:
+            time.sleep(delay)
+        _scene["name"] = path.replace("\\", "/")
+        return _scene["name"]
+
+    # 导出 (ea / es)：写一个占位文件，方便检查输出
+    if args and kwargs.get("type") == "FBX export":
+        with open(args[0], "w") as f:
+            f.write(f"stub fbx exported from {_scene['name']}\n")
+        return args[0]
+    return None
+
+
+def pluginInfo(*args, **kwargs):
+    return True
+
+
+def currentUnit(*args, **kwargs):
+    if kwargs.get("time"):
+        return "film"
+    if kwargs.get("linear"):
+        return "cm"
+    return None
+
+
+def playbackOptions(*args, **kwargs):
+    if kwargs.get("min") or kwargs.get("minTime"):
+        return 1.0
+    if kwargs.get("max") or kwargs.get("maxTime"):
+        return 24.0
+    return None
+
+
+def ls(*args, **kwargs):
+    return []
+
+
+def __getattr__(name):
+    # 其余命令：什么都不做
+    def _noop(*args, **kwargs):
+        return None
+    return _noop
@@ -0,0 +1,3 @@
+# my_tool/utils/maya_stub/maya/mel.py
+def eval(command):
+    return None
@@ -0,0 +1,7 @@
+# my_tool/utils/maya_stub/maya/standalone.py
+def initialize(name="python"):
+    pass
+
+
+def uninitialize():
+    pass
@@ -25,6 +25,15 @@ if path not in sys.path:
 
 # 2. 清理旧模块 (热重载核心)
 package_name = "{package_name}"
+
+# 删模块之前先移除旧模块注册的 Maya 回调，不然模块没了回调还在，重载一次多一份
+old_name_index = sys.modules.get(package_name + ".core.name_index")
+if old_name_index is not None and hasattr(old_name_index, "release_name_index"):
+    try:
+        old_name_index.release_name_index()
+    except Exception as e:
+        print(f"Failed to release name index callbacks: {{e}}")
+
 to_delete = []
 for name in sys.modules.keys():
     if name.startswith(package_name):
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# 测试直接跑 scripts 下面的源码 (和 Maya 通过 MayaTools.mod 加载的是同一份)
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
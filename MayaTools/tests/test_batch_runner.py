@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from my_tool.core.exporters.batch_runner import BatchExportRunner
+from my_tool.utils.maya_stub.maya.cmds import OPEN_DELAY_ENV
+
+SCENE = '//Maya ASCII 2024 scene\nrequires maya "2024";\ncurrentUnit -l centimeter -a degree -t film;\n'
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    path = tmp_path / "out"
+    path.mkdir()
+    return str(path)
+
+
+def make_scene(folder, name):
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / name
+    path.write_text(SCENE)
+    return str(path).replace("\\", "/")
+
+
+def run(runner, files, on_event=None):
+    """跑完整个批次，返回 (每个文件的 finished 事件, 每个文件的日志, done 事件)"""
+    finished, logs, done = {}, {}, None
+    for event in runner.iter_events(files):
+        if on_event:
+            on_event(runner, event)
+        if event["type"] == "finished":
+            finished[event["file"]] = event
+        elif event["type"] == "log":
+            logs.setdefault(event["file"], []).append(event["message"])
+        elif event["type"] == "done":
+            done = event
+    return finished, logs, done
+
+
+def make_runner(output_dir, **kwargs):
+    kwargs.setdefault("workers", 2)
+    kwargs.setdefault("timeout", 60)
+    kwargs.setdefault("retries", 0)
+    return BatchExportRunner("Model", output_dir, use_stub=True, use_cache=False, **kwargs)
+
+
+def test_success(tmp_path, output_dir):
+    files = [make_scene(tmp_path / "src", "Run.ma"), make_scene(tmp_path / "src", "Walk.ma")]
+    finished, _, done = run(make_runner(output_dir), files)
+
+    assert {f: e["status"] for f, e in finished.items()} == {files[0]: "Success", files[1]: "Success"}
+    assert all(e["attempts"] == 1 for e in finished.values())
+    assert done == {"type": "done", "success": 2, "total": 2}
+    assert sorted(os.listdir(output_dir)) == ["Run.fbx", "Walk.fbx"]
+
+
+def test_timeout_then_retry(tmp_path, output_dir, monkeypatch):
+    # 替身打开文件时睡 30 秒，超时 1 秒：每次都被杀掉，重试一次后放弃
+    monkeypatch.setenv(OPEN_DELAY_ENV, "30")
+    scene = make_scene(tmp_path / "src", "Slow.ma")
+    started = []
+    finished, logs, done = run(make_runner(output_dir, timeout=1, retries=1), [scene],
+                               on_event=lambda r, e: started.append(e["attempt"]) if e["type"] == "started" else None)
+
+    assert started == [1, 2]
+    assert finished[scene]["status"] == "Failed"
+    assert finished[scene]["attempts"] == 2
+    assert sum("Timeout after 1s" in m for m in logs[scene]) == 2
+    assert "Retrying (1/1)..." in logs[scene]
+    assert done["success"] == 0
+
+
+def test_duplicate_output_rejected(tmp_path, output_dir):
+    # 两个文件夹里的同名文件会导出成同一个 Run.fbx
+    first = make_scene(tmp_path / "a", "Run.ma")
+    second = make_scene(tmp_path / "b", "Run.ma")
+    finished, logs, done = run(make_runner(output_dir), [first, second])
+
+    assert finished[first]["status"] == "Success"
+    assert finished[second]["status"] == "Rejected"
+    assert finished[second]["attempts"] == 0
+    assert any("Output collision" in m and first in m for m in logs[second])
+    assert done == {"type": "done", "success": 1, "total": 2}
+
+
+def test_cancel(tmp_path, output_dir, monkeypatch):
+    # 第一个文件一开始跑就全部取消：正在跑的进程被杀掉，排队的不再启动
+    monkeypatch.setenv(OPEN_DELAY_ENV, "30")
+    files = [make_scene(tmp_path / "src", "A.ma"), make_scene(tmp_path / "src", "B.ma")]
+
+    def cancel_on_start(runner, event):
+        if event["type"] == "started":
+            runner.cancel()
+
+    finished, _, done = run(make_runner(output_dir, workers=1), files, on_event=cancel_on_start)
+
+    assert {e["status"] for e in finished.values()} == {"Cancelled"}
+    assert finished[files[1]]["attempts"] == 0
+    assert done == {"type": "done", "success": 0, "total": 2}
+    assert os.listdir(output_dir) == []
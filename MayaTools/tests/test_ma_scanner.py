@@ -0,0 +1,66 @@
+import os
+
+from conftest import FIXTURES_DIR
+from my_tool.core import ma_scanner
+
+
+def fixture(name):
+    return os.path.join(FIXTURES_DIR, name)
+
+
+def test_current_unit():
+    summary = ma_scanner.scan_scene(fixture("scene.ma"))
+    assert summary.units == {"linear": "centimeter", "angle": "degree", "time": "ntsc"}
+    assert summary.time_unit == "ntsc"
+
+
+def test_create_node_parents():
+    summary = ma_scanner.scan_scene(fixture("scene.ma"))
+    paths = {n.path: n.node_type for n in summary.nodes}
+    # -p 可以是短名 (取最近一次创建的同名节点) 也可以是长路径
+    assert paths["|rig|geo"] == "transform"
+    assert paths["|rig|geo|bodyShape"] == "mesh"
+    assert paths["|rig|ctrl|geo"] == "transform"
+    assert paths["|rig|ctrl|root"] == "joint"
+    # 非 DAG 节点的路径就是名字
+    assert paths["sceneConfigurationScriptNode"] == "script"
+    assert sorted(summary.duplicate_transform_names()) == ["|rig|ctrl|geo", "|rig|geo"]
+
+
+def test_requires_plugins():
+    summary = ma_scanner.scan_scene(fixture("scene.ma"))
+    assert summary.maya_version == "2024"
+    assert summary.requires == [
+        {"plugin": "mtoa", "version": "5.3.0", "node_types": ["aiOptions", "aiAOV"]},
+        {"plugin": "stereoCamera", "version": "10.0", "node_types": []},
+    ]
+
+
+def test_playback_only_from_scene_configuration_node():
+    summary = ma_scanner.scan_scene(fixture("scene.ma"))
+    # bodyShape 和 :time1 下面的 ".b" 都不算
+    assert summary.playback == {"min": 1.0, "max": 120.0, "ast": 1.0, "aet": 200.0}
+
+
+def test_semicolons_inside_strings():
+    statements = list(ma_scanner.iter_statements(fixture("strings.ma")))
+    assert [command for command, _ in statements] == [
+        "requires", "fileInfo", "createNode", "createNode", "setAttr", "setAttr", "createNode"]
+
+    summary = ma_scanner.scan_scene(fixture("strings.ma"))
+    assert summary.file_info["comment"] == 'a; b; "c;"'
+    assert [n.name for n in summary.nodes] == ["first", "uiConfigurationScriptNode", "second"]
+
+
+def test_truncated_final_statement():
+    # 最后一条语句写到一半 (还在字符串里) 就断了：丢掉它，前面的照常解析
+    summary = ma_scanner.scan_scene(fixture("truncated.ma"))
+    assert [n.name for n in summary.nodes] == ["complete"]
+    assert summary.time_unit == "film"
+
+
+def test_preflight_scan_rejects_duplicates():
+    ok, messages = ma_scanner.preflight_scan(fixture("scene.ma"), "Model")
+    assert not ok
+    assert any("FPS Setting Check" in m and "will be handled in Maya" in m for m in messages)
+    assert any("Duplicate Names Check" in m and m.endswith("-> rejected") for m in messages)